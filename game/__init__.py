@@ -1,9 +1,14 @@
-from .state import GameState, Player
+from .state import GameState, Player, TurnDelta
 from .word_validator import WordValidator
 from .constants import (
     LETTER_DISTRIBUTION,
     TRIPLE_WORD_SCORE,
     DOUBLE_WORD_SCORE,
     TRIPLE_LETTER_SCORE,
-    DOUBLE_LETTER_SCORE
+    DOUBLE_LETTER_SCORE,
+    BOARD_SIZE,
+    LETTER_MULTIPLIER,
+    WORD_MULTIPLIER,
+    LETTER_POINTS,
+    CODE_POINTS
 ) 
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""Compiled acceptor for the permissive (compounding) dictionary.
+
+Humans are validated against the permissive ``et_EE_scrabble``
+dictionary, whose compound flag lets flagged words concatenate. spylls
+answers each lookup by trying every suffix split and every compound
+segmentation in pure Python. :class:`CompoundAcceptor` gives the same
+answers from one automaton, compiled by tools/build_acceptor.py:
+
+- a DAWG (game/dawg.py) over the playable alphabet plus two marker
+  letters. A plain form ``w`` is a word. ``w + TAIL`` marks a form of a
+  compound-flagged root: a word that may also end a compound. ``s + HEAD``
+  marks a compound-flagged stem, which may begin or continue a compound
+  (the dictionary's affixes only attach to the last part);
+- the compound settings of the .aff (``COMPOUNDMIN``,
+  ``COMPOUNDWORDMAX``, ``CHECKCOMPOUNDDUP``) and the dictionary's
+  space-separated entries, which forbid the compound of their parts.
+
+A compound is a chain of heads, each at least ``COMPOUNDMIN`` letters,
+ended by a tail, as spylls segments it. One walk from each start
+position finds every head and tail there.
+
+The acceptor covers lowercase words over the playable alphabet of at
+most :data:`MAX_LENGTH` letters (everything a board can hold); callers
+fall back to spylls outside that.
+"""
+
+import json
+import os
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .dawg import ALPHABET, CompactDawg
+
+# Marker letters after the word in the automaton (outside the alphabet)
+HEAD = "<"
+TAIL = ">"
+ACCEPTOR_ALPHABET = ALPHABET + HEAD + TAIL
+# Longest word on a 15x15 board
+MAX_LENGTH = 15
+
+_LETTERS = frozenset(ALPHABET)
+
+
+class CompoundAcceptor:
+    """Membership in the permissive dictionary, compounds included."""
+
+    def __init__(self, dawg: CompactDawg, compound_min: int = 3,
+                 compound_word_max: Optional[int] = None, check_compound_dup: bool = False,
+                 spaced: FrozenSet[str] = frozenset()):
+        self.dawg = dawg
+        self.compound_min = compound_min
+        self.compound_word_max = compound_word_max
+        self.check_compound_dup = check_compound_dup
+        # Dictionary entries with a space: "foo bar" forbids the compound "foobar"
+        self.spaced = spaced
+
+    @staticmethod
+    def covers(word: str) -> bool:
+        """Whether :meth:`accepts` answers for *word* (lowercase, playable, short)."""
+        return 0 < len(word) <= MAX_LENGTH and set(word) <= _LETTERS
+
+    def accepts(self, word: str) -> bool:
+        """Whether the dictionary accepts *word*; see :meth:`covers` for the domain."""
+        dawg = self.dawg
+        node = 0
+        for ch in word:
+            node = dawg.child(node, ch)
+            if node is None:
+                break
+        else:
+            if dawg.is_final(node):
+                return True
+            tail = dawg.child(node, TAIL)
+            if tail is not None and dawg.is_final(tail):
+                return True
+        if len(word) < 2 * self.compound_min:
+            return False
+        return self._is_compound(word)
+
+    # -- compounds ----------------------------------------------------------
+
+    def _parts(self, word: str) -> Tuple[List[List[int]], List[bool]]:
+        """Per start position: ends of the heads there, and whether a tail starts there."""
+        dawg = self.dawg
+        n = len(word)
+        low = self.compound_min
+        heads: List[List[int]] = [[] for _ in range(n)]
+        tails = [False] * n
+        for i in range(low, n):  # tails start after a head
+            node = 0
+            for j in range(i, n):
+                node = dawg.child(node, word[j])
+                if node is None:
+                    break
+            else:
+                tail = dawg.child(node, TAIL)
+                tails[i] = n - i >= low and tail is not None and dawg.is_final(tail)
+        for i in range(n - 2 * low + 1):  # a head leaves room for a tail
+            node = 0
+            for j in range(i, n - low):
+                node = dawg.child(node, word[j])
+                if node is None:
+                    break
+                if j + 1 - i >= low:
+                    head = dawg.child(node, HEAD)
+                    if head is not None and dawg.is_final(head):
+                        heads[i].append(j + 1)
+        return heads, tails
+
+    def _bad_pair(self, left: str, right: str, last: bool) -> bool:
+        if self.spaced and f"{left} {right}" in self.spaced:
+            return True
+        return self.check_compound_dup and last and left == right
+
+    def _is_compound(self, word: str) -> bool:
+        heads, tails = self._parts(word)
+        if not any(tails):
+            return False
+        n = len(word)
+        word_max = self.compound_word_max
+        failed: Set[Tuple[int, int, int]] = set()
+
+        def search(start: int, prev: int, depth: int) -> bool:
+            # word[prev:start] is the previous part; depth parts so far
+            if (start, prev, depth) in failed:
+                return False
+            left = word[prev:start]
+            if depth and tails[start] and not self._bad_pair(left, word[start:], True):
+                return True
+            if not word_max or depth < word_max:
+                for end in heads[start]:
+                    if depth and self._bad_pair(left, word[start:end], False):
+                        continue
+                    if search(end, start, depth + 1):
+                        return True
+            failed.add((start, prev, depth))
+            return False
+
+        return n >= 2 * self.compound_min and search(0, 0, 0)
+
+    # -- serialization ------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """Write the automaton to *path* and the settings next to it (``.json``)."""
+        self.dawg.save(path)
+        with open(_settings_path(path), "w", encoding="utf-8") as f:
+            json.dump(self._settings(), f, ensure_ascii=False, indent=1, sort_keys=True)
+
+    def _settings(self) -> Dict:
+        return {
+            "compound_min": self.compound_min,
+            "compound_word_max": self.compound_word_max,
+            "check_compound_dup": self.check_compound_dup,
+            "spaced": sorted(self.spaced),
+        }
+
+    @classmethod
+    def load(cls, path: str) -> "CompoundAcceptor":
+        """Map a saved acceptor; raises ValueError (or OSError) if it is unusable."""
+        dawg = CompactDawg.load(path)
+        if dawg.alphabet != ACCEPTOR_ALPHABET:
+            raise ValueError(f"{path}: not a compound acceptor")
+        with open(_settings_path(path), encoding="utf-8") as f:
+            settings = json.load(f)
+        return cls(
+            dawg,
+            compound_min=settings["compound_min"],
+            compound_word_max=settings["compound_word_max"],
+            check_compound_dup=settings["check_compound_dup"],
+            spaced=frozenset(settings["spaced"]),
+        )
+
+
+def _settings_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
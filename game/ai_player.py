@@ -3,9 +3,15 @@
 Move generation (issue #40): when the wordlist exposes a DAWG
 (``wordlist.dawg``), moves are generated Appel & Jacobson style — the
 dictionary traversal IS the search, finding every legal move in
-milliseconds, including bingos and blank plays. Without a DAWG (mock
-wordlists in tests, or a failed DAWG build) the legacy brute-force
-generate-and-test search runs with a time budget.
+milliseconds, including bingos and blank plays. When a GADDAG has
+been built as well (``wordlist.gaddag``), Gordon's bidirectional
+generator grows each move outwards from its anchor instead — the same
+moves with less wasted search. Both walk the compact layout on integer
+letter codes: cross-checks, the rack and each node's children are
+bitmasks, so a square's candidate letters are a single AND — with a
+blank in hand, every child that passes the cross-check. Without a DAWG
+(mock wordlists in tests, or a failed DAWG build) the legacy
+brute-force generate-and-test search runs with a time budget.
 
 Two modes, which with the DAWG are purely selection policy:
   - easy:   deliberately mild — picks a mid-range move, never the best.
@@ -18,29 +24,45 @@ The module is pure game-logic — no UI or server dependencies — so it
 works with both the Pygame desktop client and the FastAPI web server.
 """
 
+import functools
+import heapq
 import itertools
 import random
 import time
+import weakref
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from .constants import (
-    DOUBLE_LETTER_SCORE,
+    BOARD_SIZE,
+    CODE_POINTS,
     DOUBLE_WORD_SCORE,
-    LETTER_DISTRIBUTION,
+    LETTER_MULTIPLIER,
+    LETTER_POINTS,
     TRIPLE_LETTER_SCORE,
     TRIPLE_WORD_SCORE,
+    WORD_MULTIPLIER,
 )
-from .dawg import Dawg
+from .board import CompactBoard
+from .cross_checks import ANY_LETTER, CrossCheckCache, CrossCheckView
+from .dawg import ALPHABET, LETTER_CODES, CompactDawg, Dawg
+from .gaddag import GADDAG_ALPHABET
 
 # Wall-clock budgets per move (seconds)
 FAST_TIME_BUDGET = 1.5
 STRONG_TIME_BUDGET = 12.0
 
+# Strong mode applies its heuristics (worth a few tens of points at
+# most) to this many of the highest-scoring moves only
+STRONG_TOP_K = 50
+
 # Blank substitutions are tried in this order (common letters first)
 # so the time budget is spent on the most promising designations.
 BLANK_LETTERS = "aeistulkomnrdgvhjpbõäöüfšzž"
 
+# The game's cross-check cache, or a view already taken from it
+CrossChecks = Union[CrossCheckCache, CrossCheckView]
+
 
 @dataclass
 class Move:
@@ -81,16 +103,23 @@ def _get_anchors(board: List[List[Optional[str]]], first_move: bool) -> Set[Tupl
     return anchors
 
 
-def _read_word(board, row, col, dr, dc):
+# Tiles placed this turn, by square: read as if on the board, which is
+# never copied to try a placement
+Overlay = Dict[Tuple[int, int], str]
+_NO_OVERLAY: Overlay = {}
+
+
+def _read_word(board, row, col, dr, dc, overlay: Overlay = _NO_OVERLAY):
     """Read the contiguous word through (row, col) in direction (dr, dc).
 
+    Squares empty on *board* are read from *overlay*.
     Returns (word_str, [(r,c), ...]) or None if single letter.
     """
     size = len(board)
     # Find start of the word
     sr, sc = row, col
     while sr - dr >= 0 and sc - dc >= 0 and sr - dr < size and sc - dc < size:
-        if board[sr - dr][sc - dc] is None:
+        if board[sr - dr][sc - dc] is None and (sr - dr, sc - dc) not in overlay:
             break
         sr -= dr
         sc -= dc
@@ -98,8 +127,13 @@ def _read_word(board, row, col, dr, dc):
     word = ""
     positions = []
     cr, cc = sr, sc
-    while 0 <= cr < size and 0 <= cc < size and board[cr][cc] is not None:
-        word += board[cr][cc]
+    while 0 <= cr < size and 0 <= cc < size:
+        ch = board[cr][cc]
+        if ch is None:
+            ch = overlay.get((cr, cc))
+            if ch is None:
+                break
+        word += ch
         positions.append((cr, cc))
         cr += dr
         cc += dc
@@ -109,7 +143,7 @@ def _read_word(board, row, col, dr, dc):
     return None
 
 
-def _cross_word(board, row, col, direction):
+def _cross_word(board, row, col, direction, overlay: Overlay = _NO_OVERLAY):
     """Get the cross-word formed at (row, col) perpendicular to *direction*.
 
     direction: (dr, dc) of the main word.
@@ -121,7 +155,51 @@ def _cross_word(board, row, col, direction):
     else:  # vertical main → check horizontal cross
         cdr, cdc = 0, 1
 
-    return _read_word(board, row, col, cdr, cdc)
+    return _read_word(board, row, col, cdr, cdc, overlay)
+
+
+def _placement_words(board, overlay: Overlay) -> List[Tuple[str, List[Tuple[int, int]]]]:
+    """Every word of two or more letters the tiles in *overlay* form on *board*."""
+    words = []
+    seen: Set[Tuple[int, int, int, int]] = set()
+    for r, c in overlay:
+        for dr, dc in ((0, 1), (1, 0)):
+            info = _read_word(board, r, c, dr, dc, overlay)
+            if info is None:
+                continue
+            start = info[1][0]
+            key = (start[0], start[1], dr, dc)
+            if key not in seen:
+                seen.add(key)
+                words.append(info)
+    return words
+
+
+def _score_placement(board, overlay: Overlay, blanks) -> int:
+    """Score of playing the tiles in *overlay* on *board*, bingo included.
+
+    *blanks* holds the squares where a blank tile is played (0 points).
+    """
+    total = 0
+    for word, positions in _placement_words(board, overlay):
+        word_score = 0
+        word_mult = 1
+        for letter, pos in zip(word, positions):
+            if pos in blanks:
+                base = 0  # blank tiles always score 0
+            else:
+                base = LETTER_POINTS.get(letter.lower(), 0)
+            if pos in overlay:
+                square = pos[0] * BOARD_SIZE + pos[1]
+                base *= LETTER_MULTIPLIER[square]
+                word_mult *= WORD_MULTIPLIER[square]
+            word_score += base
+        total += word_score * word_mult
+
+    # Bingo bonus
+    if len(overlay) == 7:
+        total += 50
+    return total
 
 
 # ---------------------------------------------------------------------------
@@ -188,17 +266,17 @@ def _generate_line_moves(
                         return moves
                     tiles_placed = []
                     blank_positions: Set[Tuple[int, int]] = set()
-                    temp_board = [row[:] for row in board]
+                    overlay: Overlay = {}
                     pr, pc = start_r, start_c
                     tile_idx = 0
 
                     # Walk along the line, placing tiles in empty cells
                     tiles_used = 0
                     while tiles_used < len(perm) and 0 <= pr < size and 0 <= pc < size:
-                        if temp_board[pr][pc] is None:
+                        if board[pr][pc] is None:
                             rack_idx = perm[tile_idx]
                             letter = rack[rack_idx]
-                            temp_board[pr][pc] = letter
+                            overlay[(pr, pc)] = letter
                             tiles_placed.append((pr, pc, letter))
                             if rack_idx in blank_indices:
                                 blank_positions.add((pr, pc))
@@ -212,31 +290,27 @@ def _generate_line_moves(
                         continue
 
                     # Must include the anchor
-                    placed_positions = {(r, c) for r, c, _ in tiles_placed}
-                    if (anchor_row, anchor_col) not in placed_positions:
+                    if (anchor_row, anchor_col) not in overlay:
                         # Check if anchor is covered by an existing tile in the line
                         if board[anchor_row][anchor_col] is not None:
                             pass  # anchor is an existing tile we're extending from
                         else:
                             continue
 
-                    # First move must cover center
-                    if first_move:
-                        center = size // 2
-                        main_word_info = _read_word(temp_board, tiles_placed[0][0], tiles_placed[0][1], dr, dc)
-                        if main_word_info:
-                            word_positions = main_word_info[1]
-                            if (center, center) not in [(r, c) for r, c in word_positions]:
-                                continue
-
                     # Check the main word formed
                     main_word_info = _read_word(
-                        temp_board, tiles_placed[0][0], tiles_placed[0][1], dr, dc
+                        board, tiles_placed[0][0], tiles_placed[0][1], dr, dc, overlay
                     )
                     if main_word_info is None:
                         continue
 
                     main_word, main_positions = main_word_info
+
+                    # First move must cover center
+                    if first_move:
+                        center = size // 2
+                        if (center, center) not in main_positions:
+                            continue
                     words_formed = []
 
                     # Validate main word
@@ -249,7 +323,7 @@ def _generate_line_moves(
                     # Validate all cross-words
                     cross_valid = True
                     for tr, tc, _ in tiles_placed:
-                        cw = _cross_word(temp_board, tr, tc, (dr, dc))
+                        cw = _cross_word(board, tr, tc, (dr, dc), overlay)
                         if cw is not None:
                             cw_str = cw[0]
                             if cw_str not in validation_cache:
@@ -276,151 +350,255 @@ def _generate_line_moves(
 # DAWG-based move generation (Appel & Jacobson 1988) — issue #40
 # ---------------------------------------------------------------------------
 
-def _dawg_cross_context(board, r: int, c: int) -> Tuple[str, str]:
-    """Contiguous letters above and below (r, c) in *board*'s columns."""
-    size = len(board)
-    up = []
-    i = r - 1
-    while i >= 0 and board[i][c] is not None:
-        up.append(board[i][c])
-        i -= 1
-    up.reverse()
-    down = []
-    i = r + 1
-    while i < size and board[i][c] is not None:
-        down.append(board[i][c])
-        i += 1
-    return "".join(up), "".join(down)
-
-
-def _dawg_cross_checks_for_row(board, r: int, dawg: Dawg) -> List[Optional[Set[str]]]:
-    """For each empty square in row r: letters allowed by the vertical word.
-
-    None means unconstrained (no vertical neighbors). An empty set means
-    the square cannot legally take any tile.
+# Compact copies of dict-layout word graphs, made on first use
+_compact_graphs: "weakref.WeakKeyDictionary[Dawg, CompactDawg]" = weakref.WeakKeyDictionary()
+# Code of a board letter outside the alphabet: no node has a child over it
+_NO_CODE = 31
+
+
+def _code_graph(graph, alphabet: str = ALPHABET) -> CompactDawg:
+    """*graph* in the compact layout, whose node masks the generators AND.
+
+    A dict-layout DAWG (tests, benchmarks) is converted once and the
+    result kept for as long as the DAWG lives.
     """
-    size = len(board)
-    checks: List[Optional[Set[str]]] = [None] * size
-    for c in range(size):
-        if board[r][c] is not None:
-            continue
-        up, down = _dawg_cross_context(board, r, c)
-        if not up and not down:
-            continue
-        allowed = set()
-        node = 0
-        ok = True
-        for ch in up:
-            node = dawg.edges[node].get(ch)
-            if node is None:
-                ok = False
-                break
-        if ok:
-            for ch, nxt in dawg.edges[node].items():
-                cur = nxt
-                good = True
-                for dch in down:
-                    cur = dawg.edges[cur].get(dch)
-                    if cur is None:
-                        good = False
-                        break
-                if good and dawg.finals[cur]:
-                    allowed.add(ch)
-        checks[c] = allowed
-    return checks
+    if isinstance(graph, CompactDawg):
+        if not graph.alphabet.startswith(ALPHABET):
+            raise ValueError("word graph letter codes do not follow ALPHABET")
+        return graph
+    compact = _compact_graphs.get(graph)
+    if compact is None:
+        compact = _compact_graphs[graph] = CompactDawg.from_dawg(graph, alphabet)
+    return compact
+
+
+def _rack_codes(rack: List[str]) -> Tuple[List[int], int, int]:
+    """(counts by letter code, mask of letters held, blanks held) of *rack*.
+
+    Tiles outside the alphabet are dropped: no word can use them.
+    """
+    counts = [0] * len(ALPHABET)
+    mask = 0
+    blanks = 0
+    for t in rack:
+        if t == "_":
+            blanks += 1
+        else:
+            code = LETTER_CODES.get(t)
+            if code is not None:
+                counts[code] += 1
+                mask |= 1 << code
+    return counts, mask, blanks
+
+
+def _line_codes(line: List[Optional[str]]) -> List[Optional[int]]:
+    return [None if ch is None else LETTER_CODES.get(ch, _NO_CODE) for ch in line]
+
+
+@functools.lru_cache(maxsize=None)
+def _premium_line(i: int, vertical: bool, size: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """(letter multipliers, word multipliers) along row *i*, or column *i* if *vertical*."""
+    squares = range(i, size * size, size) if vertical else range(i * size, (i + 1) * size)
+    return (tuple(LETTER_MULTIPLIER[sq] for sq in squares),
+            tuple(WORD_MULTIPLIER[sq] for sq in squares))
+
+
+def _line_points(line, contexts) -> Tuple[List[int], List[Optional[int]]]:
+    """Points of the letters on *line*, and per square the points of its crossing word.
+
+    The crossing word's sum covers only the letters already on the
+    board (None where no crossing word forms); the tile played there
+    adds its own, multiplied, value.
+    """
+    fixed = [0 if ch is None else LETTER_POINTS.get(ch, 0) for ch in line]
+    cross_base = [
+        None if ctx is None
+        else sum(LETTER_POINTS.get(ch, 0) for ch in ctx[0] + ctx[1])
+        for ctx in contexts
+    ]
+    return fixed, cross_base
+
 
+class _MoveCollector:
+    """Generated moves, deduplicated; with *top_k*, only the best-scoring ones.
 
-def _dawg_scan_rows(board, rack_counts, dawg, anchors, moves, transposed: bool):
-    """Generate all moves whose main word is horizontal in *board*."""
+    The generators score moves as they find them and ask :meth:`wants`
+    before building a :class:`Move`, so once the heap is full a weaker
+    candidate costs one comparison instead of an object.
+    """
+
+    def __init__(self, top_k: Optional[int] = None):
+        self.top_k = top_k
+        self.moves: Dict[tuple, Move] = {}
+        self._heap: List[Tuple[int, int, tuple]] = []  # (score, seq, key), weakest first
+        self._seq = itertools.count()
+
+    def wants(self, key: tuple, score: int) -> bool:
+        if key in self.moves:
+            return False
+        heap = self._heap
+        return self.top_k is None or len(heap) < self.top_k or score > heap[0][0]
+
+    def add(self, key: tuple, move: Move) -> None:
+        self.moves[key] = move
+        if self.top_k is None:
+            return
+        entry = (move.raw_score, next(self._seq), key)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        else:
+            del self.moves[heapq.heapreplace(self._heap, entry)[2]]
+
+
+def _dawg_scan_rows(board, rack, dawg, anchors, view, moves, transposed: bool, deadline=None):
+    """Generate all moves whose main word is horizontal in *board*.
+
+    Works on letter codes: *rack* is ``_rack_codes`` output and *dawg*
+    the compact layout, so a square's candidate letters are one AND of
+    the node's child mask, the cross-check mask and — without a blank —
+    the rack mask. Cross-checks come from *view*; for the transposed
+    board they are the original board's down-checks.
+
+    Moves are scored while they grow: the main word's letter sum and
+    word multiplier and the finished cross-words' scores ride along the
+    recursion, and *moves* (a :class:`_MoveCollector`) sees the final
+    score before any :class:`Move` is built. Past *deadline*
+    (time.monotonic) no further rows are started, leaving *moves* with
+    the best found so far.
+    """
     size = len(board)
-    edges = dawg.edges
-    finals = dawg.finals
+    counts, rack_mask, n_blanks = rack
+    offsets, targets, node_masks, finals = dawg.offsets, dawg.targets, dawg.masks, dawg.finals
+    points = CODE_POINTS
+    wants, add = moves.wants, moves.add
 
     for r in range(size):
         row = board[r]
         row_anchor_cols = [c for c in range(size) if (r, c) in anchors]
         if not row_anchor_cols:
             continue
-        checks = _dawg_cross_checks_for_row(board, r, dawg)
+        if deadline is not None and time.monotonic() > deadline:
+            return
+        codes = _line_codes(row)
+        checks, contexts = view.line(r, transposed)
+        letter_mult, word_mult = _premium_line(r, transposed, size)
+        fixed, cross_base = _line_points(row, contexts)
         anchor_set = set(row_anchor_cols)
 
-        def record(word, placed):
+        def record(word, placed, score):
             """placed: list of (col, ch, is_blank)."""
             if len(word) < 2 or not placed:
                 return
+            if len(placed) == 1:
+                # A lone tile forming words both ways is found by both scans
+                col, ch, is_blank = placed[0]
+                key = ((col, r) if transposed else (r, col)) + (ch, is_blank)
+            else:
+                key = (transposed, r, tuple(placed))
+                if len(placed) == 7:
+                    score += 50  # bingo
+            if not wants(key, score):
+                return
             tiles = []
             blanks = set()
+            words_formed = [word]
             for col, ch, is_blank in placed:
                 pos = (col, r) if transposed else (r, col)
                 tiles.append((pos[0], pos[1], ch))
                 if is_blank:
                     blanks.add(pos)
-            words_formed = [word]
-            for col, ch, _ in placed:
-                up, down = _dawg_cross_context(board, r, col)
-                if up or down:
+                if contexts[col] is not None:
+                    up, down = contexts[col]
                     words_formed.append(up + ch + down)
-            key = frozenset((t[0], t[1], t[2], (t[0], t[1]) in blanks) for t in tiles)
-            if key not in moves:
-                moves[key] = Move(tiles=tiles, words_formed=words_formed, blanks=blanks)
-
-        def extend_right(word, node, col, anchor_col, placed):
-            if col >= size or row[col] is None:
-                if finals[node] and placed and col > anchor_col:
-                    record(word, placed)
+            add(key, Move(tiles=tiles, words_formed=words_formed, blanks=blanks, raw_score=score))
+
+        def extend_right(word, node, col, anchor_col, placed, held, blanks, main, wmul, cross):
+            """*held*: mask of rack letters left; *blanks*: blanks left.
+
+            *main* is the main word's letter sum so far, *wmul* its word
+            multiplier and *cross* the summed cross-word scores.
+            """
+            mask = node_masks[node]
+            if col >= size or codes[col] is None:
+                if finals[node >> 3] >> (node & 7) & 1 and placed and col > anchor_col:
+                    record(word, placed, main * wmul + cross)
                 if col >= size:
                     return
-                allowed = checks[col]
-                for ch, child in edges[node].items():
-                    if allowed is not None and ch not in allowed:
-                        continue
-                    n_real = rack_counts.get(ch, 0)
-                    n_blank = rack_counts.get("_", 0)
-                    if n_real:
-                        rack_counts[ch] = n_real - 1
+                cand = mask & checks[col] if blanks else mask & checks[col] & held
+                base = offsets[node]
+                lm, wm, cb = letter_mult[col], word_mult[col], cross_base[col]
+                while cand:
+                    bit = cand & -cand
+                    cand ^= bit
+                    code = bit.bit_length() - 1
+                    child = targets[base + (mask & (bit - 1)).bit_count()]
+                    ch = ALPHABET[code]
+                    if held & bit:
+                        n = counts[code]
+                        counts[code] = n - 1
+                        value = points[code] * lm
                         placed.append((col, ch, False))
-                        extend_right(word + ch, child, col + 1, anchor_col, placed)
+                        extend_right(word + ch, child, col + 1, anchor_col, placed,
+                                     held if n > 1 else held ^ bit, blanks,
+                                     main + value, wmul * wm,
+                                     cross if cb is None else cross + (cb + value) * wm)
                         placed.pop()
-                        rack_counts[ch] = n_real
-                    if n_blank:
-                        rack_counts["_"] = n_blank - 1
+                        counts[code] = n
+                    if blanks:
                         placed.append((col, ch, True))
-                        extend_right(word + ch, child, col + 1, anchor_col, placed)
+                        extend_right(word + ch, child, col + 1, anchor_col, placed,
+                                     held, blanks - 1, main, wmul * wm,
+                                     cross if cb is None else cross + cb * wm)
                         placed.pop()
-                        rack_counts["_"] = n_blank
             else:
-                ch = row[col]
-                child = edges[node].get(ch)
-                if child is not None:
-                    extend_right(word + ch, child, col + 1, anchor_col, placed)
+                bit = 1 << codes[col]
+                if mask & bit:
+                    child = targets[offsets[node] + (mask & (bit - 1)).bit_count()]
+                    extend_right(word + row[col], child, col + 1, anchor_col, placed,
+                                 held, blanks, main + fixed[col], wmul, cross)
 
         _lp_marks: List[bool] = []  # blank flags for the current left part
 
-        def _left_placed(word, anchor_col):
-            start = anchor_col - len(word)
-            return [(start + i, word[i], _lp_marks[i]) for i in range(len(word))]
-
-        def left_part(word, node, limit, anchor_col):
+        def left_part(word, node, limit, anchor_col, held, blanks):
             # Tiles of the left part occupy cols anchor_col-len(word)..anchor_col-1.
-            extend_right(word, node, anchor_col, anchor_col,
-                         _left_placed(word, anchor_col) if word else [])
+            mask = node_masks[node]
+            if mask & checks[anchor_col] & (ANY_LETTER if blanks else held):
+                # Some tile can go on the anchor: worth extending. The left
+                # part's squares have no neighbours, so no cross-words.
+                start = anchor_col - len(word)
+                placed = []
+                main, wmul = 0, 1
+                for i, ch in enumerate(word):
+                    col = start + i
+                    placed.append((col, ch, _lp_marks[i]))
+                    if not _lp_marks[i]:
+                        main += LETTER_POINTS[ch] * letter_mult[col]
+                    wmul *= word_mult[col]
+                extend_right(word, node, anchor_col, anchor_col, placed, held, blanks,
+                             main, wmul, 0)
             if limit > 0:
-                for ch, child in edges[node].items():
-                    n_real = rack_counts.get(ch, 0)
-                    n_blank = rack_counts.get("_", 0)
-                    if n_real:
-                        rack_counts[ch] = n_real - 1
+                cand = mask if blanks else mask & held
+                base = offsets[node]
+                while cand:
+                    bit = cand & -cand
+                    cand ^= bit
+                    code = bit.bit_length() - 1
+                    child = targets[base + (mask & (bit - 1)).bit_count()]
+                    ch = ALPHABET[code]
+                    if held & bit:
+                        n = counts[code]
+                        counts[code] = n - 1
                         _lp_marks.append(False)
-                        left_part(word + ch, child, limit - 1, anchor_col)
+                        left_part(word + ch, child, limit - 1, anchor_col,
+                                  held if n > 1 else held ^ bit, blanks)
                         _lp_marks.pop()
-                        rack_counts[ch] = n_real
-                    if n_blank:
-                        rack_counts["_"] = n_blank - 1
+                        counts[code] = n
+                    if blanks:
                         _lp_marks.append(True)
-                        left_part(word + ch, child, limit - 1, anchor_col)
+                        left_part(word + ch, child, limit - 1, anchor_col, held, blanks - 1)
                         _lp_marks.pop()
-                        rack_counts["_"] = n_blank
 
+        n_tiles = sum(counts) + n_blanks
         for ac in row_anchor_cols:
             if ac > 0 and row[ac - 1] is not None:
                 # Fixed left prefix: existing tiles ending at ac-1.
@@ -428,15 +606,14 @@ def _dawg_scan_rows(board, rack_counts, dawg, anchors, moves, transposed: bool):
                 while start > 0 and row[start - 1] is not None:
                     start -= 1
                 prefix = "".join(row[start:ac])
-                node = 0
-                ok = True
+                node = dawg.root
                 for ch in prefix:
-                    node = edges[node].get(ch)
+                    node = dawg.child(node, ch)
                     if node is None:
-                        ok = False
                         break
-                if ok:
-                    extend_right(prefix, node, ac, ac, [])
+                else:
+                    extend_right(prefix, node, ac, ac, [], rack_mask, n_blanks,
+                                 sum(fixed[start:ac]), 1, 0)
             else:
                 # Count empty non-anchor squares immediately left of anchor.
                 limit = 0
@@ -444,34 +621,236 @@ def _dawg_scan_rows(board, rack_counts, dawg, anchors, moves, transposed: bool):
                 while c >= 0 and row[c] is None and c not in anchor_set:
                     limit += 1
                     c -= 1
-                limit = min(limit, sum(rack_counts.values()) - 1)
-                left_part("", 0, max(limit, 0), ac)
+                limit = min(limit, n_tiles - 1)
+                left_part("", dawg.root, max(limit, 0), ac, rack_mask, n_blanks)
+
+
+def _cross_check_view(cross_checks: Optional[CrossChecks], board, graph, first_move: bool,
+                      gaddag: bool = False) -> CrossCheckView:
+    if isinstance(cross_checks, CrossCheckView):
+        return cross_checks  # computed for this board already (an AI job's)
+    if cross_checks is None:
+        cross_checks = CrossCheckCache(len(board))
+        cross_checks.sync(board)
+    return cross_checks.view(graph, first_move, gaddag=gaddag)
 
 
 def _find_all_moves_dawg(
     board: List[List[Optional[str]]],
     rack: List[str],
-    dawg: Dawg,
+    dawg: Union[Dawg, CompactDawg],
     first_move: bool = False,
+    cross_checks: Optional[CrossChecks] = None,
+    top_k: Optional[int] = None,
+    deadline: Optional[float] = None,
 ) -> List[Move]:
-    """All legal moves for *rack* on *board* — exhaustive, no budget needed."""
-    moves: Dict[frozenset, Move] = {}
+    """All legal moves for *rack* on *board* — exhaustive, no budget needed.
 
-    rack_counts: Dict[str, int] = {}
-    for t in rack:
-        rack_counts[t] = rack_counts.get(t, 0) + 1
+    *cross_checks* is the game's incremental cache, or a view of it;
+    without one, anchors and cross-checks are computed from scratch. Moves come back scored;
+    with *top_k*, only the *top_k* highest-scoring ones. A *deadline*
+    (time.monotonic) cuts the search short with the moves found so far.
+    """
+    moves = _MoveCollector(top_k)
+    rack_codes = _rack_codes(rack)
 
-    anchors = _get_anchors(board, first_move)
+    view = _cross_check_view(cross_checks, board, dawg, first_move)
+    anchors = view.anchors
+    dawg = _code_graph(dawg)
 
     # Horizontal main words
-    _dawg_scan_rows(board, rack_counts, dawg, anchors, moves, transposed=False)
+    _dawg_scan_rows(board, rack_codes, dawg, anchors, view, moves, False, deadline)
 
     # Vertical main words: transpose board and anchor coordinates
     tboard = [list(col) for col in zip(*board)]
     tanchors = {(c, r) for (r, c) in anchors}
-    _dawg_scan_rows(tboard, rack_counts, dawg, tanchors, moves, transposed=True)
+    _dawg_scan_rows(tboard, rack_codes, dawg, tanchors, view, moves, True, deadline)
+
+    return list(moves.moves.values())
+
+
+# ---------------------------------------------------------------------------
+# GADDAG-based move generation (Gordon 1994)
+# ---------------------------------------------------------------------------
+
+def _gaddag_scan_lines(board, rack, gaddag, view, moves, vertical: bool, deadline=None):
+    """Generate all moves whose main word runs along rows (or columns).
+
+    From each anchor the search reads leftwards (upwards) through rack
+    tiles and existing letters, then crosses the separator and extends
+    rightwards — every partial word it builds is an infix of a real word
+    through the anchor. Leftward growth stops at the previous anchor so
+    each move is generated once, from its first anchor. Anchors and
+    cross-checks come from *view*; like the DAWG generator it works on
+    letter codes and masks (*rack* is ``_rack_codes`` output), scores
+    moves as it grows them and stops starting lines past *deadline*.
+    """
+    size = len(board)
+    counts, rack_mask, n_blanks = rack
+    offsets, targets, node_masks, finals = (
+        gaddag.offsets, gaddag.targets, gaddag.masks, gaddag.finals
+    )
+    sep_bit = 1 << len(ALPHABET)  # SEPARATOR follows the letters in GADDAG_ALPHABET
+    n_rack = sum(counts) + n_blanks
+    anchors = view.anchors
+    points = CODE_POINTS
+    wants, add = moves.wants, moves.add
+
+    for i in range(size):
+        if vertical:
+            line = [board[r][i] for r in range(size)]
+            line_anchors = [r for r in range(size) if (r, i) in anchors]
+        else:
+            line = board[i]
+            line_anchors = [c for c in range(size) if (i, c) in anchors]
+        if not line_anchors:
+            continue
+        if deadline is not None and time.monotonic() > deadline:
+            return
+        codes = _line_codes(line)
+        checks, contexts = view.line(i, vertical)
+        letter_mult, word_mult = _premium_line(i, vertical, size)
+        fixed, cross_base = _line_points(line, contexts)
+        anchor_set = set(line_anchors)
+        # Whether a word may end before / after each square
+        open_left = [pos == 0 or line[pos - 1] is None for pos in range(size)]
+        open_right = [pos == size - 1 or line[pos + 1] is None for pos in range(size)]
+
+        def record(word, placed, score):
+            """placed: list of (pos, ch, is_blank) along the line."""
+            if len(word) < 2:
+                return
+            placed = sorted(placed)
+            if len(placed) == 1:
+                # A lone tile forming words both ways is found by both scans
+                pos, ch, is_blank = placed[0]
+                key = ((pos, i) if vertical else (i, pos)) + (ch, is_blank)
+            else:
+                # Each multi-tile move is generated once, from its first anchor
+                key = (vertical, i, tuple(placed))
+                if len(placed) == 7:
+                    score += 50  # bingo
+            if not wants(key, score):
+                return
+            tiles = []
+            blanks = set()
+            words_formed = [word]
+            for pos, ch, is_blank in placed:
+                sq = (pos, i) if vertical else (i, pos)
+                tiles.append((sq[0], sq[1], ch))
+                if is_blank:
+                    blanks.add(sq)
+                if contexts[pos] is not None:
+                    before, after = contexts[pos]
+                    words_formed.append(before + ch + after)
+            add(key, Move(tiles=tiles, words_formed=words_formed, blanks=blanks, raw_score=score))
+
+        def gen(pos, anchor, word, node, placed, held, blanks, n_tiles, main, wmul, cross):
+            """Fill square *pos* with each fitting letter and grow on from it.
+
+            *held* masks the rack letters left, *blanks* counts the blanks
+            and *n_tiles* all rack tiles left; with none, only squares
+            already holding a letter are worth visiting. *main*, *wmul*
+            and *cross* carry the score so far, as in the DAWG generator.
+            """
+            mask = node_masks[node]
+            code = codes[pos]
+            if code is not None:
+                bit = 1 << code
+                if not mask & bit:
+                    return
+                # bit None: a board letter, no rack tile used
+                tiles = ((line[pos], targets[offsets[node] + (mask & (bit - 1)).bit_count()],
+                          None),)
+                rest = n_tiles
+            else:
+                tiles = []
+                cand = mask & checks[pos] if blanks else mask & checks[pos] & held
+                base = offsets[node]
+                while cand:
+                    bit = cand & -cand
+                    cand ^= bit
+                    nxt = targets[base + (mask & (bit - 1)).bit_count()]
+                    ch = ALPHABET[bit.bit_length() - 1]
+                    if held & bit:
+                        tiles.append((ch, nxt, bit))
+                    if blanks:
+                        tiles.append((ch, nxt, 0))  # bit 0: played as a blank
+                rest = n_tiles - 1
+            for ch, nxt, bit in tiles:
+                left, n_blank = held, blanks
+                if bit is None:
+                    m, w, x = main + fixed[pos], wmul, cross
+                else:
+                    if bit:
+                        code = bit.bit_length() - 1
+                        n = counts[code]
+                        counts[code] = n - 1
+                        if n == 1:
+                            left ^= bit
+                        value = points[code] * letter_mult[pos]
+                    else:
+                        n_blank -= 1
+                        value = 0
+                    placed.append((pos, ch, not bit))
+                    wm, cb = word_mult[pos], cross_base[pos]
+                    m, w = main + value, wmul * wm
+                    x = cross if cb is None else cross + (cb + value) * wm
+                if pos <= anchor:
+                    # Still reading leftwards from the anchor
+                    new_word = ch + word
+                    if not open_left[pos]:
+                        # A letter on the board to the left: the word goes on
+                        gen(pos - 1, anchor, new_word, nxt, placed, left, n_blank, rest, m, w, x)
+                    else:
+                        if open_right[anchor] and finals[nxt >> 3] >> (nxt & 7) & 1:
+                            record(new_word, placed, m * w + x)
+                        if rest and pos > 0 and pos - 1 not in anchor_set:
+                            gen(pos - 1, anchor, new_word, nxt, placed, left, n_blank, rest,
+                                m, w, x)
+                        if anchor + 1 < size and (rest or not open_right[anchor]):
+                            nxt_mask = node_masks[nxt]
+                            if nxt_mask & sep_bit:
+                                sep = targets[offsets[nxt] + (nxt_mask & (sep_bit - 1)).bit_count()]
+                                gen(anchor + 1, anchor, new_word, sep, placed, left, n_blank,
+                                    rest, m, w, x)
+                else:
+                    new_word = word + ch
+                    if open_right[pos] and finals[nxt >> 3] >> (nxt & 7) & 1:
+                        record(new_word, placed, m * w + x)
+                    if pos + 1 < size and (rest or not open_right[pos]):
+                        gen(pos + 1, anchor, new_word, nxt, placed, left, n_blank, rest, m, w, x)
+                if bit is not None:
+                    placed.pop()
+                    if bit:
+                        counts[code] = n
 
-    return list(moves.values())
+        for anchor in line_anchors:
+            gen(anchor, anchor, "", gaddag.root, [], rack_mask, n_blanks, n_rack, 0, 1, 0)
+
+
+def _find_all_moves_gaddag(
+    board: List[List[Optional[str]]],
+    rack: List[str],
+    gaddag: Union[Dawg, CompactDawg],
+    first_move: bool = False,
+    cross_checks: Optional[CrossChecks] = None,
+    top_k: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> List[Move]:
+    """All legal moves for *rack* on *board*, generated from the GADDAG.
+
+    Scored; with *top_k*, only the *top_k* highest-scoring moves; with
+    *deadline*, those found before it.
+    """
+    moves = _MoveCollector(top_k)
+    rack_codes = _rack_codes(rack)
+
+    view = _cross_check_view(cross_checks, board, gaddag, first_move, gaddag=True)
+    gaddag = _code_graph(gaddag, GADDAG_ALPHABET)
+    _gaddag_scan_lines(board, rack_codes, gaddag, view, moves, False, deadline)
+    _gaddag_scan_lines(board, rack_codes, gaddag, view, moves, True, deadline)
+    return list(moves.moves.values())
 
 
 def _collect_moves(
@@ -502,13 +881,16 @@ def _collect_moves(
 
 
 def find_all_moves(
-    board: List[List[Optional[str]]],
+    board: Union[List[List[Optional[str]]], CompactBoard],
     rack: List[str],
     wordlist,
     first_move: bool = False,
     mode: str = "fast",
+    cross_checks: Optional[CrossChecks] = None,
+    top_k: Optional[int] = None,
+    deadline: Optional[float] = None,
 ) -> List[Move]:
-    """Find valid moves for the given rack on the current board.
+    """Find valid, scored moves for the given rack on the current board.
 
     When the wordlist exposes a DAWG, the search is exhaustive and
     effectively instant — *mode* is irrelevant. Otherwise the legacy
@@ -520,19 +902,46 @@ def find_all_moves(
             STRONG_TIME_BUDGET on longer placements (5–7 tiles,
             permutations capped) and blank-tile substitutions.
 
+    A GADDAG (``wordlist.gaddag``, optional) is preferred over the DAWG:
+    same moves, fewer dead-end left parts explored. Both read anchors and
+    cross-checks from *cross_checks* (``GameState.cross_checks``, which
+    must be synced with *board*, or a :class:`CrossCheckView` of it)
+    when given, recomputing only what changed since the last turn. They score
+    moves while generating them; with *top_k* they keep only the *top_k*
+    highest-scoring moves and never build the rest.
+
+    A *deadline* (time.monotonic) ends any search early, returning the
+    moves found by then.
+
+    *board* may be a :class:`CompactBoard`: the generators read it
+    decoded to lists (once per board change), the brute-force search
+    takes its anchors from the occupancy bitsets.
+
     This should be run via ``asyncio.run_in_executor`` on the server.
     """
+    compact = board if isinstance(board, CompactBoard) else None
+    if compact is not None:
+        board = compact.rows()
+
+    gaddag = getattr(wordlist, "gaddag", None)
+    if gaddag is not None:
+        return _find_all_moves_gaddag(board, rack, gaddag, first_move, cross_checks, top_k,
+                                      deadline)
     dawg = getattr(wordlist, "dawg", None)
     if dawg is not None:
-        return _find_all_moves_dawg(board, rack, dawg, first_move)
+        return _find_all_moves_dawg(board, rack, dawg, first_move, cross_checks, top_k,
+                                    deadline)
 
-    anchors = _get_anchors(board, first_move)
+    if compact is not None:
+        anchors = compact.anchors(first_move)
+    else:
+        anchors = _get_anchors(board, first_move)
     validation_cache: Dict[str, bool] = {}
     all_moves: List[Move] = []
     seen_placements: Set[frozenset] = set()
 
     budget = STRONG_TIME_BUDGET if mode == "strong" else FAST_TIME_BUDGET
-    deadline = time.monotonic() + budget
+    deadline = min(time.monotonic() + budget, deadline or float("inf"))
 
     plain_rack = [t for t in rack if t != "_"]
     blank_count = len(rack) - len(plain_rack)
@@ -545,7 +954,7 @@ def find_all_moves(
     )
 
     if mode != "strong":
-        return all_moves
+        return _top_scored(board, all_moves, top_k)
 
     # Pass 2: longer placements — bingo hunting. Longest first so the
     # budget is spent on the highest-value words; full permutations,
@@ -577,7 +986,7 @@ def find_all_moves(
                 blank_indices=blank_indices,
             )
 
-    return all_moves
+    return _top_scored(board, all_moves, top_k)
 
 
 # ---------------------------------------------------------------------------
@@ -589,53 +998,18 @@ def _calculate_move_score(
     move: Move,
 ) -> int:
     """Calculate the raw score for a move (premium squares included)."""
-    total = 0
-    placed_set = move.positions
+    overlay = {(r, c): letter for r, c, letter in move.tiles}
+    move.raw_score = _score_placement(board, overlay, move.blanks)
+    return move.raw_score
 
-    # Temporarily place tiles
-    temp_board = [row[:] for row in board]
-    for r, c, letter in move.tiles:
-        temp_board[r][c] = letter
 
-    # Score each unique word formed
-    seen_words: Set[Tuple[Tuple[int, int], ...]] = set()
-    for r, c, _ in move.tiles:
-        for dr, dc in [(0, 1), (1, 0)]:
-            winfo = _read_word(temp_board, r, c, dr, dc)
-            if winfo is None:
-                continue
-            _, positions = winfo
-            key = tuple(positions)
-            if key in seen_words:
-                continue
-            seen_words.add(key)
-
-            word_str = winfo[0]
-            word_score = 0
-            word_mult = 1
-            for letter, (wr, wc) in zip(word_str, positions):
-                if (wr, wc) in move.blanks:
-                    base = 0  # blank tiles always score 0
-                else:
-                    base = LETTER_DISTRIBUTION.get(letter.lower(), {}).get("points", 0)
-                if (wr, wc) in placed_set:
-                    if (wr, wc) in TRIPLE_LETTER_SCORE:
-                        base *= 3
-                    elif (wr, wc) in DOUBLE_LETTER_SCORE:
-                        base *= 2
-                    if (wr, wc) in TRIPLE_WORD_SCORE:
-                        word_mult *= 3
-                    elif (wr, wc) in DOUBLE_WORD_SCORE:
-                        word_mult *= 2
-                word_score += base
-            total += word_score * word_mult
-
-    # Bingo bonus
-    if len(move.tiles) == 7:
-        total += 50
-
-    move.raw_score = total
-    return total
+def _top_scored(board, moves: List[Move], top_k: Optional[int]) -> List[Move]:
+    """Score brute-force *moves*; with *top_k*, keep the best *top_k*."""
+    for move in moves:
+        _calculate_move_score(board, move)
+    if top_k is not None:
+        moves = heapq.nlargest(top_k, moves, key=lambda m: m.raw_score)
+    return moves
 
 
 def _rack_balance_bonus(remaining_rack: List[str]) -> float:
@@ -701,11 +1075,13 @@ def _positional_bonus(board: List[List[Optional[str]]], move: Move) -> float:
 # ---------------------------------------------------------------------------
 
 def select_move(
-    board: List[List[Optional[str]]],
+    board: Union[List[List[Optional[str]]], CompactBoard],
     rack: List[str],
-    wordlist,
+    wordlist=None,
     first_move: bool = False,
     difficulty: str = "fast",
+    cross_checks: Optional[CrossChecks] = None,
+    deadline: Optional[float] = None,
 ) -> Optional[Move]:
     """Find and select a move for the given mode.
 
@@ -713,25 +1089,36 @@ def select_move(
     the best) and "strong" (heuristic best). Legacy names are mapped:
     easy = easy; medium, hard and fast = strong.
 
+    *wordlist* defaults to the process-wide strict dictionary (and its
+    DAWG), so callers never load a private copy. *cross_checks* is the
+    game's incremental anchor and cross-check cache, if it keeps one.
+    Past *deadline* (time.monotonic) the search stops and the best of
+    the moves found so far is chosen.
+
     Returns None if no valid move exists (AI should pass or exchange).
     """
+    if wordlist is None:
+        from wordlist import shared_wordlist
+
+        wordlist = shared_wordlist().strict
     mode = {"medium": "strong", "hard": "strong", "fast": "strong"}.get(
         difficulty, difficulty
     )
     if mode not in ("easy", "strong"):
         mode = "strong"
 
-    # For the brute-force fallback, easy only needs the quick search
+    # For the brute-force fallback, easy only needs the quick search.
+    # Easy picks from the whole score distribution; strong only weighs
+    # its heuristics for the STRONG_TOP_K highest-scoring moves.
     gen_mode = "fast" if mode == "easy" else "strong"
-    moves = find_all_moves(board, rack, wordlist, first_move, mode=gen_mode)
+    moves = find_all_moves(board, rack, wordlist, first_move, mode=gen_mode,
+                           cross_checks=cross_checks,
+                           top_k=None if mode == "easy" else STRONG_TOP_K,
+                           deadline=deadline)
 
     if not moves:
         return None
 
-    # Score all moves
-    for move in moves:
-        _calculate_move_score(board, move)
-
     if mode == "easy":
         # A plausible but modest move: random pick from the 25th–60th
         # score percentile, so the AI neither dominates nor embarrasses.
@@ -0,0 +1,272 @@
+"""Compact board: letter codes in one bytearray, occupancy as bitsets.
+
+``GameState.board`` is a list of 15 lists of ``Optional[str]``. Copying
+it (challenge snapshots, every AI turn), transposing it (the AI's
+vertical scan) and rebuilding it for every player on every broadcast
+touch 225 Python objects each time. :class:`CompactBoard` stores the
+same board as:
+
+- ``cells``: a 225-byte ``bytearray`` of letter codes, row-major, 0 for
+  an empty square and ``LETTER_CODES[ch] + 1`` for a letter (see
+  game/dawg.py); letters outside the alphabet are kept in a side table;
+- ``row_bits`` / ``col_bits``: per row (column) a bitmask of its
+  occupied columns (rows), so anchors and "is this line empty" are a
+  few shifts and ORs.
+
+Copy is a ``bytearray`` copy, transpose one slice per row, and
+:meth:`CompactBoard.rows` decodes to lists once per board change, so a
+broadcast to every player and the AI's turn share one decoding. For
+existing callers the board indexes like the list of lists
+it replaces: ``board[r][c]`` reads and writes a square, ``board[r][:]``
+copies a row, ``len(board)`` and iteration work as before.
+
+``GameState(compact_board=True)`` opts in; the server does.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from .constants import BOARD_SIZE
+from .dawg import ALPHABET, LETTER_CODES
+
+Rows = List[List[Optional[str]]]
+
+EMPTY = 0
+# Code of a letter outside the alphabet; the letter is in the side table
+_OTHER = 255
+# Letter by stored code (index 0: empty square; _OTHER: see the side table)
+_LETTERS: Tuple[Optional[str], ...] = (
+    (None,) + tuple(ALPHABET) + (None,) * (255 - len(ALPHABET))
+)
+# Character by stored code, for str.translate
+_CHARS: Dict[int, str] = {code + 1: letter for code, letter in enumerate(ALPHABET)}
+
+
+def _encode(letter: Optional[str]) -> int:
+    if letter is None:
+        return EMPTY
+    code = LETTER_CODES.get(letter)
+    return _OTHER if code is None else code + 1
+
+
+class _RowView:
+    """One row of a :class:`CompactBoard`, indexable like a list."""
+
+    __slots__ = ("_board", "_row")
+
+    def __init__(self, board: "CompactBoard", row: int):
+        self._board = board
+        self._row = row
+
+    def __getitem__(self, col: Union[int, slice]):
+        if isinstance(col, slice):
+            return self._board.row(self._row)[col]
+        return self._board.get(self._row, col if col >= 0 else col + self._board.size)
+
+    def __setitem__(self, col: int, letter: Optional[str]) -> None:
+        self._board.set(self._row, col if col >= 0 else col + self._board.size, letter)
+
+    def __len__(self) -> int:
+        return self._board.size
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self._board.row(self._row))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _RowView):
+            other = other[:]
+        return self[:] == other
+
+    def __repr__(self) -> str:
+        return repr(self[:])
+
+
+class CompactBoard:
+    """A square board of letters as a ``bytearray`` plus occupancy bitsets."""
+
+    __slots__ = ("size", "cells", "row_bits", "col_bits", "_other", "_views", "_decoded")
+
+    def __init__(self, size: int = BOARD_SIZE):
+        self.size = size
+        self.cells = bytearray(size * size)
+        self.row_bits = [0] * size
+        self.col_bits = [0] * size
+        # Square index -> letter, for cells holding _OTHER
+        self._other: Dict[int, str] = {}
+        self._views: Optional[Tuple[_RowView, ...]] = None
+        # Rows decoded since the last change: broadcasts decode once
+        self._decoded: Optional[Tuple[Tuple[Optional[str], ...], ...]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Optional[str]]]) -> "CompactBoard":
+        """The board holding the letters of *rows* (a list of lists)."""
+        board = cls(len(rows))
+        for r, row in enumerate(rows):
+            for c, letter in enumerate(row):
+                if letter is not None:
+                    board.set(r, c, letter)
+        return board
+
+    # -- squares ------------------------------------------------------------
+
+    def get(self, row: int, col: int) -> Optional[str]:
+        if not 0 <= col < self.size:
+            raise IndexError("board column out of range")
+        i = row * self.size + col
+        code = self.cells[i]
+        return self._other[i] if code == _OTHER else _LETTERS[code]
+
+    def set(self, row: int, col: int, letter: Optional[str]) -> None:
+        if not 0 <= col < self.size:
+            raise IndexError("board column out of range")
+        i = row * self.size + col
+        code = _encode(letter)
+        self.cells[i] = code
+        self._decoded = None
+        if code == _OTHER:
+            self._other[i] = letter
+        else:
+            self._other.pop(i, None)
+        if code == EMPTY:
+            self.row_bits[row] &= ~(1 << col)
+            self.col_bits[col] &= ~(1 << row)
+        else:
+            self.row_bits[row] |= 1 << col
+            self.col_bits[col] |= 1 << row
+
+    def code(self, row: int, col: int) -> int:
+        """Stored code of a square: 0 empty, else ``LETTER_CODES[ch] + 1``."""
+        return self.cells[row * self.size + col]
+
+    def is_empty(self) -> bool:
+        return not any(self.row_bits)
+
+    # -- whole-board operations ---------------------------------------------
+
+    def row(self, r: int) -> List[Optional[str]]:
+        """Row *r* as a new list of letters (None for empty)."""
+        size = self.size
+        start = r * size
+        line = [_LETTERS[code] for code in self.cells[start:start + size]]
+        if self._other:
+            for i, letter in self._other.items():
+                if start <= i < start + size:
+                    line[i - start] = letter
+        return line
+
+    def rows(self) -> Rows:
+        """The board as a new list of lists — the list layout's copy.
+
+        The decoding is kept until the board changes, so serializing it
+        for every player, or for the AI, decodes it once.
+        """
+        decoded = self._decoded
+        if decoded is None:
+            decoded = self._decoded = tuple(tuple(self.row(r)) for r in range(self.size))
+        return [list(row) for row in decoded]
+
+    def _clone(self, cells: bytearray, row_bits: List[int], col_bits: List[int],
+               other: Dict[int, str]) -> "CompactBoard":
+        board = CompactBoard.__new__(CompactBoard)
+        board.size = self.size
+        board.cells = cells
+        board.row_bits = row_bits
+        board.col_bits = col_bits
+        board._other = other
+        board._views = None
+        board._decoded = None
+        return board
+
+    def copy(self) -> "CompactBoard":
+        board = self._clone(self.cells[:], self.row_bits[:], self.col_bits[:], dict(self._other))
+        board._decoded = self._decoded  # immutable: shared until either changes
+        return board
+
+    def transposed(self) -> "CompactBoard":
+        """The board mirrored on its main diagonal (columns become rows)."""
+        size = self.size
+        cells = bytearray(b"".join([self.cells[c::size] for c in range(size)]))
+        other = {(i % size) * size + i // size: letter for i, letter in self._other.items()}
+        return self._clone(cells, self.col_bits[:], self.row_bits[:], other)
+
+    def anchors(self, first_move: bool = False) -> Set[Tuple[int, int]]:
+        """Empty squares next to a tile (the centre square on the first move)."""
+        size = self.size
+        if first_move:
+            return {(size // 2, size // 2)}
+        full = (1 << size) - 1
+        bits = self.row_bits
+        anchors = set()
+        for r in range(size):
+            occupied = bits[r]
+            near = (occupied << 1 | occupied >> 1) & full
+            if r > 0:
+                near |= bits[r - 1]
+            if r + 1 < size:
+                near |= bits[r + 1]
+            near &= ~occupied
+            while near:
+                low = near & -near
+                anchors.add((r, low.bit_length() - 1))
+                near ^= low
+        return anchors
+
+    def to_string(self, empty: str = ".") -> str:
+        """The squares row-major as one string, *empty* for empty squares."""
+        squares = self.cells.decode("latin-1").translate({**_CHARS, EMPTY: empty})
+        if not self._other:
+            return squares
+        chars = list(squares)
+        for i, letter in self._other.items():
+            chars[i] = letter
+        return "".join(chars)
+
+    # -- list-of-lists compatibility ----------------------------------------
+
+    def __getitem__(self, row: int) -> _RowView:
+        views = self._views
+        if views is None:
+            views = self._views = tuple(_RowView(self, r) for r in range(self.size))
+        return views[row]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[_RowView]:
+        return (self[r] for r in range(self.size))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactBoard):
+            return self.cells == other.cells and self._other == other._other
+        return self.rows() == [list(row) for row in other]
+
+    def __getstate__(self):
+        return self.size, bytes(self.cells), self._other
+
+    def __setstate__(self, state) -> None:
+        size, cells, other = state
+        self.size = size
+        self.cells = bytearray(cells)
+        self._other = dict(other)
+        self._views = None
+        self._decoded = None
+        self.row_bits = [0] * size
+        self.col_bits = [0] * size
+        for i, code in enumerate(self.cells):
+            if code != EMPTY:
+                r, c = divmod(i, size)
+                self.row_bits[r] |= 1 << c
+                self.col_bits[c] |= 1 << r
+
+
+def board_rows(board: Union[Rows, CompactBoard]) -> Rows:
+    """A list-of-lists copy of *board*, whichever layout it has."""
+    if isinstance(board, CompactBoard):
+        return board.rows()
+    return [row[:] for row in board]
+
+
+def copy_board(board: Union[Rows, CompactBoard]) -> Union[Rows, CompactBoard]:
+    """A copy of *board* in the same layout."""
+    if isinstance(board, CompactBoard):
+        return board.copy()
+    return [row[:] for row in board]
@@ -1,3 +1,5 @@
+from .dawg import ALPHABET
+
 # Estonian Scrabble letter distribution and points
 LETTER_DISTRIBUTION = {
     # High-frequency vowels
@@ -79,4 +81,24 @@ DOUBLE_LETTER_SCORE = {
     (11, 0), (11, 7), (11, 14),
     (12, 6), (12, 8),
     (14, 3), (14, 11),
-}
\ No newline at end of file
+}
+# Flat lookup tables for the scorers, which run for every candidate move
+# the AI considers: one index instead of up to four set probes per letter.
+BOARD_SIZE = 15
+
+
+def _square_multipliers(triple, double):
+    return tuple(
+        3 if (row, col) in triple else 2 if (row, col) in double else 1
+        for row in range(BOARD_SIZE)
+        for col in range(BOARD_SIZE)
+    )
+
+
+# Premium multipliers indexed by row * BOARD_SIZE + col (1 on plain squares)
+LETTER_MULTIPLIER = _square_multipliers(TRIPLE_LETTER_SCORE, DOUBLE_LETTER_SCORE)
+WORD_MULTIPLIER = _square_multipliers(TRIPLE_WORD_SCORE, DOUBLE_WORD_SCORE)
+
+# Points by letter, and by letter code (the DAWG alphabet's order)
+LETTER_POINTS = {letter: info['points'] for letter, info in LETTER_DISTRIBUTION.items()}
+CODE_POINTS = tuple(LETTER_POINTS[letter] for letter in ALPHABET)
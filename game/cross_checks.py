@@ -0,0 +1,239 @@
+"""Anchors and cross-checks for AI move generation, kept across turns.
+
+A cross-check is the set of letters an empty square can take without
+spelling a non-word perpendicular to the play, kept as a bitmask over
+letter codes (bit ``LETTER_CODES[ch]``, see game/dawg.py) so the move
+generator intersects it with a node's child mask in one AND. For plays along a row,
+the check at (r, c) depends only on column c's letters; for plays down
+a column, only on row r's. So the cache stores checks per
+*perpendicular line*, and a changed square (r, c) invalidates exactly
+column c's across-checks and row r's down-checks — a typical commit
+touches a handful of the 30 lines instead of all of them.
+
+:class:`CrossCheckCache` mirrors the committed board. ``GameState``
+syncs it on every board change that sticks (commit, pass, challenge
+undo); the AI asks for a :class:`CrossCheckView` — an immutable
+snapshot, safe to read in an executor thread while the event loop
+syncs the next change — and only dirty lines are recomputed then.
+
+The checks are the same whichever word graph computes them: a forward
+DAWG walks ``before``, branches on the letter and walks ``after``; a
+GADDAG (game/gaddag.py) walks the reversal.
+"""
+
+import threading
+from typing import FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .dawg import ALPHABET, LETTER_CODES
+
+Board = List[List[Optional[str]]]
+Square = Tuple[int, int]
+# Check of a square no crossing word constrains: every letter
+ANY_LETTER = (1 << len(ALPHABET)) - 1
+# Per position along a line: mask of allowed letter codes (ANY_LETTER
+# when unconstrained, 0 on occupied squares) and the crossing word's
+# (before, after) letters (None = no crossing word)
+LineChecks = Tuple[Tuple[int, ...], Tuple[Optional[Tuple[str, str]], ...]]
+
+
+def line_context(line: Sequence[Optional[str]], pos: int) -> Tuple[str, str]:
+    """Contiguous letters before and after *pos* in *line*."""
+    i = pos - 1
+    while i >= 0 and line[i] is not None:
+        i -= 1
+    j = pos + 1
+    while j < len(line) and line[j] is not None:
+        j += 1
+    return "".join(line[i + 1:pos]), "".join(line[pos + 1:j])
+
+
+def _walk(graph, node: Optional[int], letters: Iterable[str]) -> Optional[int]:
+    for ch in letters:
+        node = graph.child(node, ch)
+        if node is None:
+            return None
+    return node
+
+
+def allowed_mask(graph, before: str, after: str, gaddag: bool = False) -> int:
+    """Mask of the letters ``ch`` for which ``before + ch + after`` is a word in *graph*."""
+    first, second = (reversed(after), before[::-1]) if gaddag else (before, after)
+    node = _walk(graph, 0, first)
+    if node is None:
+        return 0
+    mask = 0
+    for ch, nxt in graph.children(node):
+        code = LETTER_CODES.get(ch)
+        if code is None:  # the GADDAG separator
+            continue
+        end = _walk(graph, nxt, second)
+        if end is not None and graph.is_final(end):
+            mask |= 1 << code
+    return mask
+
+
+def mask_letters(mask: int) -> FrozenSet[str]:
+    """The letters of a check *mask*."""
+    return frozenset(ch for i, ch in enumerate(ALPHABET) if mask >> i & 1)
+
+
+def line_cross_checks(line: Sequence[Optional[str]], graph, gaddag: bool = False) -> LineChecks:
+    """Checks and crossing-word contexts for every empty square of *line*.
+
+    *line* is the perpendicular line: a column for across plays, a row
+    for down plays.
+    """
+    checks: List[int] = [0] * len(line)
+    contexts: List[Optional[Tuple[str, str]]] = [None] * len(line)
+    for pos, ch in enumerate(line):
+        if ch is not None:
+            continue
+        before, after = line_context(line, pos)
+        if before or after:
+            contexts[pos] = (before, after)
+            checks[pos] = allowed_mask(graph, before, after, gaddag)
+        else:
+            checks[pos] = ANY_LETTER
+    return tuple(checks), tuple(contexts)
+
+
+class CrossCheckView(NamedTuple):
+    """Immutable anchors and cross-checks of one board position."""
+
+    anchors: FrozenSet[Square]
+    across: Tuple[LineChecks, ...]  # per column: checks for plays along rows
+    down: Tuple[LineChecks, ...]  # per row: checks for plays down columns
+
+    def line(
+        self, i: int, vertical: bool
+    ) -> Tuple[List[int], List[Optional[Tuple[str, str]]]]:
+        """(checks, contexts) along row *i*, or column *i* if *vertical*."""
+        per_line = self.down if vertical else self.across
+        return [c[0][i] for c in per_line], [c[1][i] for c in per_line]
+
+    def masks(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Check masks per column and per row, flattened (see :meth:`from_masks`)."""
+        return (tuple(m for checks, _ in self.across for m in checks),
+                tuple(m for checks, _ in self.down for m in checks))
+
+    @classmethod
+    def from_masks(cls, board: Board, anchors: Iterable[Square], across: Sequence[int],
+                   down: Sequence[int]) -> "CrossCheckView":
+        """Rebuild a view from its anchors and :meth:`masks` (an AI job's payload).
+
+        The crossing words' contexts follow from *board*.
+        """
+        size = len(board)
+        columns = [[board[r][c] for r in range(size)] for c in range(size)]
+        return cls(
+            frozenset(anchors),
+            tuple((tuple(across[c * size:(c + 1) * size]), _line_contexts(columns[c]))
+                  for c in range(size)),
+            tuple((tuple(down[r * size:(r + 1) * size]), _line_contexts(board[r]))
+                  for r in range(size)),
+        )
+
+
+def _line_contexts(line: Sequence[Optional[str]]) -> Tuple[Optional[Tuple[str, str]], ...]:
+    contexts: List[Optional[Tuple[str, str]]] = [None] * len(line)
+    for pos, ch in enumerate(line):
+        if ch is None:
+            before, after = line_context(line, pos)
+            if before or after:
+                contexts[pos] = (before, after)
+    return tuple(contexts)
+
+
+class CrossCheckCache:
+    """Anchors and cross-checks of the committed board, updated incrementally.
+
+    Thread-safe: :meth:`sync` runs on the game's thread, :meth:`view`
+    typically in the AI's executor thread.
+    """
+
+    def __init__(self, size: int = 15):
+        self.size = size
+        self._lock = threading.Lock()
+        self._board: Board = [[None] * size for _ in range(size)]
+        self._anchors: Set[Square] = set()
+        empty: LineChecks = ((ANY_LETTER,) * size, (None,) * size)
+        self._across: List[Optional[LineChecks]] = [empty] * size
+        self._down: List[Optional[LineChecks]] = [empty] * size
+        self._graph = None
+        self._gaddag = False
+        self.lines_computed = 0  # recomputed lines, for tests and tuning
+
+    def sync(self, board: Board, squares: Optional[Iterable[Square]] = None) -> None:
+        """Bring the cache up to date with *board*.
+
+        *squares* limits the comparison to squares that may have changed
+        (e.g. the tiles just committed); by default the whole board is
+        diffed, which a new cache needs once. Only invalidates — lines
+        are recomputed on :meth:`view`.
+        """
+        with self._lock:
+            self._sync(board, squares)
+
+    def invalidate(self) -> None:
+        """Drop every cached line (e.g. after a dictionary reload)."""
+        with self._lock:
+            self._across = [None] * self.size
+            self._down = [None] * self.size
+
+    def view(self, graph, first_move: bool = False, gaddag: bool = False) -> CrossCheckView:
+        """Anchors and cross-checks of the synced board, checks computed with *graph*.
+
+        Recomputes only the lines changed since the last view. A
+        different *graph* (a reloaded dictionary) invalidates them all.
+        """
+        with self._lock:
+            if graph is not self._graph or gaddag != self._gaddag:
+                self._graph, self._gaddag = graph, gaddag
+                self._across = [None] * self.size
+                self._down = [None] * self.size
+            mirror = self._board
+            for c in range(self.size):
+                if self._across[c] is None:
+                    column = [mirror[r][c] for r in range(self.size)]
+                    self._across[c] = line_cross_checks(column, graph, gaddag)
+                    self.lines_computed += 1
+            for r in range(self.size):
+                if self._down[r] is None:
+                    self._down[r] = line_cross_checks(mirror[r], graph, gaddag)
+                    self.lines_computed += 1
+            if first_move:
+                center = self.size // 2
+                anchors = frozenset({(center, center)})
+            else:
+                anchors = frozenset(self._anchors)
+            return CrossCheckView(anchors, tuple(self._across), tuple(self._down))
+
+    def _sync(self, board: Board, squares: Optional[Iterable[Square]]) -> None:
+        size = self.size
+        mirror = self._board
+        if squares is None:
+            squares = ((r, c) for r in range(size) for c in range(size))
+        changed = [(r, c) for r, c in squares if board[r][c] != mirror[r][c]]
+        for r, c in changed:
+            mirror[r][c] = board[r][c]
+        for r, c in changed:
+            self._across[c] = None
+            self._down[r] = None
+            for sr, sc in ((r, c), (r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= sr < size and 0 <= sc < size:
+                    if self._is_anchor(sr, sc):
+                        self._anchors.add((sr, sc))
+                    else:
+                        self._anchors.discard((sr, sc))
+
+    def _is_anchor(self, r: int, c: int) -> bool:
+        mirror = self._board
+        if mirror[r][c] is not None:
+            return False
+        size = self.size
+        return (
+            (r > 0 and mirror[r - 1][c] is not None)
+            or (r + 1 < size and mirror[r + 1][c] is not None)
+            or (c > 0 and mirror[r][c - 1] is not None)
+            or (c + 1 < size and mirror[r][c + 1] is not None)
+        )
@@ -14,10 +14,38 @@ compact marshal serialization.
 Used by the AI move generator (game/ai_player.py, issue #40): walking
 the DAWG *is* the dictionary check, so only letter sequences that can
 still become words are ever explored.
+
+Two layouts share one traversal API (``child``, ``children``,
+``is_final``, ``is_word``), so the move generator runs on either:
+
+- :class:`Dawg` — one ``dict`` per node; fast to build and mutate.
+- :class:`CompactDawg` — CSR edge table in flat ``array``/``bytes``
+  buffers over the 27-letter alphabet, a finals bitset and a per-node
+  child-letter bitmask. No per-node Python objects, and a child lookup
+  is a bit test plus a popcount instead of a hash lookup.
+
+``python -m tools.bench_dawg`` compares the two.
+
+The compact layout has its own versioned binary file format (see
+:meth:`CompactDawg.save`) that is ``mmap``ed read-only and traversed
+directly from the page cache: loading is opening a file, and every
+uvicorn worker or AI process shares one physical copy.
 """
 
 import marshal
-from typing import Dict, Iterable, List, Tuple
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# The playable Estonian alphabet; a letter's index is its code in the
+# compact layout (bit position in child masks, edge label byte).
+ALPHABET = "abdefghijklmnoprstuvzõäöüšž"
+LETTER_CODES: Dict[str, int] = {ch: i for i, ch in enumerate(ALPHABET)}
 
 
 class _BuildNode:
@@ -32,6 +60,117 @@ class _BuildNode:
         return (self.final, tuple((ch, id(n)) for ch, n in self.edges.items()))
 
 
+class _DawgEditor:
+    """Word-by-word edits of a flattened minimal DAWG (see :meth:`Dawg.update`)."""
+
+    def __init__(self, finals: List[bool], edges: List[Dict[str, int]]):
+        self.finals = list(finals)
+        self.edges = [dict(e) for e in edges]
+        self.indegree = [0] * len(finals)
+        for node_edges in self.edges:
+            for child in node_edges.values():
+                self.indegree[child] += 1
+        # Signature -> node, for every node but the root (minimal: signatures are unique)
+        self.register: Dict[tuple, int] = {
+            self._signature(node): node for node in range(1, len(finals))
+        }
+
+    def _signature(self, node: int) -> tuple:
+        return self.finals[node], tuple(sorted(self.edges[node].items()))
+
+    def _unregister(self, node: int) -> None:
+        signature = self._signature(node)
+        if self.register.get(signature) == node:
+            del self.register[signature]
+
+    def _new_node(self, final: bool, edges: Dict[str, int]) -> int:
+        self.finals.append(final)
+        self.edges.append(edges)
+        self.indegree.append(0)
+        for child in edges.values():
+            self.indegree[child] += 1
+        return len(self.finals) - 1
+
+    def _link(self, parent: int, ch: str, child: Optional[int]) -> None:
+        """Point *parent*'s edge *ch* at *child* (None: drop it), keeping in-degrees."""
+        old = self.edges[parent].get(ch)
+        if old is not None:
+            self.indegree[old] -= 1
+        if child is None:
+            del self.edges[parent][ch]
+        else:
+            self.edges[parent][ch] = child
+            self.indegree[child] += 1
+
+    def _drop(self, node: int) -> None:
+        """Release a node no edge points at any more."""
+        for child in self.edges[node].values():
+            self.indegree[child] -= 1
+        self.edges[node] = {}
+
+    def set_word(self, word: str, final: bool) -> bool:
+        """Add (*final*) or remove *word*; False if that changes nothing."""
+        edges = self.edges
+        path = [0]
+        for ch in word:
+            child = edges[path[-1]].get(ch)
+            if child is None:
+                break
+            path.append(child)
+        found = len(path) == len(word) + 1
+        if found and self.finals[path[-1]] == final or not found and not final:
+            return False
+
+        # Make the path private: clone it from the first shared node on.
+        # The private nodes before it are about to change: unregister them.
+        shared = next((i for i in range(1, len(path)) if self.indegree[path[i]] > 1), len(path))
+        for node in path[1:shared]:
+            self._unregister(node)
+        for j in range(shared, len(path)):
+            clone = self._new_node(self.finals[path[j]], dict(edges[path[j]]))
+            self._link(path[j - 1], word[j - 1], clone)
+            path[j] = clone
+
+        # Change it: extend the path, or flip the last node
+        for ch in word[len(path) - 1:]:
+            child = self._new_node(False, {})
+            self._link(path[-1], ch, child)
+            path.append(child)
+        self.finals[path[-1]] = final
+
+        # Re-minimize bottom-up: merge into an equal node, drop dead ends
+        for j in range(len(path) - 1, 0, -1):
+            node, parent, ch = path[j], path[j - 1], word[j - 1]
+            if not self.finals[node] and not edges[node]:
+                self._link(parent, ch, None)
+                continue
+            signature = self._signature(node)
+            existing = self.register.get(signature)
+            if existing is None:
+                self.register[signature] = node
+            elif existing != node:
+                self._link(parent, ch, existing)
+                self._drop(node)
+        return True
+
+    def compacted(self) -> Tuple[List[bool], List[Dict[str, int]]]:
+        """The reachable nodes renumbered as :meth:`Dawg.build` numbers them."""
+        # build() adds edges in sorted-input order, i.e. by letter
+        index = {0: 0}
+        order = [0]
+        for node in order:  # grows while iterating
+            for _, child in sorted(self.edges[node].items()):
+                if child not in index:
+                    index[child] = len(order)
+                    order.append(child)
+        finals = [self.finals[node] for node in order]
+        edges = [
+            {ch: index[child] for ch, child in sorted(self.edges[node].items())}
+            for node in order
+        ]
+        return finals, edges
+
+
 class Dawg:
     """Flattened DAWG: finals[i] is terminality, edges[i] maps char -> node index."""
 
@@ -40,6 +179,20 @@ class Dawg:
         self.edges = edges
         self.root = 0
 
+    # -- traversal ----------------------------------------------------------
+
+    def child(self, node: int, ch: str) -> Optional[int]:
+        """Node reached from *node* over letter *ch*, or None."""
+        return self.edges[node].get(ch)
+
+    def children(self, node: int) -> Iterable[Tuple[str, int]]:
+        """(letter, child) pairs of *node*'s outgoing edges."""
+        return self.edges[node].items()
+
+    def is_final(self, node: int) -> bool:
+        """Whether the path to *node* spells a word."""
+        return self.finals[node]
+
     # -- membership ---------------------------------------------------------
 
     def is_word(self, word: str) -> bool:
@@ -107,6 +260,28 @@ class Dawg:
         edges = [{ch: index[id(c)] for ch, c in n.edges.items()} for n in order]
         return cls(finals, edges)
 
+    # -- incremental updates ------------------------------------------------
+
+    def update(self, add: Iterable[str] = (), remove: Iterable[str] = ()) -> Tuple[int, int]:
+        """Add and remove words in place, keeping the DAWG minimal.
+
+        Each word's path is made private by cloning it from the first
+        node shared with other paths (Carrasco & Forcada, 2002), changed,
+        then re-minimized bottom-up against a register of the existing
+        nodes, so only nodes on that path are touched. The nodes are
+        renumbered afterwards exactly as :meth:`build` numbers them: the
+        result equals a build from the updated word list. Building the
+        register and renumbering take time linear in the DAWG's size,
+        however few the words. Returns the number of words actually
+        added and removed.
+        """
+        editor = _DawgEditor(self.finals, self.edges)
+        removed = sum(editor.set_word(word, False) for word in remove)
+        added = sum(editor.set_word(word, True) for word in add)
+        if added or removed:
+            self.finals, self.edges = editor.compacted()
+        return added, removed
+
     # -- serialization ------------------------------------------------------
 
     def save(self, path: str) -> None:
@@ -121,3 +296,209 @@ class Dawg:
 
     def __len__(self):
         return len(self.finals)
+
+
+# Binary file format of CompactDawg (little-endian, sections 4-byte aligned):
+#   header    magic | version | nodes | edges | alphabet bytes | payload CRC32 | reserved
+#   payload   alphabet (UTF-8) | offsets u32[nodes + 1] | masks u32[nodes]
+#             | targets u32[edges] | labels u8[edges] | finals bitset u8[(nodes + 7) // 8]
+# Bump FORMAT_VERSION on any layout change; old files then fail to load
+# and tools/build_dawg.py rebuilds them.
+FORMAT_MAGIC = b"EEDAWG\0\0"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8s6I")
+
+
+def _pad4(n: int) -> int:
+    return (n + 3) & ~3
+
+
+class CompactDawg:
+    """Array-backed DAWG: CSR edge table, finals bitset, child-letter masks.
+
+    For node ``n``, its edges are ``offsets[n]:offsets[n + 1]`` in
+    ``labels`` (letter codes, ascending) and ``targets`` (child node
+    indices). ``masks[n]`` has bit ``code`` set for every outgoing
+    letter, so an edge's slot is the popcount of the mask bits below
+    its code. ``finals`` is a little-endian bitset over node indices.
+
+    The buffers may be ``array``/``bytes`` objects (built in memory) or
+    memoryviews into a read-only mmap (:meth:`load`).
+    """
+
+    def __init__(self, offsets: Sequence[int], labels: Sequence[int], targets: Sequence[int],
+                 finals: Sequence[int], masks: Sequence[int], alphabet: str = ALPHABET):
+        self.offsets = offsets
+        self.labels = labels
+        self.targets = targets
+        self.finals = finals
+        self.masks = masks
+        self.alphabet = alphabet
+        self._codes = (
+            LETTER_CODES if alphabet == ALPHABET
+            else {ch: i for i, ch in enumerate(alphabet)}
+        )
+        self.root = 0
+
+    @classmethod
+    def from_dawg(cls, dawg: Dawg, alphabet: str = ALPHABET) -> "CompactDawg":
+        """Convert a dict-layout DAWG; raises ValueError on non-alphabet edges."""
+        codes = LETTER_CODES if alphabet == ALPHABET else {ch: i for i, ch in enumerate(alphabet)}
+        offsets = array("I", [0])
+        labels = bytearray()
+        targets = array("I")
+        masks = array("I")
+        finals = bytearray((len(dawg) + 7) // 8)
+        for node, edges in enumerate(dawg.edges):
+            mask = 0
+            for ch, child in sorted(edges.items(), key=lambda e: codes.get(e[0], -1)):
+                code = codes.get(ch)
+                if code is None:
+                    raise ValueError(f"letter {ch!r} is outside the DAWG alphabet")
+                labels.append(code)
+                targets.append(child)
+                mask |= 1 << code
+            offsets.append(len(targets))
+            masks.append(mask)
+            if dawg.finals[node]:
+                finals[node >> 3] |= 1 << (node & 7)
+        return cls(offsets, bytes(labels), targets, bytes(finals), masks, alphabet)
+
+    def to_dawg(self) -> Dawg:
+        """The dict layout of this DAWG, e.g. to :meth:`Dawg.update` it."""
+        alphabet = self.alphabet
+        offsets, labels, targets = self.offsets, self.labels, self.targets
+        edges = [
+            {alphabet[labels[i]]: targets[i] for i in range(offsets[n], offsets[n + 1])}
+            for n in range(len(self))
+        ]
+        return Dawg([self.is_final(n) for n in range(len(self))], edges)
+
+    # -- traversal ----------------------------------------------------------
+
+    def child(self, node: int, ch: str) -> Optional[int]:
+        """Node reached from *node* over letter *ch*, or None."""
+        code = self._codes.get(ch)
+        if code is None:
+            return None
+        mask = self.masks[node]
+        bit = 1 << code
+        if not mask & bit:
+            return None
+        return self.targets[self.offsets[node] + (mask & (bit - 1)).bit_count()]
+
+    def children(self, node: int) -> Iterator[Tuple[str, int]]:
+        """(letter, child) pairs of *node*'s outgoing edges, in code order."""
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return zip(map(self.alphabet.__getitem__, self.labels[start:end]),
+                   self.targets[start:end])
+
+    def is_final(self, node: int) -> bool:
+        """Whether the path to *node* spells a word."""
+        return bool(self.finals[node >> 3] >> (node & 7) & 1)
+
+    # -- membership ---------------------------------------------------------
+
+    def is_word(self, word: str) -> bool:
+        node = 0
+        child = self.child
+        for ch in word:
+            node = child(node, ch)
+            if node is None:
+                return False
+        return self.is_final(node)
+
+    def __len__(self):
+        return len(self.masks)
+
+    def nbytes(self) -> int:
+        """Total size of the backing buffers."""
+        return 4 * (len(self.offsets) + len(self.targets) + len(self.masks)) + len(
+            self.labels
+        ) + len(self.finals)
+
+    # -- serialization ------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """Write the versioned binary format (see FORMAT_MAGIC above), atomically."""
+        nodes, edges = len(self.masks), len(self.targets)
+        alphabet = self.alphabet.encode("utf-8")
+
+        def u32(values) -> bytes:
+            arr = array("I", values)
+            if sys.byteorder != "little":
+                arr.byteswap()
+            return arr.tobytes()
+
+        def padded(data: bytes) -> bytes:
+            return data + b"\0" * (_pad4(len(data)) - len(data))
+
+        payload = b"".join([
+            padded(alphabet),
+            u32(self.offsets),
+            u32(self.masks),
+            u32(self.targets),
+            padded(bytes(self.labels)),
+            bytes(self.finals),
+        ])
+        header = _HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, nodes, edges, len(alphabet),
+                              zlib.crc32(payload), 0)
+        # Replaced, never rewritten: a running server may have the old file
+        # mmapped (load), and truncating it under the mapping would crash it
+        fd, tmp = tempfile.mkstemp(prefix=".dawg-", dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> "CompactDawg":
+        """Map a saved DAWG read-only; the buffers are views into the mapping.
+
+        Raises ValueError for a foreign file, an unsupported format
+        version, or (with *verify*) a payload checksum mismatch.
+        """
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(buf) < _HEADER.size:
+            raise ValueError(f"{path}: truncated DAWG file")
+        magic, version, nodes, edges, alpha_len, crc, _ = _HEADER.unpack_from(buf)
+        if magic != FORMAT_MAGIC:
+            raise ValueError(f"{path}: not a DAWG file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: DAWG format v{version}, expected v{FORMAT_VERSION}")
+        expected = (_HEADER.size + _pad4(alpha_len) + 4 * (2 * nodes + 1 + edges)
+                    + _pad4(edges) + (nodes + 7) // 8)
+        if len(buf) != expected:
+            raise ValueError(f"{path}: DAWG file is {len(buf)} bytes, expected {expected}")
+        view = memoryview(buf)
+        if verify and zlib.crc32(view[_HEADER.size:]) != crc:
+            raise ValueError(f"{path}: DAWG checksum mismatch")
+
+        pos = _HEADER.size
+
+        def take(nbytes: int, aligned: bool = True) -> memoryview:
+            nonlocal pos
+            section = view[pos:pos + nbytes]
+            pos += _pad4(nbytes) if aligned else nbytes
+            return section
+
+        def u32(count: int) -> Sequence[int]:
+            section = take(4 * count)
+            if sys.byteorder != "little":
+                arr = array("I", section)
+                arr.byteswap()
+                return arr  # big-endian hosts pay for one copy
+            return section.cast("I")
+
+        alphabet = bytes(take(alpha_len)).decode("utf-8")
+        offsets = u32(nodes + 1)
+        masks = u32(nodes)
+        targets = u32(edges)
+        labels = take(edges)
+        finals = take((nodes + 7) // 8, aligned=False)
+        return cls(offsets, labels, targets, finals, masks, alphabet)
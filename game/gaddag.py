@@ -0,0 +1,71 @@
+"""GADDAG — Gordon's bidirectional word graph — for AI move generation.
+
+A GADDAG stores every word once per split point: for a word
+a1…an and each 1 <= i < n the path ``rev(a1…ai) + SEPARATOR +
+a(i+1)…an``, plus the full reversal ``rev(a1…an)``. Starting from any
+letter of a word, the generator reads leftwards to the word's start,
+crosses the separator and reads rightwards to its end — so a move is
+grown outwards from the anchor square, and no left part that cannot
+pass through the anchor is ever tried (Gordon 1994).
+
+The strings are fed sorted through the same Daciuk minimization as the
+DAWG (game/dawg.py), so the GADDAG is a :class:`~game.dawg.Dawg` over
+:data:`GADDAG_ALPHABET` and converts to the compact, mmappable layout
+like any other. It is roughly an order of magnitude larger than the
+DAWG, hence optional: built by ``python -m tools.build_dawg --gaddag``.
+"""
+
+from typing import Iterator, List, Sequence, Set
+
+from .dawg import ALPHABET, Dawg
+
+# Marks the switch from reading leftwards to reading rightwards
+SEPARATOR = "+"
+GADDAG_ALPHABET = ALPHABET + SEPARATOR
+
+
+def gaddag_strings(word: str) -> Iterator[str]:
+    """All GADDAG paths of *word*: one per split point plus the reversal."""
+    for i in range(1, len(word)):
+        yield word[i - 1::-1] + SEPARATOR + word[i:]
+    yield word[::-1]
+
+
+def sorted_gaddag_paths(words: Sequence[str]) -> Iterator[str]:
+    """The GADDAG paths of all *words*, in sorted order.
+
+    A path starts with the letter at its split point, so the paths
+    beginning with one letter come from that letter's occurrences.
+    Generating and sorting one such shard at a time keeps peak memory
+    at the largest shard instead of all ~10 paths per word at once.
+    """
+    letters: Set[str] = set()
+    for word in words:
+        letters.update(word)
+    for letter in sorted(letters):
+        shard: List[str] = []
+        for word in words:
+            j = word.find(letter)
+            while j != -1:
+                if j + 1 < len(word):
+                    shard.append(word[j::-1] + SEPARATOR + word[j + 1:])
+                else:
+                    shard.append(word[::-1])
+                j = word.find(letter, j + 1)
+        shard.sort()
+        yield from shard
+
+
+def build_gaddag(words: Sequence[str]) -> Dawg:
+    """Build a minimized GADDAG from *words* (any order, no duplicates)."""
+    return Dawg.build(sorted_gaddag_paths(words))
+
+
+def gaddag_is_word(gaddag, word: str) -> bool:
+    """Membership test: a word is its reversal path, ending on a final node."""
+    node = 0
+    for ch in reversed(word):
+        node = gaddag.child(node, ch)
+        if node is None:
+            return False
+    return gaddag.is_final(node)
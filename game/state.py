@@ -1,15 +1,17 @@
 import random
-from typing import List, Set, Tuple, Optional, Dict
+from typing import List, Set, Tuple, Optional, Dict, Union
 from dataclasses import dataclass
+from .board import CompactBoard
 from .word_validator import WordValidator
+from .cross_checks import CrossCheckCache
 from .constants import (
+    BOARD_SIZE,
     LETTER_DISTRIBUTION,
-    TRIPLE_WORD_SCORE,
-    DOUBLE_WORD_SCORE,
-    TRIPLE_LETTER_SCORE,
-    DOUBLE_LETTER_SCORE
+    LETTER_MULTIPLIER,
+    LETTER_POINTS,
+    WORD_MULTIPLIER,
 )
-from wordlist import WordList
+from wordlist import shared_wordlist
 
 @dataclass
 class Player:
@@ -28,12 +30,37 @@ class Player:
         for tile in tiles:
             self.rack.remove(tile)
 
+@dataclass
+class TurnDelta:
+    """What one ``commit_turn`` changed, enough to undo or replay it.
+
+    ``score_changes`` holds every player's score change (the end-game
+    adjustment touches them all); ``drawn`` the tiles drawn from the front
+    of the bag, filled in later for a deferred draw. The flags are their
+    values before the commit.
+    """
+    player_idx: int
+    tiles: Tuple[Tuple[int, int, str], ...]
+    blanks: Tuple[Tuple[int, int], ...]
+    words: Tuple[Tuple[str, int], ...]
+    score_changes: Tuple[int, ...]
+    drawn: Tuple[str, ...] = ()
+    forced: bool = False
+    consecutive_passes: int = 0
+    first_move: bool = False
+    game_over: bool = False
+    ended_game: bool = False
+
 class GameState:
-    def __init__(self, board_size: int = 15, num_players: int = 2):
+    def __init__(self, board_size: int = 15, num_players: int = 2, compact_board: bool = False):
+        """*compact_board* keeps the board as a :class:`CompactBoard` (game/board.py)."""
         if not 2 <= num_players <= 4:
             raise ValueError("num_players must be between 2 and 4")
         self.board_size = board_size
-        self.board: List[List[Optional[str]]] = [[None for _ in range(board_size)] for _ in range(board_size)]
+        self.compact_board = compact_board
+        # AI anchors/cross-checks of the committed board, updated per commit
+        self.cross_checks = CrossCheckCache(board_size)
+        self.board = [[None for _ in range(board_size)] for _ in range(board_size)]
         self.players = [Player(f"Player {i + 1}") for i in range(num_players)]
         self.current_player_idx = 0
         self.current_turn_tiles: Set[Tuple[int, int]] = set()
@@ -41,11 +68,27 @@ class GameState:
         self.consecutive_passes = 0
         self.game_over = False
         self.first_move = True
-        self.wordlist = WordList()
+        # Process-wide dictionary: loading it per game cost seconds
+        self.wordlist = shared_wordlist()
         self.word_validator = WordValidator(self.wordlist)
         self.tile_bag = self._create_tile_bag()
+        # One TurnDelta per committed word, oldest first
+        self.journal: List[TurnDelta] = []
         self._initialize_game()
 
+    @property
+    def board(self) -> Union[List[List[Optional[str]]], CompactBoard]:
+        return self._board
+
+    @board.setter
+    def board(self, board: Union[List[List[Optional[str]]], CompactBoard]) -> None:
+        # Callers may assign a list of lists either way
+        if self.compact_board and not isinstance(board, CompactBoard):
+            board = CompactBoard.from_rows(board)
+        self._board = board
+        # A replaced board is taken as committed; later changes sync per square
+        self.cross_checks.sync(board)
+
     @property
     def current_player(self) -> Player:
         return self.players[self.current_player_idx]
@@ -87,14 +130,11 @@ class GameState:
         if pos in self.blank_designations:
             return 0
 
-        base_score = LETTER_DISTRIBUTION[letter.lower()]['points']
+        base_score = LETTER_POINTS[letter.lower()]
 
         # Only apply letter premium squares for newly placed tiles
         if pos in self.current_turn_tiles:
-            if pos in TRIPLE_LETTER_SCORE:
-                return base_score * 3
-            elif pos in DOUBLE_LETTER_SCORE:
-                return base_score * 2
+            return base_score * LETTER_MULTIPLIER[row * BOARD_SIZE + col]
         return base_score
 
     def _calculate_word_score(self, word_info: Tuple[str, List[Tuple[int, int]]]) -> int:
@@ -106,14 +146,10 @@ class GameState:
         # Calculate letter scores and collect word multipliers
         for letter, (row, col) in zip(word, positions):
             word_score += self._get_letter_score(letter, row, col)
-            pos = (row, col)
 
             # Only apply premium squares for newly placed tiles
-            if pos in self.current_turn_tiles:
-                if pos in TRIPLE_WORD_SCORE:
-                    word_multiplier *= 3
-                elif pos in DOUBLE_WORD_SCORE:
-                    word_multiplier *= 2
+            if (row, col) in self.current_turn_tiles:
+                word_multiplier *= WORD_MULTIPLIER[row * BOARD_SIZE + col]
 
         return word_score * word_multiplier
 
@@ -261,6 +297,19 @@ class GameState:
         if not self.current_turn_tiles:
             return False
 
+        scores_before = [player.score for player in self.players]
+        delta = TurnDelta(
+            player_idx=self.current_player_idx,
+            tiles=tuple((r, c, self.board[r][c]) for r, c in sorted(self.current_turn_tiles)),
+            blanks=tuple(sorted(pos for pos in self.current_turn_tiles
+                                if pos in self.blank_designations)),
+            words=tuple(breakdown),
+            score_changes=(),
+            forced=force,
+            consecutive_passes=self.consecutive_passes,
+            first_move=self.first_move,
+            game_over=self.game_over,
+        )
         turn_score = sum(score for _, score in breakdown)
 
         # Update player's score
@@ -275,7 +324,10 @@ class GameState:
         else:
             self._deferred_draw_player_idx = None
             self._deferred_draw_count = 0
-            self._draw_tiles(self.current_player, tiles_to_draw)
+            delta.drawn = tuple(self._draw_tiles(self.current_player, tiles_to_draw))
+
+        # Only the committed squares' rows and columns need new cross-checks
+        self.cross_checks.sync(self.board, self.current_turn_tiles)
 
         # Clear current turn tiles (blank designations persist on the board)
         self.current_turn_tiles.clear()
@@ -287,18 +339,65 @@ class GameState:
         # Check for game over and apply end-game adjustment
         if self.is_game_over():
             self.game_over = True
+            delta.ended_game = not getattr(self, "_end_game_applied", False)
             self.apply_end_game_adjustment()
 
+        delta.score_changes = tuple(
+            player.score - before for player, before in zip(self.players, scores_before)
+        )
+        self.journal.append(delta)
+
         # Switch to next player
         self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
         return True
 
+    def undo_last_commit(self) -> bool:
+        """Take back the last committed turn by applying its delta in reverse.
+
+        The tiles stay on the board as the current turn's tiles, so the
+        player can retract or rearrange them, and the turn is theirs again.
+        Only valid while that commit is still the latest turn (nobody has
+        passed or exchanged since). Returns False if there is nothing to undo.
+        """
+        if not self.journal:
+            return False
+        delta = self.journal.pop()
+        for player, change in zip(self.players, delta.score_changes):
+            player.score -= change
+        if delta.drawn:
+            rack = self.players[delta.player_idx].rack
+            del rack[len(rack) - len(delta.drawn):]
+            self.tile_bag[:0] = delta.drawn
+        # Undo any end-game adjustment applied by the retracted move —
+        # otherwise the guard flag stays set and the real game end would
+        # silently skip the tile adjustment (issue #36).
+        if delta.ended_game:
+            self._end_game_applied = False
+            self.end_game_details = []
+        # Move is being undone, no tiles should be drawn
+        self._deferred_draw_count = 0
+        self._deferred_draw_player_idx = None
+        self.current_turn_tiles = {(r, c) for r, c, _ in delta.tiles}
+        # The cache holds the committed board: lift the tiles off while it syncs
+        for r, c, _ in delta.tiles:
+            self.board[r][c] = None
+        self.cross_checks.sync(self.board, self.current_turn_tiles)
+        for r, c, letter in delta.tiles:
+            self.board[r][c] = letter
+        self.consecutive_passes = delta.consecutive_passes
+        self.first_move = delta.first_move
+        self.game_over = delta.game_over
+        self.current_player_idx = delta.player_idx
+        return True
+
     def draw_deferred_tiles(self):
         """Draw tiles that were deferred during commit (challenge window closed)."""
         count = getattr(self, "_deferred_draw_count", 0)
         idx = getattr(self, "_deferred_draw_player_idx", None)
         if count > 0 and idx is not None and idx < len(self.players):
-            self._draw_tiles(self.players[idx], count)
+            drawn = self._draw_tiles(self.players[idx], count)
+            if self.journal and self.journal[-1].player_idx == idx:
+                self.journal[-1].drawn += tuple(drawn)
         self._deferred_draw_count = 0
         self._deferred_draw_player_idx = None
 
@@ -310,6 +409,7 @@ class GameState:
     def next_player(self):
         """Skip to the next player's turn (pass)."""
         # Return any placed tiles to the rack
+        returned = list(self.current_turn_tiles)
         for row, col in self.current_turn_tiles:
             if (row, col) in self.blank_designations:
                 self.current_player.rack.append("_")
@@ -318,6 +418,7 @@ class GameState:
                 letter = self.board[row][col]
                 self.current_player.rack.append(letter)
             self.board[row][col] = None
+        self.cross_checks.sync(self.board, returned)
 
         # Clear current turn tiles
         self.current_turn_tiles.clear()
@@ -356,7 +457,7 @@ class GameState:
         total_remaining = 0
         for player in self.players:
             value = sum(
-                LETTER_DISTRIBUTION[tile.lower()]["points"]
+                LETTER_POINTS[tile.lower()]
                 for tile in player.rack
             )
             remaining_values[player.name] = value
@@ -1,12 +1,55 @@
 from typing import List, Tuple, Set, Dict, Optional
-from wordlist import WordList
+from wordlist import WordList, shared_wordlist
 import logging
 
+Square = Tuple[int, int]
+
+
 class WordValidator:
-    def __init__(self, wordlist: WordList):
-        self.wordlist = wordlist
+    """Validates the current turn's words, re-checking only what changed.
+
+    Players drag tiles around many times per turn and every drag is
+    validated, so the validator keeps the words through the current
+    turn's tiles between calls. :meth:`validate_placement` compares the
+    turn's tiles with the last call's, re-reads only the words next to a
+    square whose tile changed, and looks a word up in the dictionary only
+    once the placement is connected. Squares off the current turn are
+    assumed unchanged while the same board object is validated: they only
+    change on a commit, which empties the turn.
+    """
+
+    def __init__(self, wordlist: Optional[WordList] = None):
+        # Default to the process-wide dictionary rather than loading another
+        self.wordlist = wordlist if wordlist is not None else shared_wordlist()
         self.word_validity: Dict[Tuple[int, int], bool] = {}
         self.logger = logging.getLogger(__name__)
+        # State of the last validate_placement call
+        self._board = None
+        self._letters: Dict[Square, Optional[str]] = {}
+        # Words through the turn's tiles: positions -> (word, validity once looked up)
+        self._words: Dict[Tuple[Square, ...], Tuple[str, Optional[bool]]] = {}
+
+    def _read_word(self, board: List[List[Optional[str]]], row: int, col: int,
+                   dy: int, dx: int) -> Tuple[str, List[Tuple[int, int]]]:
+        """The run of letters through (row, col) along (dy, dx), with its squares."""
+        # Find word start
+        start_row, start_col = row, col
+        while (start_row - dy >= 0 and start_col - dx >= 0 and
+               board[start_row - dy][start_col - dx] is not None):
+            start_row -= dy
+            start_col -= dx
+
+        # Build word
+        word = ""
+        positions = []
+        curr_row, curr_col = start_row, start_col
+        while (curr_row < len(board) and curr_col < len(board[0]) and
+               board[curr_row][curr_col] is not None):
+            word += board[curr_row][curr_col]
+            positions.append((curr_row, curr_col))
+            curr_row += dy
+            curr_col += dx
+        return word, positions
 
     def get_word_at_position(self, board: List[List[Optional[str]]], row: int, col: int) -> List[Tuple[str, List[Tuple[int, int]]]]:
         """Get horizontal and vertical words at the given position."""
@@ -14,24 +57,7 @@ class WordValidator:
         directions = [(0, 1), (1, 0)]  # Horizontal and vertical
 
         for dy, dx in directions:
-            # Find word start
-            start_row, start_col = row, col
-            while (start_row - dy >= 0 and start_col - dx >= 0 and 
-                   board[start_row - dy][start_col - dx] is not None):
-                start_row -= dy
-                start_col -= dx
-
-            # Build word
-            word = ""
-            positions = []
-            curr_row, curr_col = start_row, start_col
-            while (curr_row < len(board) and curr_col < len(board[0]) and 
-                   board[curr_row][curr_col] is not None):
-                word += board[curr_row][curr_col]
-                positions.append((curr_row, curr_col))
-                curr_row += dy
-                curr_col += dx
-
+            word, positions = self._read_word(board, row, col, dy, dx)
             if len(word) > 1:
                 self.logger.debug(f"Found word: '{word}' at positions {positions}")
                 words.append((word, positions))
@@ -91,8 +117,47 @@ class WordValidator:
         # Tiles neither in same row nor column
         return False
 
+    def _update_words(self, board: List[List[Optional[str]]], square: Square,
+                      current_turn_tiles: Set[Tuple[int, int]]) -> None:
+        """Re-read the words a tile change at *square* can have touched.
+
+        Along each direction only words covering *square* or its two
+        neighbours on that line can have grown, shrunk, split or merged.
+        """
+        row, col = square
+        size = len(board)
+        for dy, dx in ((0, 1), (1, 0)):
+            line = [(row - dy, col - dx), square, (row + dy, col + dx)]
+            for positions in [p for p in self._words if (p[1][0] - p[0][0], p[1][1] - p[0][1])
+                              == (dy, dx) and any(sq in p for sq in line)]:
+                del self._words[positions]
+            for r, c in line:
+                if not (0 <= r < size and 0 <= c < size) or board[r][c] is None:
+                    continue
+                word, positions = self._read_word(board, r, c, dy, dx)
+                key = tuple(positions)
+                if (len(word) > 1 and key not in self._words
+                        and any(pos in current_turn_tiles for pos in positions)):
+                    self._words[key] = (word, None)
+
     def validate_placement(self, board: List[List[Optional[str]]], current_turn_tiles: Set[Tuple[int, int]], first_move: bool = False) -> Dict[Tuple[int, int], bool]:
-        """Validate all words formed by the current turn's tiles."""
+        """Validate all words formed by the current turn's tiles.
+
+        A tile is marked invalid if any word through it is invalid.
+        """
+        if board is not self._board:
+            self._board = board
+            self._letters = {}
+            self._words = {}
+        letters = {(r, c): board[r][c] for r, c in current_turn_tiles}
+        changed = [
+            square for square in self._letters.keys() | letters.keys()
+            if self._letters.get(square) != letters.get(square)
+        ]
+        self._letters = letters
+        for square in changed:
+            self._update_words(board, square, current_turn_tiles)
+
         self.word_validity.clear()
 
         # First check if tiles are connected to existing tiles
@@ -110,26 +175,22 @@ class WordValidator:
             for pos in current_turn_tiles:
                 self.word_validity[pos] = False
             return self.word_validity
-        
-        # Check each placed tile
-        all_words = set()  # Keep track of all words to avoid duplicates
-        for row, col in current_turn_tiles:
-            words = self.get_word_at_position(board, row, col)
-            
-            for word, positions in words:
-                if word not in all_words:
-                    all_words.add(word)
-                    is_valid = self.wordlist.is_valid_word(word)
-                    self.logger.debug(f"Validating word '{word}': {'valid' if is_valid else 'invalid'}")
-                    # Update validity for all positions in the word
-                    for pos in positions:
-                        self.word_validity[pos] = is_valid
 
         # If no words were formed (single letter), mark as invalid
-        if not all_words:
+        if not self._words:
             self.logger.warning("No valid words formed")
             for pos in current_turn_tiles:
                 self.word_validity[pos] = False
+            return self.word_validity
+
+        # Look up only the words not checked on an earlier call
+        for positions, (word, is_valid) in self._words.items():
+            if is_valid is None:
+                is_valid = self.wordlist.is_valid_word(word)
+                self.logger.debug(f"Validating word '{word}': {'valid' if is_valid else 'invalid'}")
+                self._words[positions] = (word, is_valid)
+            for pos in positions:
+                self.word_validity[pos] = self.word_validity.get(pos, True) and is_valid
 
         return self.word_validity
 
@@ -0,0 +1,335 @@
+"""AI move computation in a dedicated process pool.
+
+``select_move`` is pure-Python CPU work. Run on the default thread
+pool, every concurrent AI turn contends for the GIL with the others and
+with the event loop serving WebSocket traffic, so one busy AI made
+every human's tile placement lag. :class:`AIEngine` runs the search in
+a ``ProcessPoolExecutor`` instead:
+
+- each worker mmaps the strict DAWG (and the GADDAG, if built) once, in
+  its initializer — the page cache holds one physical copy for all;
+- a job is a compact payload (:func:`encode_job`): the board as one
+  string, the rack as another, two flags, the time budget and the
+  anchors and cross-check masks of the game's incremental cache — no
+  game objects cross the process boundary, and workers do not compute
+  the checks again every turn;
+- :meth:`AIEngine.stats` reports queue depth and per-job timing for
+  ``/stats``.
+
+The pool size comes from ``AI_WORKERS`` (default: one per CPU, at most
+four). ``AI_WORKERS=0`` keeps the search on a thread in the server
+process.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from game.ai_player import Move, select_move
+from game.board import CompactBoard
+from game.cross_checks import CrossCheckView
+from tools.build_dawg import DAWG_FILE, GADDAG_FILE
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = "AI_WORKERS"
+MAX_DEFAULT_WORKERS = 4
+
+# Board square without a tile in the job payload
+EMPTY = "."
+
+# (anchor squares as r * size + c, across masks, down masks): see CrossCheckView.masks
+Checks = Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]
+# (board, rack, first_move, difficulty, budget seconds or None, checks or None)
+Job = Tuple[str, str, bool, str, Optional[float], Optional[Checks]]
+
+
+def default_workers() -> int:
+    """Pool size from ``AI_WORKERS``, else one per CPU (at most four)."""
+    value = os.environ.get(WORKERS_ENV)
+    if value is not None:
+        try:
+            return max(0, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", WORKERS_ENV, value)
+    return min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+
+
+def encode_job(board: Union[List[List[Optional[str]]], CompactBoard], rack: List[str],
+               first_move: bool, difficulty: str, budget: Optional[float] = None,
+               view: Optional[CrossCheckView] = None) -> Job:
+    """Compact, picklable form of an AI turn's inputs.
+
+    *view* is the game cache's cross-check view of *board*, if any.
+    """
+    if isinstance(board, CompactBoard):
+        squares = board.to_string(EMPTY)
+    else:
+        squares = "".join(EMPTY if ch is None else ch for row in board for ch in row)
+    checks = None
+    if view is not None:
+        size = math.isqrt(len(squares))
+        checks = (tuple(sorted(r * size + c for r, c in view.anchors)),) + view.masks()
+    return (
+        squares,
+        "".join(rack),
+        first_move,
+        difficulty,
+        budget,
+        checks,
+    )
+
+
+def decode_job(job: Job) -> Tuple[List[List[Optional[str]]], List[str], bool, str,
+                                  Optional[float], Optional[CrossCheckView]]:
+    """Inverse of :func:`encode_job`."""
+    squares, rack, first_move, difficulty, budget, checks = job
+    size = math.isqrt(len(squares))
+    board = [
+        [None if ch == EMPTY else ch for ch in squares[r * size:(r + 1) * size]]
+        for r in range(size)
+    ]
+    view = None
+    if checks is not None:
+        anchors, across, down = checks
+        view = CrossCheckView.from_masks(board, (divmod(sq, size) for sq in anchors),
+                                         across, down)
+    return board, list(rack), first_move, difficulty, budget, view
+
+
+def _deadline(budget: Optional[float]) -> Optional[float]:
+    # Budgets travel as durations: monotonic clocks are per process
+    return None if budget is None else time.monotonic() + budget
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+class _GraphWordList:
+    """The strict dictionary as a worker sees it: just the mmapped graphs.
+
+    ``select_move`` only walks ``dawg``/``gaddag``; the Hunspell
+    dictionary is loaded only if the DAWG is missing and the search
+    falls back to brute force.
+    """
+
+    def __init__(self, dawg_path: str, gaddag_path: str):
+        from game.dawg import CompactDawg
+
+        self.dawg = CompactDawg.load(dawg_path) if os.path.exists(dawg_path) else None
+        self.gaddag = CompactDawg.load(gaddag_path) if os.path.exists(gaddag_path) else None
+        if self.dawg is None:
+            logger.warning("AI worker found no DAWG at %s: brute-force search", dawg_path)
+
+    def is_valid_word(self, word: str) -> bool:
+        from wordlist import shared_wordlist
+
+        return shared_wordlist().strict.is_valid_word(word)
+
+
+_worker_wordlist: Optional[_GraphWordList] = None
+
+
+def _init_worker(dawg_path: str, gaddag_path: str) -> None:
+    global _worker_wordlist
+    _worker_wordlist = _GraphWordList(dawg_path, gaddag_path)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _run_job(job: Job) -> Tuple[Optional[Move], float]:
+    """Compute one AI move in a worker; returns (move, compute seconds)."""
+    board, rack, first_move, difficulty, budget, view = decode_job(job)
+    t0 = time.perf_counter()
+    move = select_move(board, rack, _worker_wordlist, first_move, difficulty,
+                       cross_checks=view, deadline=_deadline(budget))
+    return move, time.perf_counter() - t0
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+def _cache_view(wordlist: Callable[[], Any], cross_checks,
+                first_move: bool) -> Optional[CrossCheckView]:
+    """The game cache's view for a job, or None if there is no graph to compute it with.
+
+    The checks come out the same from the DAWG or the GADDAG, so they
+    suit whichever graph the worker searches.
+    """
+    wl = wordlist()
+    gaddag = getattr(wl, "gaddag", None)
+    graph = gaddag if gaddag is not None else getattr(wl, "dawg", None)
+    if graph is None:
+        return None  # brute-force search: no checks to share
+    return cross_checks.view(graph, first_move, gaddag=gaddag is not None)
+
+
+class AIEngine:
+    """Runs AI move searches in a process pool (or a thread, with 0 workers).
+
+    Used from the event loop only: :meth:`select_move` is a coroutine
+    and the counters need no lock.
+    """
+
+    def __init__(self, workers: Optional[int] = None, dawg_path: str = DAWG_FILE,
+                 gaddag_path: str = GADDAG_FILE, history: int = 100):
+        self.workers = default_workers() if workers is None else workers
+        self._graph_paths = (dawg_path, gaddag_path)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._jobs: Deque[Dict[str, float]] = deque(maxlen=history)
+
+    @property
+    def mode(self) -> str:
+        return "process" if self.workers > 0 else "thread"
+
+    def start(self) -> None:
+        """Spawn the workers (idempotent; a no-op in thread mode).
+
+        One no-op job per worker makes the pool spawn them all now, so
+        the DAWG load happens at startup instead of on the first turns.
+        """
+        if self.workers == 0 or self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # spawn, not fork: the server process has threads running
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._graph_paths,
+        )
+        for _ in range(self.workers):
+            self._pool.submit(_ping)
+        logger.info("AI engine started with %d worker processes", self.workers)
+
+    def restart(self) -> None:
+        """Replace the workers with new ones that map the graph files again.
+
+        After a dictionary reload. Jobs already submitted finish on the
+        old workers, with the graphs they started with; new jobs go to
+        the new workers. A no-op in thread mode or before :meth:`start`.
+        """
+        if self.workers == 0 or self._pool is None:
+            return
+        old, self._pool = self._pool, None
+        self.start()
+        old.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the workers, dropping queued jobs."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def select_move(
+        self,
+        board: Union[List[List[Optional[str]]], CompactBoard],
+        rack: List[str],
+        first_move: bool,
+        difficulty: str,
+        wordlist: Callable[[], Any],
+        cross_checks=None,
+        budget: Optional[float] = None,
+    ) -> Optional[Move]:
+        """The AI's move for *board* and *rack* (None: no move, pass).
+
+        *wordlist* returns the strict wordlist and *cross_checks* is the
+        game's cache. Workers search their own mmapped graphs; the cache
+        is brought up to date here (on a thread: only the changed lines
+        are computed) and its view goes in the job. With a *budget* (seconds)
+        the search returns the best move found within it. If the pool
+        breaks (a worker died), it is replaced and this job runs on a
+        thread.
+        """
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        t0 = time.perf_counter()
+        try:
+            if self.workers > 0:
+                self.start()
+                pool = self._pool
+                view = None
+                if cross_checks is not None:
+                    view = await loop.run_in_executor(
+                        None, _cache_view, wordlist, cross_checks, first_move
+                    )
+                try:
+                    move, compute = await loop.run_in_executor(
+                        pool, _run_job,
+                        encode_job(board, rack, first_move, difficulty, budget, view),
+                    )
+                except BrokenProcessPool:
+                    if self._pool is pool:  # not yet replaced by a concurrent job
+                        logger.exception("AI worker pool broke; restarting it")
+                        self.shutdown()
+                        self.start()
+                    move, compute = await self._run_in_thread(
+                        loop, board, rack, first_move, difficulty, wordlist, cross_checks,
+                        budget,
+                    )
+            else:
+                move, compute = await self._run_in_thread(
+                    loop, board, rack, first_move, difficulty, wordlist, cross_checks, budget
+                )
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+        total = time.perf_counter() - t0
+        self._completed += 1
+        self._jobs.append({
+            "compute_ms": compute * 1000,
+            "total_ms": total * 1000,
+            # queueing for a worker plus pickling and IPC
+            "overhead_ms": max(total - compute, 0.0) * 1000,
+        })
+        return move
+
+    @staticmethod
+    async def _run_in_thread(loop, board, rack, first_move, difficulty, wordlist, cross_checks,
+                             budget):
+        deadline = _deadline(budget)
+
+        def run():
+            # wordlist() is resolved here: its first access loads the
+            # strict dictionary (~seconds) and must not block the loop
+            t0 = time.perf_counter()
+            move = select_move(board, rack, wordlist(), first_move, difficulty,
+                               cross_checks=cross_checks, deadline=deadline)
+            return move, time.perf_counter() - t0
+
+        return await loop.run_in_executor(None, run)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and recent per-job timings, for ``/stats``."""
+        jobs = list(self._jobs)
+        timing: Dict[str, Any] = {"jobs": len(jobs)}
+        for key in ("compute_ms", "overhead_ms", "total_ms"):
+            values = [job[key] for job in jobs]
+            timing[key] = {
+                "avg": round(sum(values) / len(values), 1) if values else None,
+                "max": round(max(values), 1) if values else None,
+            }
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "in_flight": self._in_flight,
+            "queue_depth": max(0, self._in_flight - self.workers) if self.workers else 0,
+            "completed": self._completed,
+            "failed": self._failed,
+            "recent": timing,
+        }
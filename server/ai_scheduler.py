@@ -0,0 +1,217 @@
+"""Fair, deadline-bounded scheduling of AI turns onto the AI engine.
+
+:class:`AIEngine` runs one search per call, so every room whose AI was
+due submitted straight to the pool: a room with three AI players (or a
+burst of rooms starting at once) queued ahead of everyone else, and a
+slow search held its worker for as long as it took. :class:`AIScheduler`
+sits in front of the engine:
+
+- at most ``max_concurrent`` searches run at once (by default one per
+  worker) — the rest wait here, where the wait can be measured;
+- waiting jobs are kept per room and dispatched round-robin across
+  rooms, so one busy room cannot starve the others;
+- every job has a deadline counted from when it was queued; the search
+  gets what is left of it as its budget and returns the best move found
+  so far, and a job whose deadline passes while queued is a pass;
+- at most ``max_queued`` jobs wait; beyond that a turn passes at once
+  instead of piling up behind a backlog it can never clear;
+- :meth:`AIScheduler.cancel_room` drops a removed room's jobs, queued or
+  running.
+
+:meth:`AIScheduler.stats` reports queue wait and compute time separately
+for ``/stats``.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Union
+
+from game.ai_player import Move
+from game.board import CompactBoard
+
+from .ai_engine import AIEngine
+
+logger = logging.getLogger(__name__)
+
+# Seconds from queueing to a move; the human-facing turn delay is separate
+DEFAULT_DEADLINE = 15.0
+DEFAULT_MAX_QUEUED = 256
+# Slack on top of the search budget for IPC before a job is abandoned
+_GRACE = 2.0
+
+
+class _Job:
+    __slots__ = ("room_code", "args", "future", "enqueued", "deadline", "task")
+
+    def __init__(self, room_code: str, args: Dict[str, Any], deadline: float):
+        self.room_code = room_code
+        self.args = args
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.enqueued = time.monotonic()
+        self.deadline = self.enqueued + deadline
+        self.task: Optional[asyncio.Task] = None
+
+
+class AIScheduler:
+    """Queues AI turns per room and runs them on *engine* with a deadline.
+
+    Used from the event loop only; no locking needed.
+    """
+
+    def __init__(self, engine: AIEngine, max_concurrent: Optional[int] = None,
+                 deadline: float = DEFAULT_DEADLINE, max_queued: int = DEFAULT_MAX_QUEUED,
+                 history: int = 100):
+        self.engine = engine
+        self.max_concurrent = max_concurrent or max(engine.workers, 1)
+        self.deadline = deadline
+        self.max_queued = max_queued
+        self._queues: Dict[str, Deque[_Job]] = {}
+        # Rooms with queued jobs, in the order they get their next turn
+        self._ready: Deque[str] = deque()
+        self._queued = 0
+        self._running: Set[_Job] = set()
+        self._counts = {"completed": 0, "expired": 0, "timed_out": 0,
+                        "rejected": 0, "cancelled": 0, "failed": 0}
+        self._jobs: Deque[Dict[str, float]] = deque(maxlen=history)
+
+    async def select_move(
+        self,
+        room_code: str,
+        board: Union[List[List[Optional[str]]], CompactBoard],
+        rack: List[str],
+        first_move: bool,
+        difficulty: str,
+        wordlist: Callable[[], Any],
+        cross_checks=None,
+    ) -> Optional[Move]:
+        """The AI's move for *room_code*'s turn (None: pass).
+
+        Waits for a slot, then searches for what is left of the deadline.
+        Raises ``asyncio.CancelledError`` if the room is removed first.
+        """
+        if self._queued >= self.max_queued:
+            self._counts["rejected"] += 1
+            logger.warning("AI queue full (%d jobs); room %s passes", self._queued, room_code)
+            return None
+        job = _Job(room_code, {
+            "board": board, "rack": rack, "first_move": first_move, "difficulty": difficulty,
+            "wordlist": wordlist, "cross_checks": cross_checks,
+        }, self.deadline)
+        queue = self._queues.get(room_code)
+        if queue is None:
+            queue = self._queues[room_code] = deque()
+            self._ready.append(room_code)
+        queue.append(job)
+        self._queued += 1
+        self._dispatch()
+        return await job.future
+
+    def cancel_room(self, room_code: str) -> None:
+        """Drop *room_code*'s queued and running jobs (the room is gone).
+
+        A search already in a worker process runs on to its budget; its
+        result is discarded.
+        """
+        queue = self._queues.pop(room_code, None)
+        if queue is not None:
+            self._ready.remove(room_code)
+            self._queued -= len(queue)
+            for job in queue:
+                self._cancel(job)
+        for job in list(self._running):
+            if job.room_code == room_code:
+                self._cancel(job)
+                if job.task is not None:
+                    job.task.cancel()
+
+    def _cancel(self, job: _Job) -> None:
+        if not job.future.done():
+            job.future.cancel()
+            self._counts["cancelled"] += 1
+
+    def _next_job(self) -> Optional[_Job]:
+        if not self._ready:
+            return None
+        room_code = self._ready.popleft()
+        queue = self._queues[room_code]
+        job = queue.popleft()
+        if queue:
+            self._ready.append(room_code)  # back of the line
+        else:
+            del self._queues[room_code]
+        self._queued -= 1
+        return job
+
+    def _dispatch(self) -> None:
+        while len(self._running) < self.max_concurrent:
+            job = self._next_job()
+            if job is None:
+                return
+            if job.future.done():  # the caller went away while it waited
+                continue
+            self._running.add(job)
+            job.task = asyncio.ensure_future(self._run(job))
+
+    async def _run(self, job: _Job) -> None:
+        started = time.monotonic()
+        wait = started - job.enqueued
+        budget = job.deadline - started
+        move: Optional[Move] = None
+        # Seconds the engine took, if it answered: expired and timed-out
+        # turns count under their own outcomes, not as completed
+        compute: Optional[float] = None
+        try:
+            if budget <= 0:
+                self._counts["expired"] += 1
+                logger.warning("AI turn for room %s expired after %.1fs in the queue",
+                               job.room_code, wait)
+            else:
+                try:
+                    move = await asyncio.wait_for(
+                        self.engine.select_move(budget=budget, **job.args), budget + _GRACE
+                    )
+                    compute = time.monotonic() - started
+                except asyncio.TimeoutError:
+                    self._counts["timed_out"] += 1
+                    logger.warning("AI turn for room %s timed out; passing", job.room_code)
+        except asyncio.CancelledError:
+            return  # cancel_room; the caller's future is already cancelled
+        except Exception as exc:
+            self._counts["failed"] += 1
+            self._jobs.append({"queue_wait_ms": wait * 1000, "compute_ms": None})
+            if not job.future.done():
+                job.future.set_exception(exc)
+            return
+        finally:
+            self._running.discard(job)
+            self._dispatch()
+        if compute is not None:
+            self._counts["completed"] += 1
+        self._jobs.append({
+            "queue_wait_ms": wait * 1000,
+            "compute_ms": None if compute is None else compute * 1000,
+        })
+        if not job.future.done():
+            job.future.set_result(move)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue lengths, outcome counts and recent wait/compute times, for ``/stats``."""
+        jobs = list(self._jobs)
+        timing: Dict[str, Any] = {"jobs": len(jobs)}
+        for key in ("queue_wait_ms", "compute_ms"):
+            values = [job[key] for job in jobs if job[key] is not None]
+            timing[key] = {
+                "avg": round(sum(values) / len(values), 1) if values else None,
+                "max": round(max(values), 1) if values else None,
+            }
+        return {
+            "max_concurrent": self.max_concurrent,
+            "deadline_s": self.deadline,
+            "queued": self._queued,
+            "running": len(self._running),
+            "rooms_waiting": len(self._queues),
+            **self._counts,
+            "recent": timing,
+        }
@@ -1,26 +1,77 @@
 """FastAPI application with WebSocket endpoint for multiplayer Estonian Scrabble."""
 
 import asyncio
+import hmac
 import logging
+import os
 import random
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Header, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from game.ai_player import select_move
+from game.board import copy_board
 from game.constants import LETTER_DISTRIBUTION
 from game.state import GameState
+from wordlist import loaded_wordlist
 
-from .room import Room, RoomManager
-from .serialization import serialize_game_state
+from .ai_engine import AIEngine
+from .ai_scheduler import AIScheduler
+from .reload import DictionaryReloader, watch_interval
+from .room import DROP_TIMEOUT, Room, RoomManager
+from .warmup import DictionaryWarmup
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Estonian Scrabble Server")
-room_manager = RoomManager()
+# Preloads the shared dictionaries and DAWG at startup (see /ready)
+warmup = DictionaryWarmup()
+
+# Computes AI moves off the event loop, in worker processes (AI_WORKERS)
+ai_engine = AIEngine()
+# Queues AI turns fairly across rooms, each with a deadline
+ai_scheduler = AIScheduler(ai_engine)
+
+# Rebuilds and swaps in the dictionaries on request or on file changes
+reloader = DictionaryReloader()
+
+# Enables POST /admin/reload-dictionaries (sent as the X-Admin-Token header)
+ADMIN_TOKEN_ENV = "ADMIN_TOKEN"
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Start the dictionary warm-up and the AI workers without blocking startup."""
+    warmup.start()
+    ai_engine.start()
+    interval = watch_interval()
+    watcher = asyncio.create_task(reloader.watch(interval)) if interval > 0 else None
+    yield
+    if watcher is not None:
+        watcher.cancel()
+    ai_engine.shutdown()
+
+
+app = FastAPI(title="Estonian Scrabble Server", lifespan=lifespan)
+room_manager = RoomManager(on_remove=ai_scheduler.cancel_room)
+
+
+def _after_dictionary_reload():
+    """Drop what was derived from the old dictionaries.
+
+    Cross-checks were computed with the old DAWG, and the AI workers
+    mapped the old graph files: new workers map the new ones, searches
+    already running finish on the old.
+    """
+    for room in list(room_manager.rooms.values()):
+        if room.game is not None:
+            room.game.cross_checks.invalidate()
+    ai_engine.restart()
+
+
+reloader.on_reloaded(_after_dictionary_reload)
 
 # Letters a blank tile may be designated as (everything except the blank itself)
 _VALID_LETTERS = frozenset(k for k in LETTER_DISTRIBUTION if k != "_")
@@ -55,6 +106,17 @@ async def health_check():
     """Health check endpoint for deployment platforms."""
     return {"status": "ok"}
 
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness endpoint: 503 until the dictionaries and DAWG are loaded.
+
+    Unlike /health (process is up), this gates traffic on the first move
+    being fast. Reports per-stage warm-up progress and timings.
+    """
+    report = warmup.snapshot()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
 _WEB_DIR = Path(__file__).resolve().parent.parent / "web"
 
 
@@ -90,6 +152,7 @@ async def server_stats():
         rooms_list.append({
             "players": room.player_count,
             "status": status,
+            "send": room.send_stats(),
         })
 
     return {
@@ -98,9 +161,33 @@ async def server_stats():
         "rooms_playing": rooms_playing,
         "players_connected": players_total,
         "rooms": rooms_list,
+        "ai_engine": ai_engine.stats(),
+        "ai_scheduler": ai_scheduler.stats(),
+        "validation_cache": _validation_cache_stats(),
+        "dictionary_reload": reloader.stats(),
     }
 
 
+def _validation_cache_stats() -> Optional[Dict[str, Any]]:
+    """The dictionaries' lookup-cache stats; None until the dictionary is loaded."""
+    wordlist = loaded_wordlist()
+    return None if wordlist is None else wordlist.cache_stats()
+
+
+@app.post("/admin/reload-dictionaries")
+async def reload_dictionaries(x_admin_token: Optional[str] = Header(None)):
+    """Rebuild the dictionaries from data/ and dict/ and swap them in, in the background.
+
+    Disabled unless ``ADMIN_TOKEN`` is set. Answers at once (202); the
+    progress shows under ``dictionary_reload`` in /stats.
+    """
+    token = os.environ.get(ADMIN_TOKEN_ENV)
+    if not token or not hmac.compare_digest((x_admin_token or "").encode(), token.encode()):
+        return JSONResponse({"error": "forbidden"}, status_code=403)
+    started = reloader.request("admin")
+    return JSONResponse({"started": started, "reload": reloader.stats()}, status_code=202)
+
+
 @app.get("/admin", response_class=HTMLResponse)
 async def admin_page():
     """Minimal self-refreshing admin dashboard."""
@@ -202,9 +289,18 @@ setInterval(refresh, 10000);
 </html>"""
 
 
-async def _send_error(ws: WebSocket, message: str):
-    """Send an error message to a single client."""
-    await ws.send_json({"type": "error", "message": message})
+async def _send_error(ws: WebSocket, message: str, room: Optional[Room] = None):
+    """Send an error message to a single client.
+
+    Through *room*'s outbox for a player in it, so it stays in order with
+    the room's updates; a socket in no room gets it directly, and one
+    that hangs for ``DROP_TIMEOUT`` ends its session.
+    """
+    payload = {"type": "error", "message": message}
+    if room is not None and room.get_player_index(ws) is not None:
+        await room.send(ws, payload)
+    else:
+        await asyncio.wait_for(ws.send_json(payload), DROP_TIMEOUT)
 
 
 def _get_int(data: Dict[str, Any], key: str) -> Optional[int]:
@@ -323,12 +419,12 @@ async def _maybe_run_ai_turn(room: Room):
 
 
 async def _execute_ai_turn(room: Room):
-    """Execute the AI player's turn in a thread pool.
+    """Execute the AI player's turn via the AI scheduler (server/ai_scheduler.py).
 
     The AI validates its candidate words against the STRICT dictionary
     (compounding disabled) — brute-force move generation finds compound
     seams a human never would (see issue #33). Its moves are committed
-    with an immediate tile draw and no challenge snapshot: AI moves are
+    with an immediate tile draw and no challenge window: AI moves are
     not challengeable (#37); the recourse for a bad word is the
     blocklist.
     """
@@ -347,20 +443,19 @@ async def _execute_ai_turn(room: Room):
     if game.game_over or game.current_player_idx != player_idx:
         return
 
-    # Run AI computation in executor (don't block event loop)
-    loop = asyncio.get_event_loop()
+    # Run AI computation in a worker process (don't block event loop);
+    # past its deadline the scheduler returns the best move so far, or None
     rack = list(game.players[player_idx].rack)
-    board = [row[:] for row in game.board]
+    board = copy_board(game.board)
     difficulty = room.players[player_idx].get("difficulty", "medium")
 
-    first_move = game.first_move
-    # game.wordlist.strict is resolved inside the executor: its first
-    # access loads the strict dictionary (~seconds) and must not block
-    # the event loop.
-    move = await loop.run_in_executor(
-        None,
-        lambda: select_move(board, rack, game.wordlist.strict, first_move, difficulty),
-    )
+    try:
+        move = await ai_scheduler.select_move(
+            room.code, board, rack, game.first_move, difficulty,
+            wordlist=lambda: game.wordlist.strict, cross_checks=game.cross_checks,
+        )
+    except asyncio.CancelledError:
+        return  # the room was removed
 
     # Re-check again after executor completes
     if game.game_over or game.current_player_idx != player_idx:
@@ -405,7 +500,7 @@ async def _execute_ai_turn(room: Room):
         total_score = sum(s for _, s in score_breakdown)
         placed_positions = [{"row": r, "col": c} for r, c in game.current_turn_tiles]
 
-        # No snapshot and no deferred draw: AI moves are not challengeable
+        # No challenge window and no deferred draw: AI moves are not challengeable
         # and nobody can peek at the AI's rack.
         success = game.commit_turn(force=False, defer_draw=False)
         if not success:
@@ -459,7 +554,7 @@ async def _handle_create_room(ws: WebSocket, data: Dict[str, Any]) -> Optional[R
     elif isinstance(turn_limit, int) and not isinstance(turn_limit, bool) and turn_limit in _TURN_TIME_LIMITS:
         room.turn_time_limit = turn_limit
     player_index = room.add_player(player_name, ws)
-    await ws.send_json({
+    await room.send(ws, {
         "type": "room_created",
         "room_code": room.code,
         "player_index": player_index,
@@ -488,7 +583,7 @@ async def _handle_join_room(ws: WebSocket, data: Dict[str, Any]) -> Room | None:
     # Reconnection: game in progress, player with same name is disconnected
     if room.started and room.has_disconnected_player(player_name):
         player_index = room.reconnect_player(player_name, ws)
-        await ws.send_json({
+        await room.send(ws, {
             "type": "reconnected",
             "room_code": room.code,
             "player_index": player_index,
@@ -502,15 +597,7 @@ async def _handle_join_room(ws: WebSocket, data: Dict[str, Any]) -> Room | None:
             exclude=ws,
         )
         # Send current game state to the reconnected player
-        if room.game is not None:
-            state = serialize_game_state(room.game, player_index, last_move=room.last_move)
-            state["your_player_index"] = player_index
-            state["move_history"] = room.move_history
-            state["ai_players"] = sorted(room.ai_players)
-            state["turn_time_limit"] = room.turn_time_limit
-            state["turn_time_remaining"] = room.turn_time_remaining()
-            state["game_clock"] = room.clock_snapshot()
-            await ws.send_json(state)
+        await room.resend_game_state(ws)
         return room
 
     if room.started:
@@ -528,7 +615,7 @@ async def _handle_join_room(ws: WebSocket, data: Dict[str, Any]) -> Room | None:
         return None
 
     player_index = room.add_player(player_name, ws)
-    await ws.send_json({
+    await room.send(ws, {
         "type": "room_joined",
         "room_code": room.code,
         "player_index": player_index,
@@ -548,17 +635,17 @@ async def _handle_join_room(ws: WebSocket, data: Dict[str, Any]) -> Room | None:
 async def _handle_start_game(ws: WebSocket, room: Room):
     """Start the game in the room (host only, with enough players)."""
     if room.started:
-        await _send_error(ws, "Game already started")
+        await _send_error(ws, "Game already started", room)
         return
 
     # Only the host (first player) can start — the client only shows the
     # button to the host, but the action must be enforced server-side too
     if room.get_player_index(ws) != 0:
-        await _send_error(ws, "Only the host can start the game")
+        await _send_error(ws, "Only the host can start the game", room)
         return
 
     if room.player_count < 2:
-        await _send_error(ws, "Need at least 2 players to start")
+        await _send_error(ws, "Need at least 2 players to start", room)
         return
 
     # Randomize player order
@@ -569,7 +656,7 @@ async def _handle_start_game(ws: WebSocket, room: Room):
         i for i, p in enumerate(room.players) if p.get("difficulty") is not None
     }
 
-    room.game = GameState(num_players=room.player_count)
+    room.game = GameState(num_players=room.player_count, compact_board=True)
     # Overwrite default player names with the ones chosen in the lobby
     for i, player_info in enumerate(room.players):
         room.game.players[i].name = player_info["name"]
@@ -589,17 +676,17 @@ async def _handle_start_game(ws: WebSocket, room: Room):
 async def _handle_add_ai(ws: WebSocket, room: Room, data: Dict[str, Any]):
     """Add an AI player to the room (host only, before game starts)."""
     if room.started:
-        await _send_error(ws, "Game already started")
+        await _send_error(ws, "Game already started", room)
         return
 
     # Only the host (first player) can add AI players
     host_idx = room.get_player_index(ws)
     if host_idx != 0:
-        await _send_error(ws, "Only the host can add AI players")
+        await _send_error(ws, "Only the host can add AI players", room)
         return
 
     if room.player_count >= 4:
-        await _send_error(ws, "Room is full")
+        await _send_error(ws, "Room is full", room)
         return
 
     difficulty = data.get("difficulty", "easy")
@@ -632,41 +719,41 @@ async def _handle_place_tile(ws: WebSocket, room: Room, data: Dict[str, Any]):
     """Place a tile on the board."""
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index != game.current_player_idx:
-        await _send_error(ws, "Not your turn")
+        await _send_error(ws, "Not your turn", room)
         return
 
     pos = _get_board_position(game, data)
     tile_idx = _get_int(data, "tile_idx")
 
     if pos is None or tile_idx is None:
-        await _send_error(ws, "Missing or invalid row, col, or tile_idx")
+        await _send_error(ws, "Missing or invalid row, col, or tile_idx", room)
         return
     row, col = pos
 
     if not 0 <= tile_idx < len(game.current_player.rack):
-        await _send_error(ws, "Invalid tile_idx")
+        await _send_error(ws, "Invalid tile_idx", room)
         return
 
     designated_letter = data.get("designated_letter")
     if designated_letter is not None:
         if not isinstance(designated_letter, str) or designated_letter.lower() not in _VALID_LETTERS:
-            await _send_error(ws, "Invalid designated_letter")
+            await _send_error(ws, "Invalid designated_letter", room)
             return
 
     if _is_force_pending(room):
-        await _send_error(ws, "Oota, kuni kõik mängijad on programmi arvates lubamatu sõna heaks kiitnud")
+        await _send_error(ws, "Oota, kuni kõik mängijad on programmi arvates lubamatu sõna heaks kiitnud", room)
         return
 
     room.clear_challenge()  # Next player is acting, challenge window closed
 
     success = game.place_tile(row, col, tile_idx, designated_letter=designated_letter)
     if not success:
-        await _send_error(ws, "Invalid tile placement")
+        await _send_error(ws, "Invalid tile placement", room)
         return
 
     game.validate_current_placement()
@@ -677,23 +764,23 @@ async def _handle_remove_tile(ws: WebSocket, room: Room, data: Dict[str, Any]):
     """Remove a previously placed tile from the board."""
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index != game.current_player_idx:
-        await _send_error(ws, "Not your turn")
+        await _send_error(ws, "Not your turn", room)
         return
 
     pos = _get_board_position(game, data)
     if pos is None:
-        await _send_error(ws, "Missing or invalid row or col")
+        await _send_error(ws, "Missing or invalid row or col", room)
         return
     row, col = pos
 
     success = game.remove_tile(row, col)
     if not success:
-        await _send_error(ws, "Cannot remove tile")
+        await _send_error(ws, "Cannot remove tile", room)
         return
 
     game.validate_current_placement()
@@ -704,12 +791,12 @@ async def _do_commit(ws: WebSocket, room: Room, force: bool = False):
     """Shared commit logic for normal and forced commits."""
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index != game.current_player_idx:
-        await _send_error(ws, "Not your turn")
+        await _send_error(ws, "Not your turn", room)
         return
 
     # Capture move details before commit (commit clears current_turn_tiles)
@@ -722,14 +809,12 @@ async def _do_commit(ws: WebSocket, room: Room, force: bool = False):
     words = [{"word": w, "score": s} for w, s in score_breakdown]
     total_score = sum(s for _, s in score_breakdown)
 
-    # Save snapshot for potential challenge undo
-    room.save_snapshot(player_name)
-
     success = game.commit_turn(force=force, defer_draw=True)
     if not success:
-        room.clear_challenge()
-        await _send_error(ws, "Invalid placement — cannot commit")
+        await _send_error(ws, "Invalid placement — cannot commit", room)
         return
+    # The commit is journaled; a successful challenge undoes it
+    room.open_challenge(player_name)
 
     room.record_move({
         "action": "word",
@@ -787,7 +872,7 @@ async def _handle_force_commit(ws: WebSocket, room: Room):
     unopposed, so force-commit is rejected outright (see issue #37).
     """
     if not _has_human_opponent(room, room.get_player_index(ws)):
-        await _send_error(ws, "Arvuti vastu ei saa sõnastikuväliseid sõnu mängida")
+        await _send_error(ws, "Arvuti vastu ei saa sõnastikuväliseid sõnu mängida", room)
         return
     await _do_commit(ws, room, force=True)
 
@@ -796,16 +881,16 @@ async def _handle_pass_turn(ws: WebSocket, room: Room):
     """Pass (forfeit) the current turn."""
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index != game.current_player_idx:
-        await _send_error(ws, "Not your turn")
+        await _send_error(ws, "Not your turn", room)
         return
 
     if _is_force_pending(room):
-        await _send_error(ws, "Oota, kuni kõik mängijad on programmi arvates lubamatu sõna heaks kiitnud")
+        await _send_error(ws, "Oota, kuni kõik mängijad on programmi arvates lubamatu sõna heaks kiitnud", room)
         return
 
     player_name = game.players[player_index].name
@@ -835,12 +920,12 @@ async def _handle_exchange_tiles(ws: WebSocket, room: Room, data: Dict[str, Any]
     """Exchange selected tiles with the bag."""
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index != game.current_player_idx:
-        await _send_error(ws, "Not your turn")
+        await _send_error(ws, "Not your turn", room)
         return
 
     tile_indices = data.get("tile_indices")
@@ -849,11 +934,11 @@ async def _handle_exchange_tiles(ws: WebSocket, room: Room, data: Dict[str, Any]
         or len(tile_indices) > 7
         or not all(isinstance(i, int) and not isinstance(i, bool) for i in tile_indices)
     ):
-        await _send_error(ws, "Missing or invalid tile_indices")
+        await _send_error(ws, "Missing or invalid tile_indices", room)
         return
 
     if _is_force_pending(room):
-        await _send_error(ws, "Oota, kuni kõik mängijad on programmi arvates lubamatu sõna heaks kiitnud")
+        await _send_error(ws, "Oota, kuni kõik mängijad on programmi arvates lubamatu sõna heaks kiitnud", room)
         return
 
     player_name = game.players[player_index].name
@@ -862,7 +947,7 @@ async def _handle_exchange_tiles(ws: WebSocket, room: Room, data: Dict[str, Any]
 
     success = game.exchange_tiles(tile_indices)
     if not success:
-        await _send_error(ws, "Cannot exchange tiles")
+        await _send_error(ws, "Cannot exchange tiles", room)
         return
 
     room.record_move({
@@ -890,24 +975,24 @@ async def _handle_designate_blank(ws: WebSocket, room: Room, data: Dict[str, Any
     """
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index != game.current_player_idx:
-        await _send_error(ws, "Not your turn")
+        await _send_error(ws, "Not your turn", room)
         return
 
     pos = _get_board_position(game, data)
     letter = data.get("letter")
 
     if pos is None or not isinstance(letter, str) or letter.lower() not in _VALID_LETTERS:
-        await _send_error(ws, "Missing or invalid row, col, or letter")
+        await _send_error(ws, "Missing or invalid row, col, or letter", room)
         return
     row, col = pos
 
     if pos not in game.current_turn_tiles or pos not in game.blank_designations:
-        await _send_error(ws, "No blank tile at that position")
+        await _send_error(ws, "No blank tile at that position", room)
         return
 
     game.board[row][col] = letter.lower()
@@ -959,7 +1044,7 @@ async def _handle_force_ack(ws: WebSocket, room: Room):
         "text": f"{player_name} kiitis sõna heaks.",
     })
 
-    # While a challenge against this word is pending, keep the snapshot —
+    # While a challenge against this word is pending, keep it undoable —
     # clearing it here would make a later challenge-accept silently fail
     # (issue #36). The challenge resolution or the next player's action
     # finishes the cleanup.
@@ -976,27 +1061,27 @@ async def _handle_challenge(ws: WebSocket, room: Room):
     """A player challenges the last committed word. Asks the challenged player to undo."""
     game = room.game
     if game is None or game.game_over:
-        await _send_error(ws, "Game not active")
+        await _send_error(ws, "Game not active", room)
         return
 
-    if room._challengeable_player is None or room._pre_commit_snapshot is None:
-        await _send_error(ws, "Nothing to challenge")
+    if room._challengeable_player is None or room._challengeable_turn is None:
+        await _send_error(ws, "Nothing to challenge", room)
         return
 
     challenger_index = room.get_player_index(ws)
     if challenger_index is None:
-        await _send_error(ws, "You are not in this room")
+        await _send_error(ws, "You are not in this room", room)
         return
     challenger_name = room.players[challenger_index]["name"]
 
     # Can't challenge your own move
     if challenger_name == room._challengeable_player:
-        await _send_error(ws, "You cannot challenge your own move")
+        await _send_error(ws, "You cannot challenge your own move", room)
         return
 
     # Already a pending challenge
     if room._challenge_pending is not None:
-        await _send_error(ws, "A challenge is already pending")
+        await _send_error(ws, "A challenge is already pending", room)
         return
 
     room._challenge_pending = {
@@ -1019,24 +1104,24 @@ async def _handle_challenge(ws: WebSocket, room: Room):
 async def _handle_challenge_accept(ws: WebSocket, room: Room):
     """The challenged player accepts — undo their last move."""
     if room._challenge_pending is None:
-        await _send_error(ws, "No pending challenge")
+        await _send_error(ws, "No pending challenge", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index is None:
-        await _send_error(ws, "You are not in this room")
+        await _send_error(ws, "You are not in this room", room)
         return
     player_name = room.players[player_index]["name"]
 
     if player_name != room._challenge_pending["challenged"]:
-        await _send_error(ws, "Only the challenged player can accept")
+        await _send_error(ws, "Only the challenged player can accept", room)
         return
 
     challenger = room._challenge_pending["challenger"]
     challenged = room._challenge_pending["challenged"]
 
-    if not room.restore_snapshot():
-        await _send_error(ws, "Cannot undo — no snapshot available")
+    if not room.undo_challenged_move():
+        await _send_error(ws, "Cannot undo — the move is no longer the last one", room)
         return
 
     room.record_move({
@@ -1064,23 +1149,23 @@ async def _handle_challenge_accept(ws: WebSocket, room: Room):
 async def _handle_challenge_refuse(ws: WebSocket, room: Room):
     """The challenged player refuses — game continues as-is."""
     if room._challenge_pending is None:
-        await _send_error(ws, "No pending challenge")
+        await _send_error(ws, "No pending challenge", room)
         return
 
     player_index = room.get_player_index(ws)
     if player_index is None:
-        await _send_error(ws, "You are not in this room")
+        await _send_error(ws, "You are not in this room", room)
         return
     player_name = room.players[player_index]["name"]
 
     if player_name != room._challenge_pending["challenged"]:
-        await _send_error(ws, "Only the challenged player can refuse")
+        await _send_error(ws, "Only the challenged player can refuse", room)
         return
 
     challenger = room._challenge_pending["challenger"]
     challenged = room._challenge_pending["challenged"]
 
-    # Clear the pending challenge but keep the snapshot — others can still challenge
+    # Clear the pending challenge but keep the move undoable — others can still challenge
     room._challenge_pending = None
 
     await room.broadcast({
@@ -1109,7 +1194,7 @@ async def _dispatch(ws: WebSocket, room: Room | None, data: Dict[str, Any]) -> R
         return (await _handle_join_room(ws, data)) or room
 
     elif room is None:
-        await _send_error(ws, "Join or create a room first")
+        await _send_error(ws, "Join or create a room first", room)
 
     elif action == "start_game":
         await _handle_start_game(ws, room)
@@ -1153,8 +1238,12 @@ async def _dispatch(ws: WebSocket, room: Room | None, data: Dict[str, Any]) -> R
     elif action == "challenge_refuse":
         await _handle_challenge_refuse(ws, room)
 
+    elif action == "resync":
+        # The client's state version did not match a delta's base
+        await room.resend_game_state(ws)
+
     else:
-        await _send_error(ws, f"Unknown action: {action}")
+        await _send_error(ws, f"Unknown action: {action}", room)
 
     return room
 
@@ -1225,11 +1314,11 @@ async def websocket_endpoint(ws: WebSocket):
                 raise
             except Exception:
                 # Not JSON / binary frame
-                await _send_error(ws, "Message must be a JSON object")
+                await _send_error(ws, "Message must be a JSON object", room)
                 continue
 
             if not isinstance(data, dict):
-                await _send_error(ws, "Message must be a JSON object")
+                await _send_error(ws, "Message must be a JSON object", room)
                 continue
 
             try:
@@ -1238,7 +1327,7 @@ async def websocket_endpoint(ws: WebSocket):
                 raise
             except Exception:
                 logger.exception("Unhandled error for action %r", data.get("action"))
-                await _send_error(ws, f"Invalid request: {data.get('action')!r}")
+                await _send_error(ws, f"Invalid request: {data.get('action')!r}", room)
 
     except WebSocketDisconnect:
         pass
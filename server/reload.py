@@ -0,0 +1,183 @@
+"""Hot reload of the dictionaries in a running server.
+
+Editing data/blocked_words.txt or data/extra_words.txt used to take a
+redeploy: every room kept validating against the dictionaries loaded at
+startup, and the new process rebuilt them before it could serve. The
+:class:`DictionaryReloader` rebuilds and reloads them in place:
+
+- a reload is requested from the admin endpoint, or by :meth:`watch`
+  when the contents of the dictionary source files change;
+- the rebuild (patching, the incremental DAWG update) and the loading
+  run on a background thread (:func:`wordlist.reload_shared_wordlist`)
+  and are swapped into the shared WordList at once: AI searches already
+  running finish on the old dictionaries, new lookups use the new ones;
+- callbacks then drop what the server derived from the old ones (the
+  games' cross-check caches, the AI workers' mapped graphs);
+- :meth:`DictionaryReloader.stats` reports the status for ``/stats``.
+
+One reload runs at a time; requests made meanwhile run once after it.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from tools.build_cache import file_digest
+from tools.build_dawg import BLOCKED_FILE
+from tools.patch_dictionary import BLOCKED_STEMS_FILE, DICT_DIR, EXTRA_WORDS_FILE, SOURCE_BASE
+from wordlist import reload_shared_wordlist
+
+logger = logging.getLogger(__name__)
+
+WATCH_ENV = "DICTIONARY_WATCH"
+# Seconds between checks of the source files; 0 disables watching
+DEFAULT_WATCH_INTERVAL = 30.0
+
+# What the dictionaries are built from, other than the code
+WATCHED_FILES = (
+    BLOCKED_FILE,
+    EXTRA_WORDS_FILE,
+    BLOCKED_STEMS_FILE,
+    os.path.join(DICT_DIR, SOURCE_BASE + ".dic"),
+    os.path.join(DICT_DIR, SOURCE_BASE + ".aff"),
+)
+
+
+def watch_interval() -> float:
+    """Watch interval from ``DICTIONARY_WATCH`` (seconds), else the default."""
+    value = os.environ.get(WATCH_ENV)
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", WATCH_ENV, value)
+    return DEFAULT_WATCH_INTERVAL
+
+
+class DictionaryReloader:
+    """Reloads the shared dictionaries on request, one reload at a time.
+
+    Used from the event loop only; the reload itself runs on a thread.
+    """
+
+    def __init__(self, reload: Callable[[], Any] = reload_shared_wordlist,
+                 paths: Sequence[str] = WATCHED_FILES):
+        self._reload = reload
+        self.paths = list(paths)
+        self._callbacks: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        # Trigger of a reload requested while one was running
+        self._pending: Optional[str] = None
+        self._watching: Optional[float] = None
+        self._reloads = 0
+        self._failures = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    def on_reloaded(self, callback: Callable[[], None]) -> None:
+        """Call *callback* on the event loop after each successful reload."""
+        self._callbacks.append(callback)
+
+    @property
+    def reloading(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def request(self, trigger: str) -> bool:
+        """Start a reload; *trigger* says why, for the stats.
+
+        Returns False if one is already running: the new request then
+        runs once after it, since the files may have changed again.
+        """
+        if self.reloading:
+            self._pending = trigger
+            return False
+        self._task = asyncio.get_running_loop().create_task(self._run(trigger))
+        return True
+
+    async def wait(self) -> None:
+        """Wait for the running reload, if any (tests and shutdown)."""
+        while self.reloading:
+            await asyncio.shield(self._task)
+
+    async def _run(self, trigger: Optional[str]) -> None:
+        while trigger is not None:
+            finished = await self._reload_once(trigger)
+            self._last = finished
+            trigger, self._pending = self._pending, None
+
+    async def _reload_once(self, trigger: str) -> Dict[str, Any]:
+        logger.info("Reloading dictionaries (%s)", trigger)
+        t0 = time.monotonic()
+        error = None
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._reload)
+        except Exception as e:
+            logger.exception("Dictionary reload failed; keeping the loaded dictionaries")
+            error = f"{type(e).__name__}: {e}"
+            self._failures += 1
+        else:
+            self._reloads += 1
+            for callback in self._callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Dictionary reload callback failed")
+        seconds = time.monotonic() - t0
+        logger.info("Dictionary reload (%s) finished in %.1fs", trigger, seconds)
+        return {
+            "trigger": trigger,
+            "ok": error is None,
+            "error": error,
+            "seconds": round(seconds, 3),
+            "finished_at": time.time(),
+        }
+
+    # -- file watching ----------------------------------------------------------
+
+    def _stat_signature(self) -> Tuple:
+        signature = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _digests(self) -> Tuple[Optional[str], ...]:
+        return tuple(file_digest(path) for path in self.paths)
+
+    async def watch(self, interval: float) -> None:
+        """Poll the source files every *interval* seconds; reload when their contents change.
+
+        Only a changed modification time or size is checked for on each
+        poll; the contents are hashed then, so a touched but unchanged
+        file (a checkout) does not reload. Runs until cancelled.
+        """
+        self._watching = interval
+        try:
+            signature = self._stat_signature()
+            digests = await asyncio.get_running_loop().run_in_executor(None, self._digests)
+            while True:
+                await asyncio.sleep(interval)
+                current = self._stat_signature()
+                if current == signature:
+                    continue
+                signature = current
+                changed = await asyncio.get_running_loop().run_in_executor(None, self._digests)
+                if changed != digests:
+                    digests = changed
+                    self.request("watch")
+        finally:
+            self._watching = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Reload status and the last reload's outcome, for ``/stats``."""
+        return {
+            "status": "reloading" if self.reloading else "idle",
+            "watch_interval": self._watching,
+            "reloads": self._reloads,
+            "failures": self._failures,
+            "last": dict(self._last) if self._last is not None else None,
+        }
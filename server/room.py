@@ -1,15 +1,60 @@
-"""Room management for multiplayer Scrabble over WebSockets."""
+"""Room management for multiplayer Scrabble over WebSockets.
+
+Broadcasts fan out concurrently. Each connection has a bounded, ordered
+outbox drained by its own task (:class:`_Outbox`), so one slow phone or
+a hung socket cannot hold up the others:
+
+- a broadcast waits at most ``SEND_TIMEOUT`` for each recipient; one
+  that misses it is marked lagging and is not waited for again until
+  its outbox drains (its messages still arrive, in order);
+- a connection with ``MAX_QUEUED_MESSAGES`` undelivered messages, whose
+  send takes longer than ``DROP_TIMEOUT``, or whose send fails is
+  dropped: its socket is closed, and the endpoint's cleanup frees or
+  preserves the player's slot as for any disconnect;
+- :meth:`Room.send_stats` reports send latency per room for ``/stats``.
+
+Game state goes out as versioned deltas (:meth:`Room.broadcast_game_state`):
+each outbox remembers the last state queued to its player, which the
+next update is diffed against, so a new connection gets a full snapshot.
+The board and the move history are not diffed: the room logs the cells
+each version changed (:class:`_BoardLog`) and each outbox how much
+history it was sent.
+"""
 
 import asyncio
+import logging
 import random
 import string
-from typing import Any, Dict, List, Optional, Set
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
-from game.state import GameState
+from game.board import board_rows
+from game.state import GameState, TurnDelta
 
-from .serialization import serialize_game_over, serialize_game_state
+from .serialization import (
+    diff_game_state,
+    player_game_state,
+    serialize_board,
+    serialize_game_over,
+    shared_game_state,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds a broadcast waits for a recipient before marking it lagging
+SEND_TIMEOUT = 2.0
+# Seconds one send may take before the connection is dropped as hung
+DROP_TIMEOUT = 15.0
+# Undelivered messages per connection before it is dropped
+MAX_QUEUED_MESSAGES = 64
+# WebSocket close code for a dropped connection ("try again later")
+_DROP_CLOSE_CODE = 1013
+
+# A changed board square and its letter (None: emptied)
+Cell = Tuple[int, int, Optional[str]]
 
 
 def _generate_room_code(length: int = 4) -> str:
@@ -17,6 +62,139 @@ def _generate_room_code(length: int = 4) -> str:
     return "".join(random.choices(string.ascii_uppercase, k=length))
 
 
+class _Outbox:
+    """Ordered, bounded queue of one connection's outgoing messages.
+
+    A writer task exists only while messages are queued. Each message
+    comes with a future that resolves once it is sent (True) or the
+    connection fails (False).
+    """
+
+    def __init__(self, ws: WebSocket, on_sent: Callable[[float], None],
+                 on_failed: Callable[["_Outbox", str], None]):
+        self.ws = ws
+        self.lagging = False
+        self.closed = False
+        # The last game state queued (without board and history): the base of the next delta
+        self.sent_state: Optional[Dict[str, Any]] = None
+        # Length of the move history as of sent_state
+        self.sent_history = 0
+        self._queue: Deque[Tuple[Any, asyncio.Future, float]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._on_sent = on_sent
+        self._on_failed = on_failed
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def put(self, message: Any) -> Optional[asyncio.Future]:
+        """Queue *message*; None if the outbox is full or closed."""
+        if self.closed or len(self._queue) >= MAX_QUEUED_MESSAGES:
+            return None
+        loop = asyncio.get_running_loop()
+        sent = loop.create_future()
+        self._queue.append((message, sent, time.perf_counter()))
+        if self._task is None:
+            self._task = loop.create_task(self._drain())
+        return sent
+
+    async def _drain(self):
+        try:
+            while self._queue:
+                message, sent, queued_at = self._queue[0]
+                try:
+                    await asyncio.wait_for(self.ws.send_json(message), DROP_TIMEOUT)
+                except asyncio.CancelledError:
+                    raise
+                except asyncio.TimeoutError:
+                    self._on_failed(self, f"send took over {DROP_TIMEOUT:g}s")
+                    return
+                except Exception as e:
+                    self._on_failed(self, f"send failed: {e!r}")
+                    return
+                self._queue.popleft()
+                # Queue wait included: what the player experiences
+                self._on_sent(time.perf_counter() - queued_at)
+                if not sent.done():
+                    sent.set_result(True)
+            self.lagging = False
+        finally:
+            self._task = None
+
+    def close(self):
+        """Stop sending; pending messages resolve as not sent."""
+        self.closed = True
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        while self._queue:
+            _, sent, _ = self._queue.popleft()
+            if not sent.done():
+                sent.set_result(False)
+
+
+class _BoardLog:
+    """The board cells each game-state version changed, for the deltas.
+
+    Only the squares a change can have touched are compared with the
+    board as of the previous version: the current turn's tiles then and
+    now, and the tiles of turns committed or undone in between.
+    """
+
+    def __init__(self, size: int = MAX_QUEUED_MESSAGES):
+        self._game: Optional[GameState] = None
+        self._board: List[List[Optional[str]]] = []
+        self._pending: Set[Tuple[int, int]] = set()
+        self._journal: List[TurnDelta] = []
+        # (version, cells changed from the version before)
+        self._log: Deque[Tuple[int, List[Cell]]] = deque(maxlen=size)
+        # Oldest version the cells can be given from
+        self._start = 0
+
+    def record(self, game: GameState, version: int):
+        """Log what *version* changed (versions are recorded in order, one by one)."""
+        if game is not self._game:
+            # A new game: earlier versions are snapshots of another board
+            self._game = game
+            self._board = board_rows(game.board)
+            self._pending = set(game.current_turn_tiles)
+            self._journal = list(game.journal)
+            self._log.clear()
+            self._start = version
+            return
+        # Turns are only appended or undone at the end of the journal
+        journal = game.journal
+        n = min(len(self._journal), len(journal))
+        while n and self._journal[n - 1] is not journal[n - 1]:
+            n -= 1
+        squares = self._pending | game.current_turn_tiles
+        for turn in self._journal[n:] + journal[n:]:
+            squares.update((r, c) for r, c, _ in turn.tiles)
+        self._journal[n:] = journal[n:]
+        self._pending = set(game.current_turn_tiles)
+
+        board, cells = game.board, []
+        for r, c in sorted(squares):
+            letter = board[r][c]
+            if letter != self._board[r][c]:
+                self._board[r][c] = letter
+                cells.append((r, c, letter))
+        self._log.append((version, cells))
+        if len(self._log) == self._log.maxlen:
+            self._start = max(self._start, self._log[0][0] - 1)
+
+    def since(self, version: int) -> Optional[List[Cell]]:
+        """Cells changed after *version*, or None if that is no longer known."""
+        if version < self._start:
+            return None
+        changed: Dict[Tuple[int, int], Optional[str]] = {}
+        for logged, cells in reversed(self._log):
+            if logged <= version:
+                break
+            for r, c, letter in cells:
+                changed.setdefault((r, c), letter)
+        return [(r, c, letter) for (r, c), letter in sorted(changed.items())]
+
+
 class Room:
     """A single game room holding a WebSocket connection per player.
 
@@ -46,13 +224,22 @@ class Room:
         self._clock_started_at: Optional[float] = None
         # AI player tracking — indices of players controlled by the AI engine
         self.ai_players: Set[int] = set()
-        # Challenge support: snapshot of game state before last commit
-        self._pre_commit_snapshot: Optional[GameState] = None
+        # Challenge support: the last committed turn, undone on a successful challenge
+        self._challengeable_turn: Optional[TurnDelta] = None
         self._challengeable_player: Optional[str] = None  # name of player whose move can be challenged
         self._challenge_pending: Optional[Dict[str, Any]] = None  # active challenge info
         # Track which players have acknowledged a forced word
         self._force_acks: set = set()  # player indices who clicked OK
         self._force_required_acks: set = set()  # player indices who must acknowledge
+        # Outgoing message queues by id() of the WebSocket (starlette's is unhashable)
+        self._outboxes: Dict[int, _Outbox] = {}
+        self._send_counts = {"sent": 0, "lagged": 0, "dropped": 0}
+        self._send_latencies: Deque[float] = deque(maxlen=100)
+        # Closes of dropped sockets in progress (the loop keeps only weak references)
+        self._closing: Set[asyncio.Task] = set()
+        # Version of the last game state broadcast; only ever grows
+        self.state_version = 0
+        self._board_log = _BoardLog()
 
     @property
     def player_count(self) -> int:
@@ -82,6 +269,7 @@ class Room:
 
     def disconnect_player(self, ws: WebSocket) -> Optional[int]:
         """Mark a player as disconnected (preserve slot). Return index or None."""
+        self._close_outbox(ws)
         for i, player in enumerate(self.players):
             if player["ws"] is ws:
                 player["ws"] = None
@@ -90,6 +278,7 @@ class Room:
 
     def remove_player(self, ws: WebSocket) -> Optional[int]:
         """Remove a player entirely (pre-game only). Return index or None."""
+        self._close_outbox(ws)
         for i, player in enumerate(self.players):
             if player["ws"] is ws:
                 self.players.pop(i)
@@ -184,70 +373,117 @@ class Room:
 
     async def broadcast(self, message: Dict[str, Any], exclude: Optional[WebSocket] = None):
         """Send a JSON message to all connected players, optionally excluding one."""
-        for player in self.players:
-            ws = player["ws"]
-            if ws is not None and ws is not exclude:
-                await ws.send_json(message)
+        await self._fan_out([
+            (player["ws"], message) for player in self.players
+            if player["ws"] is not None and player["ws"] is not exclude
+        ])
+
+    # ---- Outgoing messages ----
+
+    async def send(self, ws: WebSocket, message: Dict[str, Any]):
+        """Send a JSON message to one connection, in order with the room's updates."""
+        await self._fan_out([(ws, message)])
 
-    def save_snapshot(self, player_name: str):
-        """Save a lightweight snapshot of mutable game state before a commit.
+    async def _fan_out(self, messages: List[Tuple[WebSocket, Any]]):
+        """Queue each (socket, message) and wait for delivery, concurrently.
 
-        Only copies the data that changes during a commit (board, racks,
-        scores, tile bag, etc.) — NOT the heavy WordList/Hunspell dictionary.
+        Waits up to ``SEND_TIMEOUT`` for recipients that are keeping up;
+        lagging ones are not waited for. A full outbox drops its socket.
         """
-        game = self.game
-        if game is None:
+        waiting = []
+        for ws, message in messages:
+            outbox = self._outbox(ws)
+            sent = outbox.put(message)
+            if sent is None:
+                self._drop(outbox, f"{MAX_QUEUED_MESSAGES} messages undelivered")
+            elif not outbox.lagging:
+                waiting.append((outbox, sent))
+        if not waiting:
             return
-        self._pre_commit_snapshot = {
-            "board": [row[:] for row in game.board],
-            "players": [
-                {"name": p.name, "score": p.score, "rack": p.rack[:]}
-                for p in game.players
-            ],
-            "tile_bag": game.tile_bag[:],
-            "current_player_idx": game.current_player_idx,
-            "current_turn_tiles": set(game.current_turn_tiles),
-            "blank_designations": dict(game.blank_designations),
-            "consecutive_passes": game.consecutive_passes,
-            "game_over": game.game_over,
-            "first_move": game.first_move,
-            "end_game_applied": getattr(game, "_end_game_applied", False),
-            "end_game_details": [
-                dict(d) for d in getattr(game, "end_game_details", [])
-            ],
+        done, _ = await asyncio.wait([sent for _, sent in waiting], timeout=SEND_TIMEOUT)
+        for outbox, sent in waiting:
+            if sent not in done and not outbox.closed:
+                outbox.lagging = True
+                self._send_counts["lagged"] += 1
+                logger.info("Room %s: a client is lagging (%d messages queued)",
+                            self.code, len(outbox))
+
+    def _outbox(self, ws: WebSocket) -> _Outbox:
+        outbox = self._outboxes.get(id(ws))
+        if outbox is None or outbox.ws is not ws:
+            outbox = self._outboxes[id(ws)] = _Outbox(ws, self._record_sent, self._drop)
+        return outbox
+
+    def _record_sent(self, seconds: float):
+        self._send_counts["sent"] += 1
+        self._send_latencies.append(seconds)
+
+    def _drop(self, outbox: _Outbox, reason: str):
+        """Give up on a connection: close its socket, which ends its session."""
+        if outbox.closed:
+            return
+        outbox.close()
+        self._send_counts["dropped"] += 1
+        logger.warning("Room %s: dropping a client (%s)", self.code, reason)
+        task = asyncio.get_running_loop().create_task(self._close_socket(outbox.ws))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_socket(ws: WebSocket):
+        try:
+            await asyncio.wait_for(ws.close(code=_DROP_CLOSE_CODE), DROP_TIMEOUT)
+        except Exception:
+            pass  # already gone
+
+    def _close_outbox(self, ws: WebSocket):
+        outbox = self._outboxes.get(id(ws))
+        if outbox is not None and outbox.ws is ws:
+            del self._outboxes[id(ws)]
+            outbox.close()
+
+    def close_outboxes(self):
+        """Stop all sending (the room is being removed)."""
+        for outbox in self._outboxes.values():
+            outbox.close()
+        self._outboxes.clear()
+
+    def send_stats(self) -> Dict[str, Any]:
+        """Delivery counters and recent send latency, for ``/stats``."""
+        latencies = [s * 1000 for s in self._send_latencies]
+        return {
+            **self._send_counts,
+            "lagging": sum(1 for outbox in self._outboxes.values() if outbox.lagging),
+            "queued": sum(len(outbox) for outbox in self._outboxes.values()),
+            "latency_ms": {
+                "avg": round(sum(latencies) / len(latencies), 1) if latencies else None,
+                "max": round(max(latencies), 1) if latencies else None,
+            },
         }
+
+    def open_challenge(self, player_name: str):
+        """Make the turn *player_name* just committed challengeable.
+
+        Nothing is copied: the game's journal already holds the commit as
+        a reversible delta (``GameState.journal``).
+        """
+        game = self.game
+        if game is None or not game.journal:
+            return
+        self._challengeable_turn = game.journal[-1]
         self._challengeable_player = player_name
         self._challenge_pending = None
 
-    def restore_snapshot(self) -> bool:
-        """Restore game state from the saved snapshot. Returns True on success."""
-        snap = self._pre_commit_snapshot
-        if snap is None or self.game is None:
-            return False
+    def undo_challenged_move(self) -> bool:
+        """Take back the challengeable turn. Returns True on success."""
+        turn = self._challengeable_turn
         game = self.game
-        game.board = [row[:] for row in snap["board"]]
-        for i, pdata in enumerate(snap["players"]):
-            game.players[i].name = pdata["name"]
-            game.players[i].score = pdata["score"]
-            game.players[i].rack = pdata["rack"][:]
-        game.tile_bag = snap["tile_bag"][:]
-        game.current_player_idx = snap["current_player_idx"]
-        game.current_turn_tiles = set(snap["current_turn_tiles"])
-        game.blank_designations = dict(snap["blank_designations"])
-        game.consecutive_passes = snap["consecutive_passes"]
-        game.game_over = snap["game_over"]
-        game.first_move = snap["first_move"]
-        # Undo any end-game adjustment applied by the retracted move —
-        # otherwise the guard flag stays set and the real game end would
-        # silently skip the tile adjustment (issue #36).
-        game._end_game_applied = snap["end_game_applied"]
-        game.end_game_details = [dict(d) for d in snap["end_game_details"]]
-        # Clear deferred draw — move is being undone, no tiles should be drawn
-        game._deferred_draw_count = 0
-        game._deferred_draw_player_idx = None
+        if turn is None or game is None or not game.journal or game.journal[-1] is not turn:
+            return False
+        game.undo_last_commit()
         # Re-validate so word_validator state is consistent
         game.validate_current_placement()
-        self._pre_commit_snapshot = None
+        self._challengeable_turn = None
         self._challengeable_player = None
         self._challenge_pending = None
         self._force_acks.clear()
@@ -268,7 +504,7 @@ class Room:
             return
         if self.game is not None and self.game.has_deferred_draw:
             self.game.draw_deferred_tiles()
-        self._pre_commit_snapshot = None
+        self._challengeable_turn = None
         self._challengeable_player = None
         self._challenge_pending = None
         self._force_acks.clear()
@@ -296,22 +532,55 @@ class Room:
             self._force_acks.add(player_index)
         return self._force_required_acks.issubset(self._force_acks)
 
-    async def broadcast_game_state(self):
-        """Send each player a personalised game-state snapshot (own rack only)."""
-        if self.game is None:
+    async def broadcast_game_state(self, only: Optional[WebSocket] = None):
+        """Send each player their personalised game state (own rack only).
+
+        Each update gets the next :attr:`state_version`. A player whose
+        connection was sent a state before gets the ``game_state_delta``
+        from it (:func:`diff_game_state`), anyone else the full snapshot.
+        What all players share is serialized once, and the board and the
+        history only for snapshots. *only* limits the update to one
+        connection.
+        """
+        game = self.game
+        if game is None:
             return
+        self.state_version += 1
+        self._board_log.record(game, self.state_version)
+        shared = shared_game_state(game, last_move=self.last_move)
+        shared["ai_players"] = sorted(self.ai_players)
+        shared["turn_time_limit"] = self.turn_time_limit
+        shared["turn_time_remaining"] = self.turn_time_remaining()
+        shared["game_clock"] = self.clock_snapshot()
+        shared["state_version"] = self.state_version
+        board = history = None
+        messages = []
         for i, player in enumerate(self.players):
             ws = player["ws"]
-            if ws is None:
+            if ws is None or (only is not None and ws is not only):
                 continue
-            state = serialize_game_state(self.game, i, last_move=self.last_move)
+            state = player_game_state(game, shared, i)
             state["your_player_index"] = i
-            state["move_history"] = self.move_history
-            state["ai_players"] = sorted(self.ai_players)
-            state["turn_time_limit"] = self.turn_time_limit
-            state["turn_time_remaining"] = self.turn_time_remaining()
-            state["game_clock"] = self.clock_snapshot()
-            await ws.send_json(state)
+            outbox = self._outbox(ws)
+            base = outbox.sent_state
+            cells = None if base is None else self._board_log.since(base["state_version"])
+            if cells is None:
+                if board is None:
+                    # A copy: the room's list grows in place while this may still be queued
+                    board, history = serialize_board(game), list(self.move_history)
+                message = {**state, "board": board, "move_history": history}
+            else:
+                message = diff_game_state(base, state, cells,
+                                          self.move_history[outbox.sent_history:])
+            outbox.sent_state = state
+            outbox.sent_history = len(self.move_history)
+            messages.append((ws, message))
+        await self._fan_out(messages)
+
+    async def resend_game_state(self, ws: WebSocket):
+        """Send *ws* a full snapshot (it joined, reconnected or lost track of the version)."""
+        self._outbox(ws).sent_state = None
+        await self.broadcast_game_state(only=ws)
 
     async def broadcast_game_over(self):
         """Send the game-over payload to all players."""
@@ -325,8 +594,10 @@ class Room:
 class RoomManager:
     """Central registry of active rooms."""
 
-    def __init__(self):
+    def __init__(self, on_remove: Optional[Callable[[str], None]] = None):
         self.rooms: Dict[str, Room] = {}
+        # Called with the code of each removed room (drops its AI jobs)
+        self._on_remove = on_remove
 
     def create_room(self) -> Room:
         """Create a new room with a unique code."""
@@ -344,4 +615,8 @@ class RoomManager:
 
     def remove_room(self, code: str):
         """Delete a room from the registry."""
-        self.rooms.pop(code.upper(), None)
+        room = self.rooms.pop(code.upper(), None)
+        if room is not None:
+            room.close_outboxes()
+        if room is not None and self._on_remove is not None:
+            self._on_remove(room.code)
@@ -1,16 +1,14 @@
 """Serialize GameState to JSON-safe dictionaries for WebSocket transport."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from game.board import board_rows
 from game.state import GameState
 
 
 def serialize_board(game: GameState) -> List[List[Optional[str]]]:
     """Return the full 15x15 board as a 2D list of letters (None for empty)."""
-    return [
-        [cell for cell in row]
-        for row in game.board
-    ]
+    return board_rows(game.board)
 
 
 def serialize_current_turn_tiles(game: GameState) -> List[Dict[str, int]]:
@@ -38,26 +36,33 @@ def serialize_players(game: GameState) -> List[Dict[str, Any]]:
     ]
 
 
-def serialize_game_state(
-    game: GameState,
-    player_index: int,
-    last_move: Optional[Dict[str, Any]] = None,
+def shared_game_state(
+    game: GameState, last_move: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """Build the full game-state payload for a specific player.
+    """The game-state fields every player gets alike, without the board.
 
-    Only the requesting player's rack is included (hidden information).
+    Serialized once per broadcast; the board goes in full snapshots only.
     """
     data: Dict[str, Any] = {
         "type": "game_state",
-        "board": serialize_board(game),
         "players": serialize_players(game),
         "current_player_index": game.current_player_idx,
         "tiles_remaining": len(game.tile_bag),
         "game_over": game.game_over,
     }
-
     if last_move is not None:
         data["last_move"] = last_move
+    return data
+
+
+def player_game_state(
+    game: GameState, shared: Dict[str, Any], player_index: int
+) -> Dict[str, Any]:
+    """*shared* plus what only the player at *player_index* sees.
+
+    Only the requesting player's rack is included (hidden information).
+    """
+    data = dict(shared)
 
     # Only send the player's own rack
     if 0 <= player_index < len(game.players):
@@ -76,6 +81,74 @@ def serialize_game_state(
     return data
 
 
+def serialize_game_state(
+    game: GameState,
+    player_index: int,
+    last_move: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build the full game-state payload for a specific player.
+
+    Only the requesting player's rack is included (hidden information).
+    """
+    data = player_game_state(game, shared_game_state(game, last_move), player_index)
+    data["board"] = serialize_board(game)
+    return data
+
+
+# Fields of a game_state payload that diff_game_state diffs piecewise
+_PIECEWISE = frozenset({"type", "state_version", "board", "players", "move_history"})
+
+
+def diff_game_state(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    cells: Sequence[Tuple[int, int, Optional[str]]] = (),
+    history: Sequence[Dict[str, Any]] = (),
+) -> Dict[str, Any]:
+    """The ``game_state_delta`` payload that turns snapshot *old* into *new*.
+
+    Both are a player's game-state payloads with a ``state_version``;
+    the board and the move history are not compared but passed in as
+    what changed since *old*: the board *cells* and the *history*
+    entries appended. The delta carries only what changed: cells as
+    ``[row, col, letter]``, scores as ``[player index, score]``, the
+    appended history, and any other field whose value changed. Clients
+    apply it to the snapshot of ``base_version`` and ask for a full one
+    (``resync``) if that is not what they hold.
+    """
+    delta: Dict[str, Any] = {
+        "type": "game_state_delta",
+        "version": new["state_version"],
+        "base_version": old["state_version"],
+    }
+    if cells:
+        delta["cells"] = [[r, c, letter] for r, c, letter in cells]
+
+    changes: Dict[str, Any] = {}
+    old_players, new_players = old["players"], new["players"]
+    if [p["name"] for p in old_players] != [p["name"] for p in new_players]:
+        changes["players"] = new_players
+    else:
+        scores = [
+            [i, player["score"]] for i, player in enumerate(new_players)
+            if player["score"] != old_players[i]["score"]
+        ]
+        if scores:
+            delta["scores"] = scores
+
+    if history:
+        delta["move_history_append"] = list(history)
+
+    for key, value in new.items():
+        if key not in _PIECEWISE and (key not in old or old[key] != value):
+            changes[key] = value
+    for key in old.keys() - new.keys() - _PIECEWISE:
+        changes[key] = None
+    if changes:
+        delta["changes"] = changes
+    return delta
+
+
 def serialize_game_over(
     game: GameState, time_penalties: Optional[List[int]] = None
 ) -> Dict[str, Any]:
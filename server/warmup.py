@@ -0,0 +1,112 @@
+"""Eager dictionary warm-up at server startup.
+
+After a cold start (fly.io stops idle machines) the first game used to
+pay for Hunspell parsing and the first AI turn for the strict
+dictionary and the DAWG load — seconds each, while a player waited.
+The warm-up loads all three in a background thread as soon as the
+server starts; ``/ready`` reports its progress so the load balancer
+only routes traffic once the first move will be fast.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from wordlist import shared_wordlist
+
+logger = logging.getLogger(__name__)
+
+# Load order matters: the strict dictionary and the DAWG hang off the
+# shared WordList.
+STAGES = ("wordlist", "strict", "dawg")
+
+
+class DictionaryWarmup:
+    """Background preload of the shared dictionaries with per-stage timings.
+
+    Each stage goes pending → loading → done (or failed, when the
+    artifact is unavailable and the server will run degraded: no
+    dictionary, or brute-force AI without the DAWG).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._stages: Dict[str, Dict[str, Any]] = {
+            name: {"status": "pending", "seconds": None} for name in STAGES
+        }
+
+    def start(self):
+        """Start the warm-up thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._started_at = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._run, name="dictionary-warmup", daemon=True
+            )
+            self._thread.start()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the warm-up thread to finish (tests and tools)."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def ready(self) -> bool:
+        """Whether every stage has finished, successfully or not."""
+        with self._lock:
+            return all(
+                s["status"] in ("done", "failed") for s in self._stages.values()
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Progress report for the ``/ready`` endpoint."""
+        with self._lock:
+            stages = {name: dict(s) for name, s in self._stages.items()}
+            started, finished = self._started_at, self._finished_at
+        ready = all(s["status"] in ("done", "failed") for s in stages.values())
+        degraded = any(s["status"] == "failed" for s in stages.values())
+        if started is None:
+            elapsed = None
+        else:
+            elapsed = round((finished or time.monotonic()) - started, 3)
+        return {
+            "ready": ready,
+            "degraded": degraded,
+            "elapsed_seconds": elapsed,
+            "stages": stages,
+        }
+
+    def _run(self):
+        wordlist = self._stage(
+            "wordlist", shared_wordlist, lambda wl: getattr(wl, "_dict", None) is not None
+        )
+        strict = self._stage(
+            "strict", lambda: wordlist.strict, lambda s: getattr(s, "_dict", None) is not None
+        )
+        # The optional GADDAG loads with the DAWG; only the DAWG is required
+        self._stage("dawg", lambda: (strict.gaddag, strict.dawg)[1], lambda d: d is not None)
+        with self._lock:
+            self._finished_at = time.monotonic()
+        logger.info("Dictionary warm-up finished: %s", self.snapshot()["stages"])
+
+    def _stage(self, name: str, load: Callable[[], Any], ok: Callable[[Any], bool]) -> Any:
+        """Run one stage, recording its status and wall-clock time."""
+        with self._lock:
+            self._stages[name]["status"] = "loading"
+        t0 = time.monotonic()
+        result = None
+        try:
+            result = load()
+            status = "done" if ok(result) else "failed"
+        except Exception:
+            logger.exception("Dictionary warm-up stage %r failed", name)
+            status = "failed"
+        with self._lock:
+            self._stages[name]["status"] = status
+            self._stages[name]["seconds"] = round(time.monotonic() - t0, 3)
+        return result
@@ -7,6 +7,7 @@ not safe for it. These tests pin the move generator's behaviour and
 the strict/permissive dictionary asymmetry.
 """
 
+import tracemalloc
 import unittest
 
 try:
@@ -16,7 +17,7 @@ try:
 except ImportError:
     HAS_SPYLLS = False
 
-from game.ai_player import Move, find_all_moves, select_move
+from game.ai_player import Move, _calculate_move_score, find_all_moves, select_move
 
 
 def _empty_board():
@@ -106,6 +107,58 @@ class TestStrongMode(unittest.TestCase):
                 self.assertIsNotNone(move)
 
 
+class _NoCopyRow(list):
+    """A board row that fails the test if anything slices (copies) it."""
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            raise AssertionError("board row copied")
+        return super().__getitem__(index)
+
+
+class TestCopyFreeScoring(unittest.TestCase):
+    """Candidate placements are read through an overlay, never a board copy."""
+
+    WORDS = ["maja", "aja", "ma", "kaja", "kass", "sai", "ka", "saja", "maks"]
+
+    def _board(self):
+        board = _empty_board()
+        for c, ch in enumerate("maja"):
+            board[7][6 + c] = ch
+        for r, ch in enumerate("kass"):
+            board[4 + r][9] = ch if board[4 + r][9] is None else board[4 + r][9]
+        return board
+
+    def test_brute_force_search_does_not_copy_the_board(self):
+        board = self._board()
+        expected = find_all_moves(board, ["k", "a", "s", "i", "j"], FixedWordList(self.WORDS))
+        guarded = [_NoCopyRow(row) for row in board]
+        moves = find_all_moves(guarded, ["k", "a", "s", "i", "j"], FixedWordList(self.WORDS))
+        self.assertTrue(moves)
+        self.assertEqual(
+            sorted((m.tiles, m.raw_score) for m in moves),
+            sorted((m.tiles, m.raw_score) for m in expected),
+        )
+
+    def test_scoring_allocation_ceiling(self):
+        """Scoring a move allocates about a word's worth, not a 15×15 board."""
+        board = self._board()
+        moves = find_all_moves(board, ["k", "a", "s", "i", "j", "m"], FixedWordList(self.WORDS))
+        self.assertTrue(moves)
+        tracemalloc.start()
+        try:
+            worst = 0
+            for move in moves:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                _calculate_move_score(board, move)
+                worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+        # Copying the board alone took ~2.5 KiB per move
+        self.assertLess(worst, 1536)
+
+
 @unittest.skipUnless(HAS_SPYLLS, "spylls not installed")
 class TestStrictDictionaryForAI(unittest.TestCase):
     """The strict/permissive asymmetry that makes the AI safe (issue #33)."""
@@ -5,22 +5,67 @@ the full-dictionary DAWG is exercised by an integration test in
 test_ai_player.py when the built artifact is available.
 """
 
+import copy
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
-from game.ai_player import find_all_moves, select_move
-from game.dawg import Dawg
+from game.ai_player import (
+    _calculate_move_score,
+    _find_all_moves_dawg,
+    _find_all_moves_gaddag,
+    find_all_moves,
+    select_move,
+)
+from game.cross_checks import ANY_LETTER, CrossCheckCache, mask_letters
+from game.dawg import CompactDawg, Dawg
+from game.gaddag import (
+    GADDAG_ALPHABET,
+    SEPARATOR,
+    build_gaddag,
+    gaddag_is_word,
+    gaddag_strings,
+    sorted_gaddag_paths,
+)
 
 
 def _empty_board():
     return [[None] * 15 for _ in range(15)]
 
 
+def _move_keys(moves):
+    return {
+        frozenset((r, c, l, (r, c) in m.blanks) for r, c, l in m.tiles)
+        for m in moves
+    }
+
+
+def _words_by_move(moves):
+    return {_move_keys([m]).pop(): sorted(m.words_formed) for m in moves}
+
+
 class DawgWordList:
     """Minimal wordlist exposing a DAWG, as WordList().strict does."""
 
-    def __init__(self, words):
+    def __init__(self, words, compact=False):
         self.words = sorted(set(words))
         self.dawg = Dawg.build(iter(self.words))
+        if compact:
+            self.dawg = CompactDawg.from_dawg(self.dawg)
+
+    def is_valid_word(self, word):
+        return self.dawg.is_word(word.lower())
+
+
+class GaddagWordList(DawgWordList):
+    """Wordlist with both graphs, as WordList().strict after ``--gaddag``."""
+
+    def __init__(self, words, compact=False):
+        super().__init__(words, compact)
+        self.gaddag = build_gaddag(self.words)
+        if compact:
+            self.gaddag = CompactDawg.from_dawg(self.gaddag, GADDAG_ALPHABET)
 
     def is_valid_word(self, word):
         return self.dawg.is_word(word.lower())
@@ -46,8 +91,6 @@ class TestDawgStructure(unittest.TestCase):
             Dawg.build(iter(["oja", "maja"]))
 
     def test_save_load_roundtrip(self):
-        import tempfile
-
         dawg = Dawg.build(iter(sorted(["maja", "oja"])))
         with tempfile.NamedTemporaryFile(suffix=".marshal") as f:
             dawg.save(f.name)
@@ -56,6 +99,305 @@ class TestDawgStructure(unittest.TestCase):
         self.assertFalse(loaded.is_word("majad"))
 
 
+class TestCompactDawg(unittest.TestCase):
+    """The array-backed layout must be indistinguishable from the dict one."""
+
+    WORDS = sorted(["maja", "majad", "majaga", "oja", "ojad", "õu", "öö", "šahh", "žürii"])
+
+    def setUp(self):
+        self.dawg = Dawg.build(iter(self.WORDS))
+        self.compact = CompactDawg.from_dawg(self.dawg)
+
+    def test_membership_matches_dict_layout(self):
+        for word in self.WORDS + ["ma", "majade", "õ", "öös", "kass", "", "maja!"]:
+            with self.subTest(word=word):
+                self.assertEqual(self.compact.is_word(word), self.dawg.is_word(word))
+
+    def test_traversal_matches_dict_layout(self):
+        self.assertEqual(len(self.compact), len(self.dawg))
+        for node in range(len(self.dawg)):
+            self.assertEqual(dict(self.compact.children(node)), dict(self.dawg.children(node)))
+            self.assertEqual(self.compact.is_final(node), self.dawg.is_final(node))
+            for ch in "amjõöx":
+                self.assertEqual(self.compact.child(node, ch), self.dawg.child(node, ch))
+
+    def test_rejects_letters_outside_alphabet(self):
+        with self.assertRaises(ValueError):
+            CompactDawg.from_dawg(Dawg.build(iter(["qwe"])))
+
+    def test_mmapped_file_roundtrip(self):
+        with tempfile.NamedTemporaryFile(suffix=".dawg") as f:
+            self.compact.save(f.name)
+            loaded = CompactDawg.load(f.name)
+        self.assertIsInstance(loaded.targets, memoryview)  # zero-copy view
+        self.assertEqual(loaded.alphabet, self.compact.alphabet)
+        for word in self.WORDS:
+            self.assertTrue(loaded.is_word(word))
+        self.assertFalse(loaded.is_word("majade"))
+
+    def test_load_rejects_corrupt_or_foreign_files(self):
+        with tempfile.NamedTemporaryFile(suffix=".dawg") as f:
+            self.compact.save(f.name)
+            data = bytearray(open(f.name, "rb").read())
+        bad_files = {
+            "checksum": data[:-1] + bytes([data[-1] ^ 1]),
+            "truncated": data[:-3],
+            "version": data[:8] + (99).to_bytes(4, "little") + data[12:],
+            "magic": b"NOTADAWG" + data[8:],
+        }
+        for name, content in bad_files.items():
+            with self.subTest(corruption=name), \
+                    tempfile.NamedTemporaryFile(suffix=".dawg") as f:
+                f.write(content)
+                f.flush()
+                with self.assertRaises(ValueError):
+                    CompactDawg.load(f.name)
+
+    def test_update_matches_rebuild(self):
+        dawg = self.compact.to_dawg()
+        self.assertEqual((dawg.finals, dawg.edges), (self.dawg.finals, self.dawg.edges))
+        edits = [
+            (["majake", "ojake", "õun"], ["majaga"]),
+            (["ma", "õu"], ["maja", "oja"]),  # a word already present is no change
+            ([], ["majad", "majake", "ojad", "ojake", "kass"]),
+            (["majaga", "maja"], []),
+        ]
+        words = set(self.WORDS)
+        for add, remove in edits:
+            with self.subTest(add=add, remove=remove):
+                added, removed = dawg.update(add=add, remove=remove)
+                self.assertEqual((added, removed),
+                                 (len(set(add) - words), len(set(remove) & words)))
+                words = (words - set(remove)) | set(add)
+                rebuilt = Dawg.build(iter(sorted(words)))
+                self.assertEqual((dawg.finals, dawg.edges), (rebuilt.finals, rebuilt.edges))
+
+    def test_move_generation_matches_dict_layout(self):
+        words = ["maja", "aja", "ma", "kaja", "kass", "sai", "ka"]
+        board = _empty_board()
+        for c, ch in enumerate("maja"):
+            board[7][6 + c] = ch
+        rack = ["k", "a", "s", "s", "i", "_"]
+
+        def keys(moves):
+            return {
+                frozenset((r, c, l, (r, c) in m.blanks) for r, c, l in m.tiles)
+                for m in moves
+            }
+
+        dict_moves = find_all_moves(board, rack, DawgWordList(words))
+        compact_moves = find_all_moves(board, rack, DawgWordList(words, compact=True))
+        self.assertTrue(dict_moves)
+        self.assertEqual(keys(compact_moves), keys(dict_moves))
+
+
+class TestGaddag(unittest.TestCase):
+    WORDS = ["maja", "majad", "aja", "ma", "kaja", "kass", "sai", "ka", "õu", "šahh"]
+
+    def test_paths_of_a_word(self):
+        self.assertEqual(
+            list(gaddag_strings("maja")),
+            ["m" + SEPARATOR + "aja", "am" + SEPARATOR + "ja", "jam" + SEPARATOR + "a", "ajam"],
+        )
+
+    def test_sharded_paths_are_globally_sorted(self):
+        expected = sorted(p for w in self.WORDS for p in gaddag_strings(w))
+        self.assertEqual(list(sorted_gaddag_paths(self.WORDS)), expected)
+
+    def test_membership(self):
+        for layout in ("dict", "compact"):
+            gaddag = GaddagWordList(self.WORDS, compact=layout == "compact").gaddag
+            for word in self.WORDS + ["maj", "aj", "majade", "kas", "m", ""]:
+                with self.subTest(layout=layout, word=word):
+                    self.assertEqual(gaddag_is_word(gaddag, word), word in self.WORDS)
+
+    def test_compact_roundtrip_keeps_separator(self):
+        gaddag = GaddagWordList(self.WORDS, compact=True).gaddag
+        with tempfile.NamedTemporaryFile(suffix=".dawg") as f:
+            gaddag.save(f.name)
+            loaded = CompactDawg.load(f.name)
+            self.assertEqual(loaded.alphabet, GADDAG_ALPHABET)
+            self.assertTrue(gaddag_is_word(loaded, "majad"))
+
+    def test_move_sets_match_dawg_on_midgame_boards(self):
+        """Same moves as the Appel–Jacobson generator, blanks included."""
+        from tools.bench_dawg import midgame_boards, synthetic_words
+
+        wl = GaddagWordList(synthetic_words(400), compact=True)
+        positions = midgame_boards(wl.dawg, n_boards=3)
+        positions.append((_empty_board(), ["k", "a", "s", "_", "i", "e", "t"]))
+        for n, (board, rack) in enumerate(positions):
+            first = all(ch is None for row in board for ch in row)
+            for rack_variant in (rack, rack[:-1] + ["_"]):
+                with self.subTest(board=n, rack=rack_variant):
+                    gaddag_moves = find_all_moves(board, rack_variant, wl, first)
+                    dawg_moves = _find_all_moves_dawg(board, rack_variant, wl.dawg, first)
+                    self.assertTrue(dawg_moves)
+                    self.assertEqual(_words_by_move(gaddag_moves), _words_by_move(dawg_moves))
+
+
+class TestScoringDuringGeneration(unittest.TestCase):
+    """Scores accumulated by the generators equal the board scorer's."""
+
+    @classmethod
+    def setUpClass(cls):
+        from tools.bench_dawg import midgame_boards, synthetic_words
+
+        cls.wl = GaddagWordList(synthetic_words(400), compact=True)
+        cls.positions = midgame_boards(cls.wl.dawg, n_boards=3)
+        cls.positions.append((_empty_board(), ["k", "a", "s", "_", "i", "e", "t"]))
+
+    GENERATORS = ("dawg", "gaddag")
+
+    @staticmethod
+    def _generate(generator, wl, board, rack, first=False, top_k=None):
+        if generator == "gaddag":
+            return _find_all_moves_gaddag(board, rack, wl.gaddag, first, top_k=top_k)
+        return _find_all_moves_dawg(board, rack, wl.dawg, first, top_k=top_k)
+
+    def test_generated_scores_match_scorer(self):
+        for n, (board, rack) in enumerate(self.positions):
+            first = all(ch is None for row in board for ch in row)
+            for rack_variant in (rack, rack[:-2] + ["_", "_"]):
+                for generator in self.GENERATORS:
+                    with self.subTest(board=n, rack=rack_variant, generator=generator):
+                        moves = self._generate(generator, self.wl, board, rack_variant, first)
+                        self.assertTrue(moves)
+                        for move in moves:
+                            expected = _calculate_move_score(board, copy.copy(move))
+                            self.assertEqual(move.raw_score, expected, move.tiles)
+
+    def test_bingo_bonus_included(self):
+        wl = GaddagWordList(["kalurid"], compact=True)
+        rack = ["d", "i", "r", "u", "l", "a", "k"]
+        for generator in self.GENERATORS:
+            with self.subTest(generator=generator):
+                moves = self._generate(generator, wl, _empty_board(), rack, first=True)
+                self.assertTrue(moves)
+                for move in moves:
+                    self.assertEqual(len(move.tiles), 7)
+                    self.assertGreater(move.raw_score, 50)
+                    self.assertEqual(move.raw_score, _calculate_move_score(_empty_board(), move))
+
+    def test_top_k_keeps_the_best_scores(self):
+        board, rack = self.positions[0]
+        for generator in self.GENERATORS:
+            with self.subTest(generator=generator):
+                moves = self._generate(generator, self.wl, board, rack)
+                top = self._generate(generator, self.wl, board, rack, top_k=10)
+                self.assertEqual(
+                    sorted((m.raw_score for m in top), reverse=True),
+                    sorted((m.raw_score for m in moves), reverse=True)[:10],
+                )
+
+    def test_strong_move_unchanged_by_top_k(self):
+        """The heuristic pick from the top-K equals the pick from every move."""
+        from game.ai_player import _positional_bonus, _rack_balance_bonus
+
+        for n, (board, rack) in enumerate(self.positions[:3]):
+            with self.subTest(board=n):
+                best = -float("inf")
+                for move in find_all_moves(board, rack, self.wl):
+                    remaining = rack[:]
+                    for r, c, letter in move.tiles:
+                        remaining.remove("_" if (r, c) in move.blanks else letter)
+                    best = max(best, move.raw_score + _rack_balance_bonus(remaining)
+                               + _positional_bonus(board, move))
+                chosen = select_move(board, rack, self.wl, difficulty="strong")
+                self.assertEqual(chosen.heuristic_score, best)
+
+    def test_compact_board_gives_the_same_moves(self):
+        from game.board import CompactBoard
+
+        board, rack = self.positions[0]
+        for name, wl in (("gaddag", self.wl), ("dawg", DawgWordList(self.wl.words))):
+            with self.subTest(generator=name):
+                expected = find_all_moves(board, rack, wl)
+                moves = find_all_moves(CompactBoard.from_rows(board), rack, wl)
+                self.assertEqual(_words_by_move(moves), _words_by_move(expected))
+                self.assertEqual(sorted(m.raw_score for m in moves),
+                                 sorted(m.raw_score for m in expected))
+
+    def test_deadline_returns_moves_found_so_far(self):
+        import time
+
+        board, rack = self.positions[0]
+        for generator in self.GENERATORS:
+            with self.subTest(generator=generator):
+                wl = self.wl if generator == "gaddag" else DawgWordList(self.wl.words)
+                full = find_all_moves(board, rack, wl)
+                # A passed deadline stops the scan before the first line
+                self.assertEqual(find_all_moves(board, rack, wl, deadline=time.monotonic()), [])
+                self.assertIsNone(select_move(board, rack, wl, difficulty="strong",
+                                              deadline=time.monotonic() - 1))
+                late = find_all_moves(board, rack, wl, deadline=time.monotonic() + 60)
+                self.assertEqual(len(late), len(full))
+
+
+class TestCrossCheckCache(unittest.TestCase):
+    """The incremental cache must always equal a from-scratch computation."""
+
+    def _play(self, board, move):
+        for r, c, ch in move.tiles:
+            board[r][c] = ch
+
+    def test_incremental_updates_match_fresh_views(self):
+        from tools.bench_dawg import synthetic_words
+
+        wl = DawgWordList(synthetic_words(400))
+        board = _empty_board()
+        cache = CrossCheckCache()
+        racks = [list("kalaste"), list("sarimeo"), list("tuliked"), list("aviseon"),
+                 list("rodatsu"), list("nimelta")]
+        for turn, rack in enumerate(racks):
+            first = turn == 0
+            before = cache.lines_computed
+            view = cache.view(wl.dawg, first)
+            fresh = CrossCheckCache()
+            fresh.sync(board)
+            self.assertEqual(view, fresh.view(wl.dawg, first))
+            if turn > 1:
+                # Only the previous move's rows and columns were recomputed
+                self.assertLessEqual(cache.lines_computed - before, len(move.tiles) + 1)
+            move = select_move(board, rack, wl, first, "strong", cross_checks=cache)
+            self.assertIsNotNone(move)
+            self._play(board, move)
+            cache.sync(board, move.positions)
+
+    def test_cached_moves_match_uncached(self):
+        wl = DawgWordList(["maja", "aja", "ma", "kaja", "kass", "sai", "ka", "ja"])
+        board = _empty_board()
+        cache = CrossCheckCache()
+        for c, ch in enumerate("maja"):
+            board[7][6 + c] = ch
+        cache.sync(board)
+        rack = ["k", "a", "s", "s", "i", "_"]
+        cached = find_all_moves(board, rack, wl, cross_checks=cache)
+        self.assertEqual(_words_by_move(cached), _words_by_move(find_all_moves(board, rack, wl)))
+
+    def test_undo_restores_anchors(self):
+        board = _empty_board()
+        cache = CrossCheckCache()
+        board[7][7] = "a"
+        cache.sync(board, [(7, 7)])
+        self.assertEqual(cache.view(Dawg.build(iter(["aa"]))).anchors,
+                         {(6, 7), (8, 7), (7, 6), (7, 8)})
+        board[7][7] = None
+        cache.sync(board)
+        self.assertEqual(cache.view(Dawg.build(iter(["aa"]))).anchors, frozenset())
+
+    def test_new_graph_recomputes_everything(self):
+        board = _empty_board()
+        board[7][7] = "a"
+        cache = CrossCheckCache()
+        cache.sync(board)
+        old = DawgWordList(["ab"]).dawg
+        self.assertEqual(cache.view(old).line(7, False)[0][8], ANY_LETTER)
+        self.assertEqual(cache.view(old).line(6, False)[0][7], 0)
+        new = DawgWordList(["ba"]).dawg
+        self.assertEqual(mask_letters(cache.view(new).line(6, False)[0][7]), {"b"})
+
+
 class TestDawgMoveGeneration(unittest.TestCase):
     def test_first_move_through_center(self):
         wl = DawgWordList(["maja", "aja"])
@@ -96,6 +438,27 @@ class TestDawgMoveGeneration(unittest.TestCase):
         # (k1 + a1 + s1 + blank 0) * 2 for the center DW
         self.assertEqual(move.raw_score, 6)
 
+    def test_two_blanks_play_every_spelling(self):
+        """Each of a word's tiles may come from the rack or a blank, never both."""
+        wl = DawgWordList(["kass", "kas"])
+        moves = find_all_moves(_empty_board(), ["k", "s", "_", "_"], wl, first_move=True)
+        kass = {
+            tuple(sorted((r, c) for r, c, _ in m.tiles if (r, c) in m.blanks))
+            for m in moves
+            if m.words_formed == ["kass"] and m.tiles[0][:2] == (7, 4)
+        }
+        # "k" and one "s" from the rack; "a" and the other "s" are blanks
+        self.assertEqual(kass, {((7, 5), (7, 6)), ((7, 5), (7, 7))})
+        for move in moves:
+            self.assertLessEqual(len(move.blanks), 2)
+            self.assertEqual(len(move.tiles), len(move.words_formed[0]))
+
+    def test_tiles_outside_the_alphabet_are_never_played(self):
+        wl = DawgWordList(["maja"])
+        moves = find_all_moves(_empty_board(), ["m", "a", "j", "a", "x"], wl, first_move=True)
+        self.assertTrue(moves)
+        self.assertFalse(any(ch == "x" for m in moves for _, _, ch in m.tiles))
+
     def test_easy_mode_picks_weaker_move(self):
         """Easy never returns the top-scoring move (given enough options)."""
         wl = DawgWordList(["maja", "aja", "ma", "aa"])
@@ -132,5 +495,220 @@ class TestDawgMoveGeneration(unittest.TestCase):
         self.assertEqual(keys(dawg_moves), keys(brute_moves))
 
 
+try:
+    import spylls  # noqa: F401
+
+    HAS_SPYLLS = True
+except ImportError:
+    HAS_SPYLLS = False
+
+
+@unittest.skipUnless(HAS_SPYLLS, "spylls not installed")
+class TestDawgBuild(unittest.TestCase):
+    """tools/build_dawg.py on a synthetic strict dictionary."""
+
+    def setUp(self):
+        from tools.bench_strict_lookup import write_synthetic_dictionary
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dict_dir = tmp.name
+        write_synthetic_dictionary(self.dict_dir, n_stems=400)
+
+    def test_sharded_unmunch_matches_single_process(self):
+        from tools.build_dawg import unmunch_strict_dictionary
+
+        single = unmunch_strict_dictionary(self.dict_dir, workers=1)
+        self.assertEqual(single, sorted(set(single)))
+        self.assertGreater(len(single), 400)
+        timings = {}
+        self.assertEqual(unmunch_strict_dictionary(self.dict_dir, workers=2, timings=timings),
+                         single)
+        self.assertEqual(set(timings), {"parse", "expand", "merge"})
+
+    def test_build_reports_phase_timings(self):
+        from tools.build_dawg import build_dawg, unmunch_strict_dictionary
+
+        timings = {}
+        out = build_dawg(self.dict_dir, gaddag=False, workers=1, timings=timings)
+        self.assertEqual(list(timings), ["parse", "expand", "merge", "build", "save"])
+        dawg = CompactDawg.load(out)
+        words = unmunch_strict_dictionary(self.dict_dir, workers=1)
+        self.assertTrue(all(dawg.is_word(w) for w in words[::25]))
+
+    def test_bounded_memory_build_is_byte_identical(self):
+        from tools.build_dawg import _MERGE_FAN_IN, build_dawg, unmunch_runs
+
+        with open(build_dawg(self.dict_dir, gaddag=False, workers=1), "rb") as f:
+            in_memory = f.read()
+        # ~100 forms per run: more runs than one merge pass takes
+        with tempfile.TemporaryDirectory() as spill_dir:
+            runs = unmunch_runs(self.dict_dir, workers=1, spill_dir=spill_dir,
+                                max_memory=20000)
+            self.assertGreater(len(runs), _MERGE_FAN_IN)
+        timings = {}
+        out = build_dawg(self.dict_dir, gaddag=False, workers=2, timings=timings,
+                         max_memory=20000, incremental=False)
+        with open(out, "rb") as f:
+            self.assertEqual(f.read(), in_memory)
+        self.assertEqual(list(timings), ["parse", "expand", "merge", "build", "save"])
+        # The spilled runs are cleaned up
+        self.assertEqual(sorted(os.listdir(self.dict_dir)),
+                         sorted(["cache", "dawg_strict.dawg", "dawg_strict.json",
+                                 "et_EE_scrabble_strict.aff",
+                                 "et_EE_scrabble_strict.dic"]))
+
+    def test_rebuilds_only_when_content_changes(self):
+        from tools.build_dawg import build_dawg, dawg_stale
+
+        self.assertTrue(dawg_stale(self.dict_dir))
+        out = build_dawg(self.dict_dir, gaddag=False, workers=1)
+        with open(out, "rb") as f:
+            first = f.read()
+        self.assertFalse(dawg_stale(self.dict_dir))
+
+        # A checkout or layer copy touches the inputs without changing them
+        dic = os.path.join(self.dict_dir, "et_EE_scrabble_strict.dic")
+        future = os.path.getmtime(out) + 3600
+        os.utime(dic, (future, future))
+        self.assertFalse(dawg_stale(self.dict_dir))
+
+        with open(dic, encoding="utf-8") as f:
+            original = f.read()
+        with open(dic, "a", encoding="utf-8") as f:
+            f.write("õunapuu/A\n")
+        self.assertTrue(dawg_stale(self.dict_dir))
+        build_dawg(self.dict_dir, gaddag=False, workers=1)
+        self.assertTrue(CompactDawg.load(out).is_word("õunapuu"))
+
+        # Reverting the edit restores the first build instead of rebuilding it
+        with open(dic, "w", encoding="utf-8") as f:
+            f.write(original)
+        with patch("tools.build_dawg.unmunch_runs", side_effect=AssertionError("rebuilt")):
+            self.assertFalse(dawg_stale(self.dict_dir))
+        with open(out, "rb") as f:
+            self.assertEqual(f.read(), first)
+
+    def test_builder_change_is_not_patched_in(self):
+        from tools import build_dawg as builder
+
+        # Stands in for tools/build_dawg.py, game/dawg.py and game/gaddag.py
+        source = os.path.join(self.dict_dir, "builder.py")
+        with open(source, "w") as f:
+            f.write("v1\n")
+        patcher = patch("tools.build_dawg._builder_sources", return_value=[source])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        builder.build_dawg(self.dict_dir, gaddag=False, workers=1)
+        self.assertTrue(builder.update_dawg(self.dict_dir))
+
+        with open(source, "w") as f:
+            f.write("v2\n")
+        self.assertTrue(builder.dawg_stale(self.dict_dir))
+        self.assertFalse(builder.update_dawg(self.dict_dir))
+        with patch("tools.build_dawg.unmunch_runs", wraps=builder.unmunch_runs) as unmunch:
+            builder.build_dawg(self.dict_dir, workers=1)
+        unmunch.assert_called_once()
+        self.assertFalse(builder.dawg_stale(self.dict_dir))
+        self.assertTrue(builder.update_dawg(self.dict_dir))
+
+    def test_blocklist_and_extra_words_patched_in(self):
+        from tools.build_dawg import build_dawg, update_dawg
+
+        blocked_file = os.path.join(self.dict_dir, "blocked.txt")
+        open(blocked_file, "w").close()
+        patcher = patch("tools.build_dawg.BLOCKED_FILE", blocked_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        out = build_dawg(self.dict_dir, gaddag=True, workers=1)
+        gaddag_out = os.path.join(self.dict_dir, "gaddag_strict.dawg")
+        dic = os.path.join(self.dict_dir, "et_EE_scrabble_strict.dic")
+        with open(dic, encoding="utf-8") as f:
+            stem = f.read().splitlines()[7].split("/")[0]
+
+        def check(edit, expected):
+            edit()
+            with patch("tools.build_dawg.unmunch_runs", side_effect=AssertionError("rebuilt")):
+                build_dawg(self.dict_dir, workers=1)
+            dawg, gaddag = CompactDawg.load(out), CompactDawg.load(gaddag_out)
+            for word, valid in expected.items():
+                self.assertEqual(dawg.is_word(word), valid, word)
+                self.assertEqual(gaddag_is_word(gaddag, word), valid, word)
+            with open(out, "rb") as f, open(gaddag_out, "rb") as g:
+                patched = f.read(), g.read()
+            build_dawg(self.dict_dir, workers=1, incremental=False)
+            with open(out, "rb") as f, open(gaddag_out, "rb") as g:
+                self.assertEqual(patched, (f.read(), g.read()))
+
+        def block(*words):
+            with open(blocked_file, "w", encoding="utf-8") as f:
+                f.write("".join(word + "\n" for word in words))
+
+        def append_entry():
+            with open(dic, "a", encoding="utf-8") as f:
+                f.write("õunapuu/A\n")
+
+        check(lambda: block(stem, "õunapuuga"), {stem: False, stem + "ga": True})
+        check(append_entry, {"õunapuu": True, "õunapuud": True, "õunapuuga": False})
+        check(lambda: block(), {stem: True, "õunapuuga": True})
+
+        # Removing an entry may drop forms other entries share: rebuild
+        with open(dic, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        with open(dic, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines[:-1]) + "\n")
+        self.assertFalse(update_dawg(self.dict_dir))
+        build_dawg(self.dict_dir, workers=1)
+        self.assertFalse(CompactDawg.load(out).is_word("õunapuu"))
+
+
+class TestBuildCache(unittest.TestCase):
+    """The content-addressed manifest under dict/cache (tools/build_cache.py)."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.input = os.path.join(self.dir, "input.txt")
+        self.output = os.path.join(self.dir, "output.txt")
+
+    def _build(self, cache, artifact, text):
+        with open(self.input, "w", encoding="utf-8") as f:
+            f.write(text)
+        with open(self.output, "w", encoding="utf-8") as f:
+            f.write(text.upper())
+        return cache.record(artifact)
+
+    def test_current_restored_and_pruned(self):
+        from tools.build_cache import Artifact, BuildCache
+
+        cache = BuildCache(self.dir, keep=2)
+        artifact = Artifact("demo", inputs=[self.input], outputs=[self.output])
+        self.assertFalse(cache.fresh(artifact))
+        first = self._build(cache, artifact, "maja")
+        self.assertTrue(cache.is_current(artifact))
+
+        # A modified output is not current
+        with open(self.output, "w", encoding="utf-8") as f:
+            f.write("garbage")
+        self.assertFalse(cache.is_current(artifact))
+        self.assertTrue(cache.fresh(artifact))  # restored from the store
+        with open(self.output, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "MAJA")
+
+        second = self._build(cache, artifact, "kala")
+        third = self._build(cache, artifact, "tee")
+        self.assertEqual(cache.builds("demo"), [third, second])
+        self.assertFalse(os.path.exists(os.path.join(cache.root, "demo", first[:32])))
+
+        with open(self.input, "w", encoding="utf-8") as f:
+            f.write("kala")
+        self.assertFalse(cache.is_current(artifact))
+        self.assertTrue(cache.restore(artifact))
+        with open(self.output, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "KALA")
+        self.assertEqual(cache.builds("demo"), [second, third])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,12 +3,19 @@ from unittest.mock import patch, MagicMock
 from typing import List, Optional
 from game.state import GameState, Player
 from game.constants import (
+    BOARD_SIZE,
+    CODE_POINTS,
     LETTER_DISTRIBUTION,
+    LETTER_MULTIPLIER,
+    LETTER_POINTS,
+    WORD_MULTIPLIER,
     DOUBLE_LETTER_SCORE,
     TRIPLE_LETTER_SCORE,
     DOUBLE_WORD_SCORE,
     TRIPLE_WORD_SCORE,
 )
+from game.board import CompactBoard
+from game.dawg import ALPHABET
 
 
 class MockWordList:
@@ -21,14 +28,14 @@ class MockWordList:
         return word.lower() in self.words
 
 
-def create_game_with_mock_wordlist(valid_words=None) -> GameState:
+def create_game_with_mock_wordlist(valid_words=None, compact_board=False) -> GameState:
     """Create a GameState with a mock wordlist and empty racks (no random draws)."""
-    with patch("game.state.WordList") as MockWL:
+    with patch("game.state.shared_wordlist") as MockWL:
         mock_wl = MockWordList()
         if valid_words:
             mock_wl.words = {w.lower() for w in valid_words}
         MockWL.return_value = mock_wl
-        game = GameState()
+        game = GameState(compact_board=compact_board)
     # Clear racks so tests control tile placement exactly
     for player in game.players:
         game.tile_bag.extend(player.rack)
@@ -74,6 +81,32 @@ class TestLetterDistribution(unittest.TestCase):
                 self.assertEqual(LETTER_DISTRIBUTION[letter]["points"], expected_points)
 
 
+class TestScoringTables(unittest.TestCase):
+    """The flat scoring tables must agree with the premium sets and distribution."""
+
+    def test_multipliers_match_premium_squares(self):
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                square = row * BOARD_SIZE + col
+                pos = (row, col)
+                with self.subTest(square=pos):
+                    self.assertEqual(
+                        LETTER_MULTIPLIER[square],
+                        3 if pos in TRIPLE_LETTER_SCORE else 2 if pos in DOUBLE_LETTER_SCORE else 1,
+                    )
+                    self.assertEqual(
+                        WORD_MULTIPLIER[square],
+                        3 if pos in TRIPLE_WORD_SCORE else 2 if pos in DOUBLE_WORD_SCORE else 1,
+                    )
+
+    def test_points_tables_match_distribution(self):
+        for letter, info in LETTER_DISTRIBUTION.items():
+            self.assertEqual(LETTER_POINTS[letter], info["points"])
+        self.assertEqual(len(CODE_POINTS), len(ALPHABET))
+        for code, letter in enumerate(ALPHABET):
+            self.assertEqual(CODE_POINTS[code], LETTER_DISTRIBUTION[letter]["points"])
+
+
 class TestScoring(unittest.TestCase):
     """Regression tests for scoring logic."""
 
@@ -372,7 +405,7 @@ class TestBlankTiles(unittest.TestCase):
 
 def create_multiplayer_game(num_players, valid_words=None) -> GameState:
     """Create a GameState with a given number of players and a mock wordlist."""
-    with patch("game.state.WordList") as MockWL:
+    with patch("game.state.shared_wordlist") as MockWL:
         mock_wl = MockWordList()
         if valid_words:
             mock_wl.words = {w.lower() for w in valid_words}
@@ -468,5 +501,195 @@ class TestMultiPlayer(unittest.TestCase):
         self.assertEqual(game.players[3].score, 15)  # 25 - 10
 
 
+class TestCrossCheckCache(unittest.TestCase):
+    """GameState keeps the AI's anchor/cross-check cache in step with the board."""
+
+    def _mirror(self, game):
+        return game.cross_checks._board
+
+    def test_commit_syncs_committed_tiles(self):
+        game = create_game_with_mock_wordlist(valid_words={"ema"})
+        game.current_player.rack = ["e", "m", "a"]
+        for col in (6, 7, 8):
+            game.place_tile(7, col, 0)
+        # Tentative tiles are not part of the cached (committed) board
+        self.assertIsNone(self._mirror(game)[7][7])
+        game.validate_current_placement()
+        self.assertTrue(game.commit_turn())
+        self.assertEqual(self._mirror(game), game.board)
+        self.assertIn((6, 7), game.cross_checks._anchors)
+        self.assertNotIn((7, 7), game.cross_checks._anchors)
+
+    def test_pass_leaves_cache_on_committed_board(self):
+        game = create_game_with_mock_wordlist()
+        game.current_player.rack = ["e"]
+        game.place_tile(7, 7, 0)
+        game.next_player()
+        self.assertEqual(self._mirror(game), game.board)
+        self.assertEqual(game.cross_checks._anchors, set())
+
+    def test_replaced_board_is_synced(self):
+        game = create_game_with_mock_wordlist()
+        board = [[None] * 15 for _ in range(15)]
+        board[7][7] = "a"
+        game.board = board
+        self.assertEqual(self._mirror(game), board)
+        self.assertIn((7, 8), game.cross_checks._anchors)
+
+
+class TestTurnJournal(unittest.TestCase):
+    """Each commit is journaled as a delta; undoing it restores the game exactly."""
+
+    def _state(self, game):
+        return (
+            [row[:] for row in game.board],
+            [(p.score, p.rack[:]) for p in game.players],
+            game.tile_bag[:],
+            set(game.current_turn_tiles),
+            dict(game.blank_designations),
+            game.current_player_idx,
+            game.consecutive_passes,
+            game.first_move,
+            game.game_over,
+        )
+
+    def _place(self, game, word, row=7, col=6):
+        game.current_player.rack = list(word)
+        for i in range(len(word)):
+            game.place_tile(row, col + i, 0, designated_letter="e")
+        game.validate_current_placement()
+
+    def test_undo_restores_the_pre_commit_state(self):
+        for compact_board in (False, True):
+            with self.subTest(compact_board=compact_board):
+                game = create_game_with_mock_wordlist(valid_words={"ema"},
+                                                      compact_board=compact_board)
+                self._place(game, "_ma")
+                before = self._state(game)
+                self.assertTrue(game.commit_turn())
+                self.assertEqual(len(game.players[0].rack), 3)  # drawn immediately
+                self.assertNotEqual(self._state(game), before)
+
+                self.assertTrue(game.undo_last_commit())
+                self.assertEqual(self._state(game), before)
+                self.assertEqual(game.journal, [])
+                self.assertEqual(game.cross_checks._board[7][7], None)
+                self.assertFalse(game.undo_last_commit())
+
+    def test_journal_records_the_move_and_deferred_draw(self):
+        game = create_game_with_mock_wordlist(valid_words={"ema"})
+        self._place(game, "ema")
+        self.assertTrue(game.commit_turn(defer_draw=True))
+        delta = game.journal[-1]
+        self.assertEqual(delta.tiles, ((7, 6, "e"), (7, 7, "m"), (7, 8, "a")))
+        self.assertEqual(delta.words, (("EMA", 8),))
+        self.assertEqual(delta.score_changes, (8, 0))
+        self.assertEqual(delta.drawn, ())
+        game.draw_deferred_tiles()
+        self.assertEqual(list(delta.drawn), game.players[0].rack)
+
+    def test_journal_replays_to_the_same_board_and_scores(self):
+        game = create_game_with_mock_wordlist(valid_words={"ema", "emad"})
+        self._place(game, "ema")
+        game.commit_turn()
+        self._place(game, "d", col=9)
+        game.commit_turn()
+
+        board = [[None] * 15 for _ in range(15)]
+        scores = [0, 0]
+        for delta in game.journal:
+            for r, c, letter in delta.tiles:
+                board[r][c] = letter
+            scores = [s + change for s, change in zip(scores, delta.score_changes)]
+        self.assertEqual(board, game.board)
+        self.assertEqual(scores, [p.score for p in game.players])
+
+
+class TestCompactBoard(unittest.TestCase):
+    """The compact board must behave exactly like the list-of-lists board."""
+
+    def _rows(self):
+        rows = [[None] * 15 for _ in range(15)]
+        for c, ch in enumerate("kõrvits"):
+            rows[7][4 + c] = ch
+        for r, ch in enumerate("šokk"):
+            rows[4 + r][5] = ch if rows[4 + r][5] is None else rows[4 + r][5]
+        rows[0][14] = "x"  # outside the alphabet: kept in the side table
+        return rows
+
+    def test_reads_and_writes_like_lists(self):
+        rows = self._rows()
+        board = CompactBoard.from_rows(rows)
+        self.assertEqual(len(board), 15)
+        self.assertEqual(len(board[0]), 15)
+        self.assertEqual(board, rows)
+        self.assertEqual([row[:] for row in board], rows)
+        self.assertEqual(board[7][4], "k")
+        self.assertEqual(board[0][14], "x")
+        self.assertIsNone(board[0][0])
+        board[0][0] = "ž"
+        board[7][4] = None
+        rows[0][0], rows[7][4] = "ž", None
+        self.assertEqual(board.rows(), rows)
+        with self.assertRaises(IndexError):
+            board[0][15]
+
+    def test_bitsets_track_occupancy(self):
+        board = CompactBoard.from_rows(self._rows())
+        self.assertEqual(board.row_bits[7], sum(1 << c for c in range(4, 11)))
+        self.assertEqual(board.col_bits[5], sum(1 << r for r in range(4, 8)))
+        board[7][5] = None
+        self.assertFalse(board.row_bits[7] >> 5 & 1)
+        self.assertFalse(board.col_bits[5] >> 7 & 1)
+        self.assertFalse(board.is_empty())
+        self.assertTrue(CompactBoard().is_empty())
+
+    def test_copy_and_transpose(self):
+        rows = self._rows()
+        board = CompactBoard.from_rows(rows)
+        copy = board.copy()
+        copy[1][1] = "a"
+        self.assertIsNone(board[1][1])
+        transposed = board.transposed()
+        self.assertEqual(transposed.rows(), [list(col) for col in zip(*rows)])
+        self.assertEqual(transposed.row_bits, board.col_bits)
+        self.assertEqual(transposed.transposed(), board)
+
+    def test_anchors_match_the_list_scan(self):
+        from game.ai_player import _get_anchors
+
+        rows = self._rows()
+        board = CompactBoard.from_rows(rows)
+        self.assertEqual(board.anchors(), _get_anchors(rows, False))
+        self.assertEqual(board.anchors(first_move=True), {(7, 7)})
+
+    def test_string_form(self):
+        rows = self._rows()
+        expected = "".join("." if ch is None else ch for row in rows for ch in row)
+        self.assertEqual(CompactBoard.from_rows(rows).to_string(), expected)
+
+    def test_game_plays_the_same_on_either_board(self):
+        scores = []
+        for compact_board in (False, True):
+            game = create_game_with_mock_wordlist(valid_words={"ema", "emad"},
+                                                  compact_board=compact_board)
+            self.assertEqual(isinstance(game.board, CompactBoard), compact_board)
+            game.current_player.rack = ["e", "m", "a"]
+            for col in (6, 7, 8):
+                game.place_tile(7, col, 0)
+            game.validate_current_placement()
+            self.assertTrue(game.commit_turn())
+            game.current_player.rack = ["d"]
+            game.place_tile(7, 9, 0)
+            game.validate_current_placement()
+            self.assertTrue(game.commit_turn())
+            self.assertEqual(game.cross_checks._board, game.board)
+            scores.append([p.score for p in game.players])
+            # Assigning a list of lists keeps the board's layout
+            game.board = [[None] * 15 for _ in range(15)]
+            self.assertEqual(isinstance(game.board, CompactBoard), compact_board)
+        self.assertEqual(scores[0], scores[1])
+
+
 if __name__ == "__main__":
     unittest.main()
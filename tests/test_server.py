@@ -1,6 +1,7 @@
 """Tests for the FastAPI WebSocket server."""
 
 import asyncio
+import os
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -25,13 +26,16 @@ class MockWordList:
 
 
 def _create_game(num_players: int = 2, valid_words=None) -> GameState:
-    """Create a GameState with a mock wordlist and empty racks."""
-    with patch("game.state.WordList") as MockWL:
+    """Create a GameState with a mock wordlist and empty racks.
+
+    Compact board, as the server creates its games.
+    """
+    with patch("game.state.shared_wordlist") as MockWL:
         mock_wl = MockWordList()
         if valid_words:
             mock_wl.words = {w.lower() for w in valid_words}
         MockWL.return_value = mock_wl
-        game = GameState(num_players=num_players)
+        game = GameState(num_players=num_players, compact_board=True)
     for player in game.players:
         game.tile_bag.extend(player.rack)
         player.rack.clear()
@@ -116,6 +120,121 @@ class TestRoom(unittest.TestCase):
         self.assertIsNone(room.get_player_index(_make_ws()))
 
 
+class TestBroadcastFanOut(unittest.TestCase):
+    """Concurrent broadcasts with per-connection outboxes (server/room.py)."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _slow_ws(self, delay):
+        ws = _make_ws()
+        received = []
+
+        async def send_json(message):
+            await asyncio.sleep(delay)
+            received.append(message)
+
+        ws.send_json = AsyncMock(side_effect=send_json)
+        return ws, received
+
+    def test_slow_client_does_not_hold_up_the_room(self):
+        room = Room("TEST")
+        fast = _make_ws()
+        slow, received = self._slow_ws(0.3)
+        room.add_player("Alice", fast)
+        room.add_player("Bob", slow)
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            await room.broadcast({"n": 1})
+            await room.broadcast({"n": 2})  # Bob is lagging: not waited for
+            elapsed = loop.time() - t0
+            self.assertEqual(room.send_stats()["lagging"], 1)
+            await asyncio.sleep(0.7)
+            return elapsed
+
+        with patch("server.room.SEND_TIMEOUT", 0.05):
+            elapsed = self._run(scenario())
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual([c.args[0] for c in fast.send_json.call_args_list],
+                         [{"n": 1}, {"n": 2}])
+        self.assertEqual(received, [{"n": 1}, {"n": 2}])  # late, but in order
+        stats = room.send_stats()
+        self.assertEqual((stats["sent"], stats["lagged"], stats["dropped"], stats["lagging"]),
+                         (4, 1, 0, 0))
+        self.assertGreaterEqual(stats["latency_ms"]["max"], 300)
+
+    def test_hung_or_failing_clients_are_dropped(self):
+        room = Room("TEST")
+        ok = _make_ws()
+        hung, _ = self._slow_ws(60)
+        broken = _make_ws()
+        broken.send_json = AsyncMock(side_effect=RuntimeError("socket closed"))
+
+        async def slow_close(code):
+            await asyncio.sleep(0.05)
+
+        broken.close = AsyncMock(side_effect=slow_close)
+        for name, ws in [("Alice", ok), ("Bob", hung), ("Carol", broken)]:
+            room.add_player(name, ws)
+
+        async def scenario():
+            await room.broadcast({"type": "chat"})  # a failed send no longer raises
+            self.assertEqual(len(room._closing), 1)  # the close task is held until done
+            await asyncio.sleep(0.2)
+            self.assertEqual(room._closing, set())
+
+        with patch("server.room.SEND_TIMEOUT", 0.02), patch("server.room.DROP_TIMEOUT", 0.1):
+            self._run(scenario())
+        ok.send_json.assert_called_once_with({"type": "chat"})
+        hung.close.assert_awaited_once_with(code=1013)
+        broken.close.assert_awaited_once_with(code=1013)
+        self.assertEqual(room.send_stats()["dropped"], 2)
+
+    def test_full_outbox_drops_the_client(self):
+        room = Room("TEST")
+        hung, _ = self._slow_ws(60)
+        room.add_player("Bob", hung)
+
+        async def scenario():
+            for n in range(4):
+                await room.broadcast({"n": n})
+            await asyncio.sleep(0.01)
+            stats = room.send_stats()
+            room.disconnect_player(hung)  # the endpoint's cleanup
+            return stats
+
+        with patch("server.room.SEND_TIMEOUT", 0.01), \
+             patch("server.room.MAX_QUEUED_MESSAGES", 2):
+            stats = self._run(scenario())
+        self.assertEqual((stats["dropped"], stats["queued"]), (1, 0))
+        hung.close.assert_awaited_once_with(code=1013)
+        self.assertEqual(room.send_stats()["queued"], 0)
+
+    def test_direct_replies_queue_behind_updates(self):
+        from server.app import _send_error
+
+        room = Room("TEST")
+        slow, received = self._slow_ws(0.1)
+        room.add_player("Bob", slow)
+        stranger = _make_ws()
+
+        async def scenario():
+            await room.broadcast({"n": 1})  # Bob is lagging now
+            await _send_error(slow, "Not your turn", room)
+            self.assertEqual(received, [])  # queued, not waited for
+            await _send_error(stranger, "Join or create a room first", room)
+            await asyncio.sleep(0.3)
+
+        with patch("server.room.SEND_TIMEOUT", 0.01):
+            self._run(scenario())
+        self.assertEqual(received, [{"n": 1}, {"type": "error", "message": "Not your turn"}])
+        # Not a player of the room: sent directly, no outbox left behind
+        stranger.send_json.assert_awaited_once()
+        self.assertEqual(len(room._outboxes), 1)
+
+
 # ---------------------------------------------------------------------------
 # Serialization tests
 # ---------------------------------------------------------------------------
@@ -144,6 +263,9 @@ class TestSerialization(unittest.TestCase):
         state = serialize_game_state(game, player_index=0)
         self.assertEqual(state["board"][7][7], "e")
         self.assertIsNone(state["board"][0][0])
+        # Plain lists, ready for JSON
+        self.assertIs(type(state["board"]), list)
+        self.assertTrue(all(type(row) is list for row in state["board"]))
 
     def test_tiles_remaining_is_count(self):
         game = _create_game()
@@ -257,7 +379,7 @@ class TestWebSocketFlow(unittest.TestCase):
         self._run(self.start_game(ws1, room))
 
         self.assertTrue(room.started)
-        MockGS.assert_called_once_with(num_players=2)
+        MockGS.assert_called_once_with(num_players=2, compact_board=True)
 
     def test_start_game_requires_two_players(self):
         ws = _make_ws()
@@ -377,6 +499,161 @@ class TestMoveHistory(unittest.TestCase):
         self.assertEqual(payload["move_history"], [{"action": "pass", "player_name": "Alice"}])
 
 
+def _apply_delta(state, delta):
+    """What web/js/websocket.js does with a game_state_delta."""
+    assert state["state_version"] == delta["base_version"]
+    state = {**state, **delta.get("changes", {})}
+    state["board"] = [row[:] for row in state["board"]]
+    for row, col, letter in delta.get("cells", []):
+        state["board"][row][col] = letter
+    state["players"] = [dict(player) for player in state["players"]]
+    for index, score in delta.get("scores", []):
+        state["players"][index]["score"] = score
+    state["move_history"] = state["move_history"] + delta.get("move_history_append", [])
+    state["state_version"] = delta["version"]
+    return state
+
+
+class TestGameStateDeltas(unittest.TestCase):
+    """Versioned game-state updates: a snapshot, then deltas."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def setUp(self):
+        self.room = Room("ABCD")
+        self.room.game = _create_game(2, valid_words=["ema"])
+        self.room.game.players[0].rack[:] = list("emaksis")
+        self.ws1, self.ws2 = _make_ws(), _make_ws()
+        self.room.add_player("Alice", self.ws1)
+        self.room.add_player("Bob", self.ws2)
+
+    def _sent(self, ws):
+        return [c.args[0] for c in ws.send_json.call_args_list]
+
+    def test_snapshot_then_deltas(self):
+        room, game = self.room, self.room.game
+        self._run(room.broadcast_game_state())
+        snapshot = self._sent(self.ws1)[-1]
+        self.assertEqual((snapshot["type"], snapshot["state_version"]), ("game_state", 1))
+
+        game.place_tile(7, 7, 0)
+        self._run(room.broadcast_game_state())
+        delta = self._sent(self.ws1)[-1]
+        self.assertEqual(delta["type"], "game_state_delta")
+        self.assertEqual((delta["version"], delta["base_version"]), (2, 1))
+        self.assertEqual(delta["cells"], [[7, 7, "e"]])
+        self.assertNotIn("board", delta)
+        self.assertEqual(delta["changes"]["rack"], list("maksis"))
+        # The opponent sees the tile, not the rack
+        self.assertNotIn("rack", self._sent(self.ws2)[-1].get("changes", {}))
+
+        room.record_move({"action": "pass", "player_name": "Alice"})
+        game.players[0].score = 12
+        self._run(room.broadcast_game_state())
+        delta = self._sent(self.ws1)[-1]
+        self.assertEqual(delta["scores"], [[0, 12]])
+        self.assertEqual(delta["move_history_append"],
+                         [{"action": "pass", "player_name": "Alice"}])
+        self.assertNotIn("cells", delta)
+
+    def test_deltas_rebuild_the_snapshot(self):
+        room, game = self.room, self.room.game
+        self._run(room.broadcast_game_state())
+        game.place_tile(7, 7, 0)
+        self._run(room.broadcast_game_state())
+        game.place_tile(7, 8, 0)
+        game.remove_tile(7, 7)
+        self._run(room.broadcast_game_state())
+        room.record_move({"action": "pass", "player_name": "Alice"})
+        game.current_player_idx = 1
+        self._run(room.broadcast_game_state())
+
+        for ws in (self.ws1, self.ws2):
+            snapshot, *deltas = self._sent(ws)
+            state = snapshot
+            for delta in deltas:
+                state = _apply_delta(state, delta)
+            self._run(room.resend_game_state(ws))
+            full = self._sent(ws)[-1]
+            self.assertEqual(full["type"], "game_state")
+            self.assertEqual({**state, "state_version": full["state_version"]}, full)
+
+    def test_commits_and_undos_between_broadcasts(self):
+        room, game = self.room, self.room.game
+        self._run(room.broadcast_game_state())
+        # An AI-style turn: placed and committed with no broadcast in between
+        for col in (6, 7, 8):
+            game.place_tile(7, col, 0)
+        game.validate_current_placement()
+        self.assertTrue(game.commit_turn())
+        room.record_move({"action": "word", "player_name": "Alice"})
+        self._run(room.broadcast_game_state())
+        delta = self._sent(self.ws2)[-1]
+        self.assertEqual(delta["cells"], [[7, 6, "e"], [7, 7, "m"], [7, 8, "a"]])
+        self.assertEqual(len(delta["move_history_append"]), 1)
+        # Undone and retracted before the next broadcast
+        self.assertTrue(game.undo_last_commit())
+        game.next_player()
+        self._run(room.broadcast_game_state())
+        self.assertEqual(self._sent(self.ws2)[-1]["cells"],
+                         [[7, 6, None], [7, 7, None], [7, 8, None]])
+        # A new game in the room starts everyone from a snapshot
+        room.game = _create_game(2)
+        self._run(room.broadcast_game_state())
+        self.assertEqual(self._sent(self.ws1)[-1]["type"], "game_state")
+
+    def test_shared_parts_serialized_once(self):
+        from server import room as room_module
+
+        room = self.room
+        ws3 = _make_ws()
+        room.add_player("Carl", ws3)
+        with patch.object(room_module, "serialize_board",
+                          wraps=room_module.serialize_board) as serialize:
+            self._run(room.broadcast_game_state())
+            self.assertEqual(serialize.call_count, 1)
+            room.game.place_tile(7, 7, 0)
+            self._run(room.broadcast_game_state())
+            self.assertEqual(serialize.call_count, 1)  # deltas only
+
+    def test_old_bases_get_snapshots(self):
+        from server.room import MAX_QUEUED_MESSAGES
+
+        room = self.room
+        self._run(room.broadcast_game_state())
+        for _ in range(MAX_QUEUED_MESSAGES + 1):
+            self._run(room.broadcast_game_state(only=self.ws1))
+        self._run(room.broadcast_game_state())
+        self.assertEqual(self._sent(self.ws1)[-1]["type"], "game_state_delta")
+        self.assertEqual(self._sent(self.ws2)[-1]["type"], "game_state")
+
+    def test_resync_and_reconnect_get_snapshots(self):
+        from server.app import _dispatch, room_manager
+
+        room = self.room
+        room.started = True
+        room_manager.rooms[room.code] = room
+        self.addCleanup(room_manager.rooms.pop, room.code, None)
+        self._run(room.broadcast_game_state())
+        self._run(room.broadcast_game_state())
+        self.assertEqual(self._sent(self.ws1)[-1]["type"], "game_state_delta")
+
+        self._run(_dispatch(self.ws1, room, {"action": "resync"}))
+        self.assertEqual(self._sent(self.ws1)[-1]["type"], "game_state")
+        self.assertEqual(len(self._sent(self.ws2)), 2)  # nobody else
+
+        # A reconnecting player's new socket starts from a snapshot
+        room.disconnect_player(self.ws2)
+        ws3 = _make_ws()
+        self._run(_dispatch(ws3, None, {"action": "join_room", "room_code": room.code,
+                                        "player_name": "Bob"}))
+        reconnected, state = self._sent(ws3)
+        self.assertEqual((reconnected["type"], state["type"]), ("reconnected", "game_state"))
+        self.assertEqual(state["your_player_index"], 1)
+        self.assertEqual(state["state_version"], 4)
+
+
 class TestForceCommitVsAI(unittest.TestCase):
     """Force-commit is rejected without human opponents (issue #37).
 
@@ -638,7 +915,13 @@ class TestAITurnExecution(unittest.TestCase):
         room.game.first_move = True
         room.started = True
 
-        self._run(_execute_ai_turn(room))
+        # Thread mode: worker processes would search the real DAWG, not the mock
+        from server import app as app_module
+        from server.ai_engine import AIEngine
+        from server.ai_scheduler import AIScheduler
+
+        with patch.object(app_module, "ai_scheduler", AIScheduler(AIEngine(workers=0))):
+            self._run(_execute_ai_turn(room))
 
         played = "".join(
             room.game.board[7][c] or "" for c in range(4, 12)
@@ -672,25 +955,58 @@ class TestChallengeStateMachine(unittest.TestCase):
         room.started = True
         return room, sockets
 
-    def test_restore_snapshot_resets_end_game_adjustment(self):
-        room, _ = self._make_room()
+    def _commit(self, room, name="Alice", word="ta", row=7):
+        """Commit *word* from column 7 of *row* for the current player (forced: mock wordlist)."""
         game = room.game
-        room.save_snapshot("Alice")
-        # The (later retracted) move ends the game and applies the adjustment
-        game._end_game_applied = True
-        game.end_game_details = [{"name": "Alice", "final_score": 50}]
-        game.game_over = True
+        game.current_player.rack = list(word)
+        for i in range(len(word)):
+            self.assertTrue(game.place_tile(row, 7 + i, 0))
+        self.assertTrue(game.commit_turn(force=True, defer_draw=True))
+        room.open_challenge(name)
 
-        self.assertTrue(room.restore_snapshot())
+    def test_undo_resets_end_game_adjustment(self):
+        room, _ = self._make_room()
+        game = room.game
+        game.tile_bag.clear()
+        game.players[1].rack = ["e"]
+        # The (later retracted) move empties Alice's rack and ends the game
+        self._commit(room)
+        self.assertTrue(game.game_over)
+        self.assertTrue(game._end_game_applied)
+
+        self.assertTrue(room.undo_challenged_move())
         self.assertFalse(game._end_game_applied)
         self.assertEqual(game.end_game_details, [])
         self.assertFalse(game.game_over)
+        self.assertEqual([p.score for p in game.players], [0, 0])
+        self.assertEqual(game.current_player_idx, 0)
+        self.assertEqual(game.current_turn_tiles, {(7, 7), (7, 8)})
+
+    def test_undo_resyncs_cross_check_cache(self):
+        room, _ = self._make_room()
+        game = room.game
+        self._commit(room)
+        self.assertTrue(game.cross_checks._anchors)
+
+        self.assertTrue(room.undo_challenged_move())
+        self.assertIsNone(game.cross_checks._board[7][7])
+        self.assertEqual(game.cross_checks._anchors, set())
+
+    def test_undo_refused_once_the_move_is_not_the_last(self):
+        room, _ = self._make_room()
+        self._commit(room)
+        turn = room._challengeable_turn
+        room.game.draw_deferred_tiles()
+        self._commit(room, name="Bob", row=8)
+        room._challengeable_turn = turn  # a stale challenge must not undo Bob's move
+        self.assertFalse(room.undo_challenged_move())
+        self.assertEqual(len(room.game.journal), 2)
 
     def test_challenged_player_disconnect_drops_pending_challenge(self):
         from server.app import _cleanup_connection
 
         room, sockets = self._make_room()
-        room.save_snapshot("Alice")
+        self._commit(room)
         room._challenge_pending = {"challenger": "Bob", "challenged": "Alice"}
 
         self._run(_cleanup_connection(room, sockets[0]))  # Alice's socket dies
@@ -719,18 +1035,18 @@ class TestChallengeStateMachine(unittest.TestCase):
         self._run(_handle_force_ack(sockets[1], room))
         self.assertEqual(room._force_acks, {1})
 
-    def test_force_ack_completion_keeps_snapshot_during_pending_challenge(self):
+    def test_force_ack_completion_keeps_move_undoable_during_pending_challenge(self):
         from server.app import _handle_force_ack
 
         room, sockets = self._make_room()
-        room.save_snapshot("Alice")
+        self._commit(room)
         room.set_force_ack_required("Alice")
         room._challenge_pending = {"challenger": "Bob", "challenged": "Alice"}
 
         self._run(_handle_force_ack(sockets[1], room))  # Bob approves (all acked)
-        # Snapshot must survive so the pending challenge can still restore it
-        self.assertIsNotNone(room._pre_commit_snapshot)
-        self.assertTrue(room.restore_snapshot())
+        # The move must stay undoable so the pending challenge can still take it back
+        self.assertIsNotNone(room._challengeable_turn)
+        self.assertTrue(room.undo_challenged_move())
 
     def test_duplicate_name_rejected_at_join(self):
         from server.app import _handle_join_room
@@ -883,7 +1199,10 @@ class TestInputValidation(unittest.TestCase):
                 self.ws2.send_json.assert_not_called()
 
     def test_challenge_from_unknown_socket_gets_error(self):
-        self.room.save_snapshot("Alice")
+        self.game.place_tile(7, 7, 0)
+        self.game.place_tile(7, 8, 0)
+        self.game.commit_turn(force=True, defer_draw=True)
+        self.room.open_challenge("Alice")
         stranger = _make_ws()
         self._run(self.challenge(stranger, self.room))
         self._assert_error(stranger)
@@ -908,5 +1227,470 @@ class TestInputValidation(unittest.TestCase):
         self.assertIs(result, self.room)
 
 
+class TestWarmup(unittest.TestCase):
+    """Startup dictionary warm-up and the /ready endpoint."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _fake_wordlist(self, dawg=object()):
+        wl = MagicMock()
+        wl._dict = object()
+        wl.strict._dict = object()
+        wl.strict.dawg = dawg
+        return wl
+
+    def test_warmup_loads_all_stages_with_timings(self):
+        from server.warmup import DictionaryWarmup
+
+        warmup = DictionaryWarmup()
+        self.assertFalse(warmup.ready)
+        with patch("server.warmup.shared_wordlist", return_value=self._fake_wordlist()):
+            warmup.start()
+            warmup.join(5)
+        report = warmup.snapshot()
+        self.assertTrue(report["ready"])
+        self.assertFalse(report["degraded"])
+        self.assertEqual(list(report["stages"]), ["wordlist", "strict", "dawg"])
+        for stage in report["stages"].values():
+            self.assertEqual(stage["status"], "done")
+            self.assertIsNotNone(stage["seconds"])
+
+    def test_missing_dawg_is_ready_but_degraded(self):
+        from server.warmup import DictionaryWarmup
+
+        warmup = DictionaryWarmup()
+        with patch("server.warmup.shared_wordlist", return_value=self._fake_wordlist(None)):
+            warmup.start()
+            warmup.join(5)
+        report = warmup.snapshot()
+        self.assertTrue(report["ready"])
+        self.assertTrue(report["degraded"])
+        self.assertEqual(report["stages"]["dawg"]["status"], "failed")
+
+    def test_ready_endpoint_gates_on_warmup(self):
+        from server import app as app_module
+        from server.warmup import DictionaryWarmup
+
+        warmup = DictionaryWarmup()
+        with patch.object(app_module, "warmup", warmup):
+            response = self._run(app_module.readiness_check())
+            self.assertEqual(response.status_code, 503)
+            with patch("server.warmup.shared_wordlist", return_value=self._fake_wordlist()):
+                warmup.start()
+                warmup.join(5)
+            response = self._run(app_module.readiness_check())
+            self.assertEqual(response.status_code, 200)
+
+
+class TestDictionaryReload(unittest.TestCase):
+    """Hot reload of the dictionaries (server/reload.py) and its endpoint."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_reload_runs_off_the_loop_and_coalesces(self):
+        import threading
+
+        from server.reload import DictionaryReloader
+
+        release = threading.Event()
+        calls = []
+
+        def reload():
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+
+        reloader = DictionaryReloader(reload, paths=[])
+        swapped = []
+        reloader.on_reloaded(lambda: swapped.append(len(calls)))
+
+        async def scenario():
+            self.assertTrue(reloader.request("admin"))
+            await asyncio.sleep(0.05)
+            self.assertEqual(reloader.stats()["status"], "reloading")
+            # Requests meanwhile run once, after the running reload
+            self.assertFalse(reloader.request("watch"))
+            self.assertFalse(reloader.request("admin"))
+            release.set()
+            await reloader.wait()
+
+        self._run(scenario())
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn(threading.main_thread().name, calls)
+        self.assertEqual(swapped, [1, 2])
+        stats = reloader.stats()
+        self.assertEqual((stats["status"], stats["reloads"], stats["failures"]), ("idle", 2, 0))
+        self.assertEqual((stats["last"]["trigger"], stats["last"]["ok"]), ("admin", True))
+
+    def test_failed_reload_is_reported(self):
+        from server.reload import DictionaryReloader
+
+        def reload():
+            raise RuntimeError("Reloaded dictionary failed to load")
+
+        reloader = DictionaryReloader(reload, paths=[])
+        reloader.on_reloaded(lambda: self.fail("swapped after a failed reload"))
+
+        async def scenario():
+            reloader.request("admin")
+            await reloader.wait()
+
+        self._run(scenario())
+        stats = reloader.stats()
+        self.assertEqual((stats["reloads"], stats["failures"]), (0, 1))
+        self.assertIn("failed to load", stats["last"]["error"])
+
+    def test_watch_reloads_when_contents_change(self):
+        import tempfile
+
+        from server.reload import DictionaryReloader
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "blocked_words.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("öis\n")
+            reloads = []
+            reloader = DictionaryReloader(lambda: reloads.append(1), paths=[path])
+
+            async def scenario():
+                watcher = asyncio.ensure_future(reloader.watch(0.01))
+                await asyncio.sleep(0.05)
+                self.assertEqual(reloader.stats()["watch_interval"], 0.01)
+                # Touched but unchanged (a checkout): no reload
+                os.utime(path, ns=(1, 1))
+                await asyncio.sleep(0.05)
+                self.assertEqual(reloads, [])
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("tk\n")
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if reloads and not reloader.reloading:
+                        break
+                watcher.cancel()
+
+            self._run(scenario())
+        self.assertEqual(reloads, [1])
+        self.assertEqual(reloader.stats()["last"]["trigger"], "watch")
+
+    def test_admin_endpoint_and_stats(self):
+        from server import app as app_module
+        from server.reload import DictionaryReloader
+
+        reloader = DictionaryReloader(lambda: None, paths=[])
+        engine = MagicMock()
+        room = app_module.room_manager.create_room()
+        room.game = MagicMock()
+        self.addCleanup(app_module.room_manager.remove_room, room.code)
+        reloader.on_reloaded(app_module._after_dictionary_reload)
+
+        async def scenario():
+            with patch.object(app_module, "reloader", reloader), \
+                 patch.object(app_module, "ai_engine", engine):
+                with patch.dict(os.environ, {}, clear=True):
+                    response = await app_module.reload_dictionaries("anything")
+                    self.assertEqual(response.status_code, 403)
+                with patch.dict(os.environ, {"ADMIN_TOKEN": "sekret"}):
+                    response = await app_module.reload_dictionaries("wrong")
+                    self.assertEqual(response.status_code, 403)
+                    response = await app_module.reload_dictionaries("sekret")
+                    self.assertEqual(response.status_code, 202)
+                    await reloader.wait()
+                return await app_module.server_stats()
+
+        stats = self._run(scenario())
+        self.assertEqual(stats["dictionary_reload"]["reloads"], 1)
+        room.game.cross_checks.invalidate.assert_called_once_with()
+        engine.restart.assert_called_once_with()
+
+
+class TestAIEngine(unittest.TestCase):
+    """AI move computation in worker processes (server/ai_engine.py)."""
+
+    WORDS = ["maja", "aja", "ma", "kaja", "kass", "sai", "ka"]
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _board(self):
+        board = [[None] * 15 for _ in range(15)]
+        for c, ch in enumerate("maja"):
+            board[7][6 + c] = ch
+        return board
+
+    def _wordlist(self):
+        from game.dawg import Dawg
+
+        wl = MockWordList()
+        wl.words = set(self.WORDS)
+        wl.dawg = Dawg.build(iter(sorted(self.WORDS)))
+        return wl
+
+    def test_job_payload_roundtrip(self):
+        from server.ai_engine import decode_job, encode_job
+
+        job = encode_job(self._board(), ["k", "a", "_"], False, "strong", 2.5)
+        self.assertEqual(len(job[0]), 225)
+        self.assertEqual(decode_job(job),
+                         (self._board(), ["k", "a", "_"], False, "strong", 2.5, None))
+
+    def test_job_carries_the_cache_view(self):
+        from game.cross_checks import CrossCheckCache
+        from server.ai_engine import decode_job, encode_job
+
+        cache = CrossCheckCache()
+        cache.sync(self._board())
+        view = cache.view(self._wordlist().dawg)
+        job = encode_job(self._board(), ["k"], False, "strong", view=view)
+        self.assertEqual(decode_job(job)[5], view)
+
+    def test_thread_mode_uses_game_wordlist_and_cache(self):
+        from game.ai_player import select_move
+        from game.cross_checks import CrossCheckCache
+        from server.ai_engine import AIEngine
+
+        engine = AIEngine(workers=0)
+        wl = self._wordlist()
+        cache = CrossCheckCache()
+        cache.sync(self._board())
+        rack = ["k", "a", "s", "s", "i"]
+        move = self._run(engine.select_move(self._board(), rack, False, "strong",
+                                            wordlist=lambda: wl, cross_checks=cache))
+        self.assertEqual(move.tiles, select_move(self._board(), rack, wl, False, "strong").tiles)
+        self.assertGreater(cache.lines_computed, 0)
+        stats = engine.stats()
+        self.assertEqual((stats["mode"], stats["completed"], stats["in_flight"]),
+                         ("thread", 1, 0))
+        self.assertIsNotNone(stats["recent"]["compute_ms"]["avg"])
+
+    def test_process_workers_preload_the_dawg(self):
+        import tempfile
+
+        from game.ai_player import select_move
+        from game.cross_checks import CrossCheckCache
+        from game.dawg import CompactDawg
+        from server.ai_engine import AIEngine
+
+        wl = self._wordlist()
+        rack = ["k", "a", "s", "s", "i"]
+        expected = select_move(self._board(), rack, wl, False, "strong")
+        with tempfile.TemporaryDirectory() as tmp:
+            dawg_path = os.path.join(tmp, "dawg_strict.dawg")
+            CompactDawg.from_dawg(wl.dawg).save(dawg_path)
+            engine = AIEngine(workers=2, dawg_path=dawg_path,
+                              gaddag_path=os.path.join(tmp, "missing.dawg"))
+            engine.start()
+            try:
+                async def turns():
+                    return await asyncio.gather(*(
+                        engine.select_move(self._board(), rack, False, "strong",
+                                           wordlist=lambda: self.fail("thread mode used"))
+                        for _ in range(4)
+                    ))
+
+                moves = self._run(turns())
+                # With the game's cache, the server computes the checks, once
+                cache = CrossCheckCache()
+                cache.sync(self._board())
+                for _ in range(2):
+                    moves.append(self._run(engine.select_move(
+                        self._board(), rack, False, "strong", wordlist=lambda: wl,
+                        cross_checks=cache,
+                    )))
+                    self.assertEqual(cache.lines_computed, 30)
+            finally:
+                engine.shutdown()
+        for move in moves:
+            self.assertEqual(move.tiles, expected.tiles)
+            self.assertEqual(move.raw_score, expected.raw_score)
+        stats = engine.stats()
+        self.assertEqual((stats["mode"], stats["workers"]), ("process", 2))
+        self.assertEqual((stats["completed"], stats["failed"], stats["queue_depth"]), (6, 0, 0))
+        self.assertEqual(stats["recent"]["jobs"], 6)
+
+    def test_restart_maps_the_replaced_dawg(self):
+        import tempfile
+
+        from game.dawg import CompactDawg, Dawg
+        from server.ai_engine import AIEngine
+
+        rack = ["k", "a", "s", "s", "i"]
+        with tempfile.TemporaryDirectory() as tmp:
+            dawg_path = os.path.join(tmp, "dawg_strict.dawg")
+            CompactDawg.from_dawg(self._wordlist().dawg).save(dawg_path)
+            engine = AIEngine(workers=1, dawg_path=dawg_path,
+                              gaddag_path=os.path.join(tmp, "missing.dawg"))
+            engine.start()
+            try:
+                def move():
+                    return self._run(engine.select_move(self._board(), rack, False, "strong",
+                                                        wordlist=lambda: None))
+
+                played = move().words_formed
+                # A reload replaces the file; running workers keep their mapping
+                words = sorted(set(self.WORDS) - set(played))
+                CompactDawg.from_dawg(Dawg.build(iter(words))).save(dawg_path)
+                self.assertEqual(move().words_formed, played)
+                engine.restart()
+                self.assertTrue(set(move().words_formed).isdisjoint(played))
+            finally:
+                engine.shutdown()
+
+    def test_workers_configured_from_environment(self):
+        from server.ai_engine import AIEngine
+
+        with patch.dict(os.environ, {"AI_WORKERS": "0"}):
+            self.assertEqual(AIEngine().mode, "thread")
+        with patch.dict(os.environ, {"AI_WORKERS": "3"}):
+            self.assertEqual(AIEngine().workers, 3)
+        with patch.dict(os.environ, {"AI_WORKERS": "many"}):
+            self.assertGreaterEqual(AIEngine().workers, 1)
+
+
+class _FakeEngine:
+    """Stands in for AIEngine: records calls, answers after *delay* seconds."""
+
+    workers = 1
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def select_move(self, board, rack, first_move, difficulty, wordlist,
+                          cross_checks=None, budget=None):
+        self.calls.append((rack[0], budget))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return rack[0]
+
+
+class TestAIScheduler(unittest.TestCase):
+    """Fair, deadline-bounded AI turn queue (server/ai_scheduler.py)."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @staticmethod
+    def _turn(scheduler, room_code, tag):
+        return scheduler.select_move(room_code, [], [tag], False, "strong", wordlist=None)
+
+    def test_rooms_take_turns(self):
+        from server.ai_scheduler import AIScheduler
+
+        engine = _FakeEngine(delay=0.01)
+        scheduler = AIScheduler(engine, max_concurrent=1)
+
+        async def turns():
+            return await asyncio.gather(
+                self._turn(scheduler, "AAAA", "a1"), self._turn(scheduler, "AAAA", "a2"),
+                self._turn(scheduler, "AAAA", "a3"), self._turn(scheduler, "BBBB", "b1"),
+                self._turn(scheduler, "CCCC", "c1"),
+            )
+
+        self.assertEqual(self._run(turns()), ["a1", "a2", "a3", "b1", "c1"])
+        # a1 starts at once; then each room gets one turn per round
+        self.assertEqual([tag for tag, _ in engine.calls], ["a1", "a2", "b1", "c1", "a3"])
+
+    def test_concurrency_is_bounded(self):
+        from server.ai_scheduler import AIScheduler
+
+        engine = _FakeEngine()
+        scheduler = AIScheduler(engine, max_concurrent=2)
+
+        async def turns():
+            return await asyncio.gather(*(
+                self._turn(scheduler, f"R{i:03d}", str(i)) for i in range(6)
+            ))
+
+        self._run(turns())
+        self.assertEqual(engine.max_active, 2)
+        stats = scheduler.stats()
+        self.assertEqual((stats["completed"], stats["queued"], stats["running"]), (6, 0, 0))
+        # Queue wait and compute time are reported apart
+        self.assertGreater(stats["recent"]["queue_wait_ms"]["max"], 40)
+        self.assertLess(stats["recent"]["compute_ms"]["max"], 1000)
+
+    def test_search_gets_the_rest_of_the_deadline(self):
+        from server.ai_scheduler import AIScheduler
+
+        engine = _FakeEngine(delay=0.1)
+        scheduler = AIScheduler(engine, max_concurrent=1, deadline=5.0)
+
+        async def turns():
+            return await asyncio.gather(self._turn(scheduler, "AAAA", "a"),
+                                        self._turn(scheduler, "BBBB", "b"))
+
+        self._run(turns())
+        (_, first), (_, second) = engine.calls
+        self.assertLessEqual(first, 5.0)
+        self.assertLess(second, first - 0.05)
+
+    def test_job_expired_in_queue_passes(self):
+        from server.ai_scheduler import AIScheduler
+
+        engine = _FakeEngine(delay=0.2)
+        scheduler = AIScheduler(engine, max_concurrent=1, deadline=0.1)
+
+        async def turns():
+            return await asyncio.gather(self._turn(scheduler, "AAAA", "a"),
+                                        self._turn(scheduler, "BBBB", "b"))
+
+        # The first search overruns its budget and is abandoned after the
+        # grace period; the second expired while waiting and never runs
+        with patch("server.ai_scheduler._GRACE", 0.0):
+            self.assertEqual(self._run(turns()), [None, None])
+        self.assertEqual([tag for tag, _ in engine.calls], ["a"])
+        stats = scheduler.stats()
+        self.assertEqual((stats["timed_out"], stats["expired"], stats["completed"]), (1, 1, 0))
+        # Both waits are reported; neither turn has a compute time
+        self.assertEqual(stats["recent"]["jobs"], 2)
+        self.assertGreater(stats["recent"]["queue_wait_ms"]["max"], 0)
+        self.assertIsNone(stats["recent"]["compute_ms"]["avg"])
+
+    def test_full_queue_passes_immediately(self):
+        from server.ai_scheduler import AIScheduler
+
+        engine = _FakeEngine()
+        scheduler = AIScheduler(engine, max_concurrent=1, max_queued=1)
+
+        async def turns():
+            return await asyncio.gather(*(
+                self._turn(scheduler, "AAAA", tag) for tag in ("a", "b", "c")
+            ))
+
+        # "a" runs at once, "b" waits, "c" finds the queue full
+        self.assertEqual(self._run(turns()), ["a", "b", None])
+        self.assertEqual(scheduler.stats()["rejected"], 1)
+
+    def test_removed_room_cancels_its_jobs(self):
+        from server.ai_scheduler import AIScheduler
+
+        engine = _FakeEngine(delay=0.1)
+        scheduler = AIScheduler(engine, max_concurrent=1)
+        manager = RoomManager(on_remove=scheduler.cancel_room)
+        room = manager.create_room()
+
+        async def turns():
+            running = asyncio.ensure_future(self._turn(scheduler, room.code, "a1"))
+            queued = asyncio.ensure_future(self._turn(scheduler, room.code, "a2"))
+            other = asyncio.ensure_future(self._turn(scheduler, "ZZZZ", "z"))
+            await asyncio.sleep(0.01)
+            manager.remove_room(room.code.lower())
+            results = await asyncio.gather(running, queued, other, return_exceptions=True)
+            return [type(r) if isinstance(r, BaseException) else r for r in results]
+
+        cancelled = asyncio.CancelledError
+        self.assertEqual(self._run(turns()), [cancelled, cancelled, "z"])
+        self.assertEqual([tag for tag, _ in engine.calls], ["a1", "z"])
+        stats = scheduler.stats()
+        self.assertEqual((stats["cancelled"], stats["queued"], stats["running"]), (2, 0, 0))
+
+
 if __name__ == "__main__":
     unittest.main()
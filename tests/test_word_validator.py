@@ -72,5 +72,80 @@ class TestWordValidator(unittest.TestCase):
         tiles = {(7, 7), (7, 9)}  # K and S around existing U
         self.assertTrue(self.validator._are_turn_tiles_connected(board, tiles))
 
+
+class CountingWordList(MockWordList):
+    """Mock wordlist that records every lookup."""
+    def __init__(self, words):
+        super().__init__(words)
+        self.lookups = []
+
+    def is_valid_word(self, word: str) -> bool:
+        self.lookups.append(word)
+        return super().is_valid_word(word)
+
+
+class TestIncrementalValidation(unittest.TestCase):
+    """Validation after each tile change re-checks only the words it touched."""
+
+    def setUp(self):
+        self.wordlist = CountingWordList({"ema", "maa", "kes", "sees", "emas", "ma", "as"})
+        self.validator = WordValidator(self.wordlist)
+        self.board = [[None] * 15 for _ in range(15)]
+        # Committed "maa" down column 8 from row 6
+        for r, ch in enumerate("maa", start=6):
+            self.board[r][8] = ch
+        self.tiles = set()
+
+    def _place(self, row, col, letter):
+        self.board[row][col] = letter
+        self.tiles.add((row, col))
+        return self.validator.validate_placement(self.board, self.tiles)
+
+    def _remove(self, row, col):
+        self.board[row][col] = None
+        self.tiles.discard((row, col))
+        return self.validator.validate_placement(self.board, self.tiles)
+
+    def _fresh(self):
+        return dict(WordValidator(MockWordList(self.wordlist.words))
+                    .validate_placement(self.board, self.tiles))
+
+    def test_only_touched_words_are_looked_up(self):
+        self.board[6][9] = "k"
+        self._place(7, 7, "e")             # "ea"
+        self.assertEqual(self.wordlist.lookups, ["ea"])
+        self._place(7, 9, "s")             # "eas" replaces "ea"; "ks" down
+        self.assertEqual(sorted(self.wordlist.lookups[1:]), ["eas", "ks"])
+        self.wordlist.lookups.clear()
+        self._place(7, 10, "s")            # "eass" replaces "eas"; "ks" kept
+        self.assertEqual(self.wordlist.lookups, ["eass"])
+        self.wordlist.lookups.clear()
+        self._remove(7, 7)                 # "ass" replaces "eass"
+        self.assertEqual(self.wordlist.lookups, ["ass"])
+        self.assertEqual(dict(self.validator.word_validity), self._fresh())
+
+    def test_matches_validation_from_scratch(self):
+        moves = [
+            ("place", 7, 7, "e"), ("place", 7, 9, "s"), ("place", 5, 8, "e"),
+            ("remove", 7, 7), ("place", 7, 6, "k"), ("place", 7, 7, "e"),
+            ("remove", 7, 9), ("remove", 5, 8), ("place", 9, 8, "s"),
+            ("place", 7, 10, "s"), ("remove", 7, 6), ("remove", 7, 7),
+        ]
+        for move in moves:
+            with self.subTest(move=move):
+                if move[0] == "place":
+                    result = self._place(*move[1:])
+                else:
+                    result = self._remove(*move[1:])
+                self.assertEqual(dict(result), self._fresh())
+
+    def test_new_board_starts_over(self):
+        self._place(7, 7, "e")
+        self.board = [row[:] for row in self.board]
+        self.board[6][8] = None
+        self.assertEqual(dict(self.validator.validate_placement(self.board, self.tiles)),
+                         self._fresh())
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
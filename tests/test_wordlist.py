@@ -6,7 +6,12 @@ behaviour of the patched dictionary (tools/patch_dictionary.py) plus the
 blocklist and vowelless guard in WordList.
 """
 
+import logging
+import os
+import tempfile
+import threading
 import unittest
+from unittest.mock import patch
 
 try:
     import spylls  # noqa: F401
@@ -15,7 +20,8 @@ try:
 except ImportError:
     HAS_SPYLLS = False
 
-from wordlist import WordList
+import wordlist
+from wordlist import ValidationCache, WordList, shared_wordlist
 
 
 @unittest.skipUnless(HAS_SPYLLS, "spylls not installed")
@@ -121,6 +127,380 @@ class TestWordValidation(unittest.TestCase):
     def test_nonsense_rejected(self):
         self.assert_invalid(["xyzzy", "qwrty", "asdfgh"])
 
+    def test_strict_dawg_agrees_with_hunspell(self):
+        """The strict fast path (DAWG) accepts exactly what strict Hunspell does.
+
+        Checked on every 200th stem of the strict dictionary with a set of
+        case endings, which gives both real forms and non-words.
+        """
+        from tools.build_dawg import _WORD_RE, VOWELS
+
+        strict = self.wordlist.strict
+        if strict._dict is None or strict.dawg is None:
+            self.skipTest("strict dictionary or DAWG not available")
+        endings = ["", "d", "ga", "le", "st", "sse", "de", "id", "iga", "ks"]
+        sample = {
+            entry.stem + ending
+            for entry in strict._dict.dic.words[::200]
+            for ending in endings
+        }
+        sample = [
+            w for w in sample
+            if _WORD_RE.fullmatch(w) and set(w) & VOWELS and w not in strict._blocked
+        ]
+        disagree = [w for w in sample if strict.dawg.is_word(w) != bool(strict._dict.lookup(w))]
+        self.assertEqual(disagree, [])
+
+    def test_acceptor_agrees_with_hunspell(self):
+        """The compiled acceptor accepts exactly what the permissive Hunspell does.
+
+        Checked on inflections of every 500th stem and on compounds of
+        neighbouring stems, which gives real words, compounds and
+        non-words.
+        """
+        acceptor = self.wordlist._acceptor
+        if acceptor is None:
+            self.skipTest("dictionary acceptor not available")
+        hunspell = self.wordlist._dict
+        stems = [entry.stem for entry in hunspell.dic.words[::500]]
+        endings = ["", "d", "ga", "le", "st", "sse", "de", "id", "iga", "ks"]
+        sample = {stem + ending for stem in stems for ending in endings}
+        sample |= {a + b + ending for a, b in zip(stems, stems[1:]) for ending in endings[:4]}
+        sample = [w for w in sample if acceptor.covers(w)]
+        disagree = [w for w in sample if acceptor.accepts(w) != bool(hunspell.lookup(w))]
+        self.assertEqual(disagree, [])
+
+
+class TestSharedWordList(unittest.TestCase):
+    """One dictionary per process, however many games run."""
+
+    def test_loaded_once_and_shared(self):
+        with patch.object(wordlist, "_shared", None), \
+             patch("wordlist.WordList") as MockWL:
+            first = shared_wordlist()
+            self.assertIs(shared_wordlist(), first)
+        MockWL.assert_called_once_with()
+
+    def test_concurrent_first_use_loads_once(self):
+        results = []
+        with patch.object(wordlist, "_shared", None), \
+             patch("wordlist.WordList") as MockWL:
+            threads = [
+                threading.Thread(target=lambda: results.append(shared_wordlist()))
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        MockWL.assert_called_once_with()
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_game_states_share_the_dictionary(self):
+        from game.state import GameState
+
+        with patch.object(wordlist, "_shared", None), \
+             patch("wordlist.WordList") as MockWL:
+            games = [GameState() for _ in range(3)]
+        MockWL.assert_called_once_with()
+        self.assertTrue(all(g.wordlist is games[0].wordlist for g in games))
+        self.assertIs(games[0].word_validator.wordlist, games[0].wordlist)
+
+
+class _CountingDictionary:
+    """Stands in for a spylls Dictionary; counts lookups."""
+
+    def __init__(self, words):
+        self.words = set(words)
+        self.lookups = 0
+
+    def lookup(self, word):
+        self.lookups += 1
+        return word in self.words
+
+
+def _wordlist_without_hunspell(words, blocked=()) -> WordList:
+    """A WordList over *words*, skipping the download and dictionary load."""
+    wl = WordList.__new__(WordList)
+    wl.logger = logging.getLogger(__name__)
+    wl._dict = _CountingDictionary(words)
+    wl._acceptor = None
+    wl._blocked = set(blocked)
+    wl.cache = ValidationCache()
+    wl._strict = None
+    wl._strict_lock = threading.Lock()
+    return wl
+
+
+class _StrictStub:
+    """Stands in for a loaded StrictWordList."""
+
+    def __init__(self):
+        self._dawg = self.dawg = object()
+        self.gaddag = None
+
+    def preload(self):
+        pass
+
+
+class TestReloadSharedWordList(unittest.TestCase):
+    """Hot reload: new dictionaries swapped into the shared WordList."""
+
+    def _fresh(self, words, blocked=()):
+        fresh = _wordlist_without_hunspell(words, blocked)
+        fresh._strict = _StrictStub()
+        return fresh
+
+    def test_swaps_in_place_and_clears_the_cache(self):
+        current = _wordlist_without_hunspell({"maja", "öis"})
+        old_strict = current._strict = _StrictStub()
+        self.assertTrue(current.is_valid_word("öis"))
+        fresh = self._fresh({"maja", "kala", "öis"}, blocked={"öis"})
+        with patch.object(wordlist, "_shared", current), \
+             patch("wordlist.WordList", return_value=fresh):
+            self.assertIs(wordlist.reload_shared_wordlist(), current)
+        self.assertFalse(current.is_valid_word("öis"))
+        self.assertTrue(current.is_valid_word("kala"))
+        self.assertIs(current.strict, fresh._strict)
+        self.assertIsNot(current.strict, old_strict)  # held by searches already running
+        self.assertEqual(current.cache.invalidations, 1)
+
+    def test_failed_load_keeps_the_current_dictionaries(self):
+        current = _wordlist_without_hunspell({"maja"})
+        current._strict = _StrictStub()
+        fresh = self._fresh(())
+        fresh._dict = None
+        with patch.object(wordlist, "_shared", current), \
+             patch("wordlist.WordList", return_value=fresh):
+            with self.assertRaises(RuntimeError):
+                wordlist.reload_shared_wordlist()
+        self.assertTrue(current.is_valid_word("maja"))
+        self.assertIsNot(current.strict, fresh._strict)
+
+
+class TestValidationCache(unittest.TestCase):
+    """The LRU in front of the dictionary lookups."""
+
+    def test_repeat_lookups_hit_the_cache(self):
+        wl = _wordlist_without_hunspell({"maja"})
+        for word in ["maja", "MAJA", "Maja", "xyz", "xyz"]:
+            wl.is_valid_word(word)
+        self.assertEqual(wl._dict.lookups, 1)  # "xyz" is vowelless: no lookup at all
+        stats = wl.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (3, 2, 2))
+        self.assertGreater(stats["memory_bytes"], 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ValidationCache(maxsize=2)
+        cache.lookup("a", lambda w: True)
+        cache.lookup("b", lambda w: True)
+        cache.lookup("a", lambda w: True)    # "b" is now the oldest
+        cache.lookup("c", lambda w: False)
+        self.assertEqual(list(cache._entries), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_clear_drops_answers_in_flight(self):
+        cache = ValidationCache()
+
+        def check(word):
+            cache.clear()  # the dictionary was reloaded while looking up
+            return True
+
+        self.assertTrue(cache.lookup("maja", check))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.invalidations, 1)
+
+
+@unittest.skipUnless(HAS_SPYLLS, "spylls not installed")
+class TestStrictDawgFastPath(unittest.TestCase):
+    """StrictWordList answers from the DAWG, Hunspell only as the fallback."""
+
+    STEMS = ["maja", "kala", "tee", "pall", "õun", "sõber"]
+    ENDINGS = ["d", "ga", "le", "st", "sse", "ks"]
+
+    @classmethod
+    def setUpClass(cls):
+        from spylls.hunspell import Dictionary
+
+        from game.dawg import CompactDawg, Dawg
+        from tools.build_dawg import unmunch_strict_dictionary
+        from tools.patch_dictionary import STRICT_BASE
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, STRICT_BASE)
+            with open(base + ".aff", "w", encoding="utf-8") as f:
+                f.write(f"SET UTF-8\n\nSFX A N {len(cls.ENDINGS)}\n")
+                f.writelines(f"SFX A 0 {ending} .\n" for ending in cls.ENDINGS)
+            with open(base + ".dic", "w", encoding="utf-8") as f:
+                f.write(f"{len(cls.STEMS)}\n")
+                f.writelines(f"{stem}/A\n" for stem in cls.STEMS)
+            cls.hunspell = Dictionary.from_files(base)
+            words = unmunch_strict_dictionary(tmp)
+        cls.dawg = CompactDawg.from_dawg(Dawg.build(iter(words)))
+
+    def _strict(self, dawg) -> wordlist.StrictWordList:
+        strict = wordlist.StrictWordList.__new__(wordlist.StrictWordList)
+        strict._blocked = set()
+        strict.logger = logging.getLogger(__name__)
+        strict.cache = ValidationCache()
+        strict._dict = self.hunspell
+        strict._dawg, strict._dawg_loaded = dawg, True
+        strict._gaddag, strict._gaddag_loaded = None, True
+        strict._dawg_lock = threading.Lock()
+        return strict
+
+    def _sample(self):
+        forms = [stem + ending for stem in self.STEMS for ending in [""] + self.ENDINGS]
+        # Each form with its last letter changed: mostly non-words
+        return forms + [form[:-1] + ("a" if form[-1] != "a" else "e") for form in forms]
+
+    def test_agrees_with_hunspell(self):
+        strict = self._strict(self.dawg)
+        for word in self._sample():
+            with self.subTest(word=word):
+                self.assertEqual(strict.is_valid_word(word), bool(self.hunspell.lookup(word)))
+
+    def test_dawg_answers_without_hunspell(self):
+        strict = self._strict(self.dawg)
+        with patch.object(self.hunspell, "lookup", side_effect=AssertionError("Hunspell used")):
+            self.assertTrue(strict.is_valid_word("Majaga"))
+            self.assertFalse(strict.is_valid_word("majaks2"))
+
+    def test_falls_back_to_hunspell_without_dawg(self):
+        strict = self._strict(None)
+        with patch.object(self.hunspell, "lookup", wraps=self.hunspell.lookup) as lookup:
+            self.assertTrue(strict.is_valid_word("sõberle"))
+        self.assertTrue(lookup.called)
+
+
+@unittest.skipUnless(HAS_SPYLLS, "spylls not installed")
+class TestCompoundAcceptor(unittest.TestCase):
+    """The compiled permissive dictionary answers like spylls, compounds included."""
+
+    AFF = """SET UTF-8
+COMPOUNDFLAG Z
+COMPOUNDMIN 2
+COMPOUNDWORDMAX 3
+CHECKCOMPOUNDDUP
+
+SFX A Y 5
+SFX A 0 d .
+SFX A 0 ga .
+SFX A 0 le [^e]
+SFX A 0 st .
+SFX A 0 sse [aeiu]
+
+SFX B Y 3
+SFX B a e a
+SFX B ja i ja
+SFX B maja kodu maja
+"""
+    # "maa tee" forbids the compound maatee; "kodu" fully strips "maja"
+    DIC = [
+        "maja/ABZ", "kala/AZ", "tee/AZ", "uks/A", "puu/Z", "aed/AZ", "tk/Z", "maa/AZ",
+        "maa tee", "õun", "öö/Z", "sõber/AZ", "ema/BZ", "isa/A", "pall/AZ", "Tallinn/AZ",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        from spylls.hunspell import Dictionary
+
+        from tools.build_acceptor import compile_acceptor
+        from tools.patch_dictionary import PATCHED_BASE
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, PATCHED_BASE)
+            with open(base + ".aff", "w", encoding="utf-8") as f:
+                f.write(cls.AFF)
+            with open(base + ".dic", "w", encoding="utf-8") as f:
+                f.write(f"{len(cls.DIC)}\n")
+                f.writelines(f"{entry}\n" for entry in cls.DIC)
+            cls.hunspell = Dictionary.from_files(base)
+            cls.acceptor = compile_acceptor(base)
+
+    def _sample(self, n=3000):
+        """Forms, compounds of up to four parts, their mutations and random strings."""
+        import random
+
+        from game.dawg import ALPHABET
+
+        rng = random.Random(7)
+        stems = [entry.split("/")[0].lower() for entry in self.DIC if " " not in entry]
+        endings = ["", "d", "ga", "le", "st", "sse", "e", "i", "kodu"]
+        parts = [stem + ending for stem in stems for ending in endings]
+        sample = set(parts)
+        while len(sample) < n:
+            kind = rng.randrange(3)
+            if kind == 0:
+                k = rng.randint(2, 4)
+                word = "".join(rng.choice(parts if i == k - 1 else stems) for i in range(k))
+            elif kind == 1:
+                word = rng.choice(sorted(sample))
+                i = rng.randrange(len(word))
+                word = word[:i] + rng.choice(ALPHABET + "-") + word[i + 1:]
+            else:
+                word = "".join(rng.choice("aeiklmpstu") for _ in range(rng.randint(1, 12)))
+            sample.add(word)
+        return sorted(sample)
+
+    def test_agrees_with_hunspell(self):
+        sample = self._sample()
+        covered = [w for w in sample if self.acceptor.covers(w)]
+        self.assertGreater(len(covered), len(sample) * 0.8)
+        accepted = [w for w in covered if self.acceptor.accepts(w)]
+        self.assertGreater(len(accepted), 100)
+        disagree = [w for w in covered if self.acceptor.accepts(w) != bool(self.hunspell.lookup(w))]
+        self.assertEqual(disagree, [])
+
+    def test_compound_rules(self):
+        accepts = self.acceptor.accepts
+        self.assertTrue(accepts("kodu"))           # full-stem strip
+        self.assertTrue(accepts("puutee"))
+        self.assertFalse(accepts("maatee"))        # "maa tee" is an entry
+        self.assertFalse(accepts("kalakala"))      # CHECKCOMPOUNDDUP
+        self.assertTrue(accepts("kalakalad"))
+        self.assertTrue(accepts("puuteekala"))
+        self.assertTrue(accepts("kalaöömaapuu"))
+        self.assertFalse(accepts("kalaöömaapuutee"))  # COMPOUNDWORDMAX
+        self.assertFalse(accepts("majadkala"))     # affixes end a compound only
+        self.assertFalse(accepts("uksmaja"))       # no compound flag
+        self.assertFalse(accepts("tallinn"))       # no lowercase entry
+
+    def test_save_and_load(self):
+        from game.acceptor import CompoundAcceptor
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "acceptor.dawg")
+            self.acceptor.save(path)
+            loaded = CompoundAcceptor.load(path)
+            sample = [w for w in self._sample(500) if loaded.covers(w)]
+            self.assertEqual([loaded.accepts(w) for w in sample],
+                             [self.acceptor.accepts(w) for w in sample])
+            self.assertEqual(loaded.spaced, frozenset({"maa tee"}))
+
+    def test_unsupported_dictionary_refused(self):
+        from tools.build_acceptor import UnsupportedDictionary, compile_acceptor
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, "prefixed")
+            with open(base + ".aff", "w", encoding="utf-8") as f:
+                f.write("SET UTF-8\n\nPFX P Y 1\nPFX P 0 ülim .\n")
+            with open(base + ".dic", "w", encoding="utf-8") as f:
+                f.write("1\nmaja/P\n")
+            with self.assertRaisesRegex(UnsupportedDictionary, "PFX"):
+                compile_acceptor(base)
+
+    def test_wordlist_answers_from_acceptor(self):
+        wl = _wordlist_without_hunspell(set())
+        wl._dict = self.hunspell
+        wl._acceptor = self.acceptor
+        with patch.object(self.hunspell, "lookup", side_effect=AssertionError("Hunspell used")):
+            self.assertTrue(wl.is_valid_word("Puuteekala"))
+            self.assertFalse(wl.is_valid_word("maatee"))
+        with patch.object(self.hunspell, "lookup", wraps=self.hunspell.lookup) as lookup:
+            self.assertTrue(wl.is_valid_word("maja-kala"))  # a hyphen: outside the acceptor
+        self.assertTrue(lookup.called)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,244 @@
+"""Benchmark the DAWG layouts: resident memory and AI move-generation time.
+
+Compares the dict-per-node :class:`game.dawg.Dawg` with the array-backed
+:class:`game.dawg.CompactDawg` (mmapped from its binary file), and the
+GADDAG generator (game/gaddag.py, compact layout) against both. Uses the
+production DAWG (dict/dawg_strict.dawg) when it has been built,
+otherwise a synthetic Estonian-like lexicon (random stems × case
+endings) of similar shape.
+
+Each layout is loaded in a fresh subprocess, so the reported RSS growth
+belongs to that layout alone. The move generator walks the compact
+arrays, so the dict layout's movegen time includes its one-off
+conversion. Move generation runs the full search
+(``find_all_moves``) over the same set of mid-game boards and racks;
+``select_move`` adds scoring and the strong-mode heuristics on top.
+Move generation is also timed with one and two of each rack's tiles
+swapped for blanks: a blank can be any letter, so blank-heavy racks
+are where the generator's letter-mask intersections matter most.
+
+Usage: python -m tools.bench_dawg [--words N] [--boards N]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from game.constants import LETTER_DISTRIBUTION
+from game.dawg import ALPHABET, CompactDawg, Dawg
+from game.gaddag import GADDAG_ALPHABET, build_gaddag, gaddag_is_word
+from tools.build_dawg import DAWG_FILE, GADDAG_FILE
+
+# Case endings of a typical Estonian noun paradigm (singular and plural)
+_ENDINGS = (
+    "", "d", "ga", "le", "lt", "l", "s", "st", "sse", "ks", "ni", "na", "ta",
+    "de", "dele", "delt", "del", "des", "dest", "desse", "deks", "deni", "dena",
+    "deta", "dega", "t", "id", "iga", "il", "is",
+)
+_VOWELS = "aeiouõäöü"
+_CONSONANTS = "".join(ch for ch in ALPHABET if ch not in _VOWELS)
+
+
+def synthetic_words(n_stems: int = 20000, seed: int = 1) -> List[str]:
+    """A sorted Estonian-like lexicon: random CV stems × case endings."""
+    rng = random.Random(seed)
+    weights = [LETTER_DISTRIBUTION[ch]["count"] for ch in _CONSONANTS]
+    stems = set()
+    while len(stems) < n_stems:
+        syllables = rng.randint(1, 3)
+        stem = "".join(
+            rng.choices(_CONSONANTS, weights)[0] + rng.choice(_VOWELS)
+            for _ in range(syllables)
+        )
+        stems.add(stem)
+    words = {
+        stem + ending
+        for stem in sorted(stems)
+        for ending in rng.sample(_ENDINGS, rng.randint(4, len(_ENDINGS)))
+        if 2 <= len(stem + ending) <= 15
+    }
+    return sorted(words)
+
+
+def _draw_rack(rng: random.Random, bag: List[str]) -> List[str]:
+    return [bag.pop(rng.randrange(len(bag))) for _ in range(min(7, len(bag)))]
+
+
+class _DawgWordList:
+    """The minimal wordlist shape the move generator needs."""
+
+    def __init__(self, dawg, gaddag=None):
+        self.dawg = dawg
+        self.gaddag = gaddag
+
+    def is_valid_word(self, word: str) -> bool:
+        if self.dawg is None:
+            return gaddag_is_word(self.gaddag, word.lower())
+        return self.dawg.is_word(word.lower())
+
+
+def midgame_boards(
+    dawg, n_boards: int = 10, moves_per_board: int = 8, seed: int = 7
+) -> List[Tuple[List[List[Optional[str]]], List[str]]]:
+    """(board, rack) pairs reached by letting the strong AI play itself."""
+    from game.ai_player import select_move
+
+    rng = random.Random(seed)
+    wordlist = _DawgWordList(dawg)
+    positions = []
+    for _ in range(n_boards):
+        board: List[List[Optional[str]]] = [[None] * 15 for _ in range(15)]
+        bag = [ch for ch, info in LETTER_DISTRIBUTION.items() for _ in range(info["count"])]
+        first = True
+        for _ in range(moves_per_board):
+            rack = _draw_rack(rng, bag)
+            move = select_move(board, rack, wordlist, first, difficulty="strong")
+            if move is None:
+                continue
+            for r, c, ch in move.tiles:
+                board[r][c] = ch
+            first = False
+        positions.append((board, _draw_rack(rng, bag)))
+    return positions
+
+
+def _with_blanks(rack: List[str], n_blanks: int) -> List[str]:
+    """*rack* with its last *n_blanks* tiles replaced by blanks."""
+    kept = [t for t in rack if t != "_"][:max(len(rack) - n_blanks, 0)]
+    return kept + ["_"] * (len(rack) - len(kept))
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (Linux /proc; ru_maxrss elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _worker(layout: str, dawg_path: str, boards_path: str) -> dict:
+    """Load one layout and time move generation (runs in a subprocess)."""
+    from game.ai_player import find_all_moves, select_move
+
+    with open(boards_path, encoding="utf-8") as f:
+        positions = json.load(f)
+    rss_before = _rss_bytes()
+    t0 = time.perf_counter()
+    dawg = (Dawg if layout == "dict" else CompactDawg).load(dawg_path)
+    load_seconds = time.perf_counter() - t0
+    rss_growth = _rss_bytes() - rss_before
+
+    if layout == "gaddag":
+        wordlist = _DawgWordList(None, dawg)
+    else:
+        wordlist = _DawgWordList(dawg)
+    n_moves = 0
+    t0 = time.perf_counter()
+    for board, rack in positions:
+        n_moves += len(find_all_moves(board, rack, wordlist))
+    gen_seconds = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for board, rack in positions:
+        select_move(board, rack, wordlist, difficulty="strong")
+    select_seconds = time.perf_counter() - t0
+    by_blanks = []
+    for n_blanks in (0, 1, 2):
+        t0 = time.perf_counter()
+        for board, rack in positions:
+            find_all_moves(board, _with_blanks(rack, n_blanks), wordlist)
+        by_blanks.append((time.perf_counter() - t0) / len(positions) * 1000)
+    return {
+        "layout": layout,
+        "nodes": len(dawg),
+        "load_seconds": load_seconds,
+        "rss_growth_mb": rss_growth / 1e6,
+        "movegen_ms_per_board": gen_seconds / len(positions) * 1000,
+        "select_ms_per_board": select_seconds / len(positions) * 1000,
+        "movegen_ms_by_blanks": by_blanks,
+        "moves": n_moves,
+    }
+
+
+def run_benchmark(words: Optional[Iterable[str]] = None, n_boards: int = 10) -> List[dict]:
+    """Benchmark the layouts; returns one result dict per layout.
+
+    The GADDAG row is skipped for the production lexicon unless
+    dict/gaddag_strict.dawg has been built (``build_dawg --gaddag``).
+    """
+    lexicon: Optional[List[str]] = None
+    if words is None and os.path.exists(DAWG_FILE):
+        compact = CompactDawg.load(DAWG_FILE)
+        dawg = Dawg(
+            [compact.is_final(n) for n in range(len(compact))],
+            [dict(compact.children(n)) for n in range(len(compact))],
+        )
+    else:
+        lexicon = sorted(words) if words is not None else synthetic_words()
+        dawg = Dawg.build(iter(lexicon))
+    positions = midgame_boards(dawg, n_boards)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            "dict": os.path.join(tmp, "dawg.marshal"),
+            "compact": os.path.join(tmp, "dawg_strict.dawg"),
+        }
+        dawg.save(paths["dict"])
+        CompactDawg.from_dawg(dawg).save(paths["compact"])
+        if lexicon is not None:
+            paths["gaddag"] = os.path.join(tmp, "gaddag_strict.dawg")
+            gaddag = CompactDawg.from_dawg(build_gaddag(lexicon), GADDAG_ALPHABET)
+            gaddag.save(paths["gaddag"])
+        elif os.path.exists(GADDAG_FILE):
+            paths["gaddag"] = GADDAG_FILE
+        boards_path = os.path.join(tmp, "boards.json")
+        with open(boards_path, "w", encoding="utf-8") as f:
+            json.dump(positions, f)
+        for layout, path in paths.items():
+            out = subprocess.run(
+                [sys.executable, "-m", "tools.bench_dawg", "--worker", layout, path, boards_path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results.append(json.loads(out))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=None,
+                        help="use a synthetic lexicon with this many stems")
+    parser.add_argument("--boards", type=int, default=10, help="mid-game boards to time")
+    parser.add_argument("--worker", nargs=3, metavar=("LAYOUT", "DAWG", "BOARDS"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(*args.worker)))
+        return
+
+    words = synthetic_words(args.words) if args.words else None
+    for r in run_benchmark(words, args.boards):
+        print(
+            f"{r['layout']:8s} nodes={r['nodes']:>8d}  load={r['load_seconds'] * 1000:7.1f} ms  "
+            f"RSS +{r['rss_growth_mb']:6.1f} MB  "
+            f"movegen={r['movegen_ms_per_board']:7.1f} ms/board  "
+            f"select_move={r['select_ms_per_board']:7.1f} ms/board  ({r['moves']} moves)"
+        )
+        by_blanks = "  ".join(
+            f"{n} blank{'' if n == 1 else 's'}: {ms:7.1f} ms"
+            for n, ms in enumerate(r["movegen_ms_by_blanks"])
+        )
+        print(f"{'':8s} movegen by rack: {by_blanks}")
+
+
+if __name__ == "__main__":
+    main()
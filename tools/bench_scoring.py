@@ -0,0 +1,99 @@
+"""Micro-benchmark the move scorers on an AI turn's candidate moves.
+
+Every candidate move the AI considers outside the DAWG/GADDAG
+generators — brute-force search, tests, the strong-mode re-scoring —
+goes through ``ai_player._calculate_move_score``, and every human move
+through ``GameState._calculate_word_score``. This times both over all
+candidate moves of a set of mid-game positions (synthetic lexicon, see
+tools/bench_dawg.py), excluding move generation:
+
+- ``move scorer``: ``_calculate_move_score`` per move (board copy, word
+  reads and premium lookups included);
+- ``word scorer``: ``GameState._calculate_word_score`` over each move's
+  words, read beforehand.
+
+Usage: python -m tools.bench_scoring [--words N] [--boards N] [--repeat N]
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+
+from game.ai_player import Move, _calculate_move_score, _read_word, find_all_moves
+from game.dawg import CompactDawg, Dawg
+from game.state import GameState
+from tools.bench_dawg import _DawgWordList, midgame_boards, synthetic_words
+
+
+def _candidate_moves(n_stems: int, n_boards: int) -> List[Tuple[list, Move]]:
+    """(board, move) for every candidate move of *n_boards* mid-game positions."""
+    dawg = CompactDawg.from_dawg(Dawg.build(iter(synthetic_words(n_stems))))
+    wordlist = _DawgWordList(dawg)
+    return [
+        (board, move)
+        for board, rack in midgame_boards(dawg, n_boards)
+        for move in find_all_moves(board, rack, wordlist)
+    ]
+
+
+def _move_words(board, move: Move) -> list:
+    """The (word, positions) pairs *move* forms, as GameState scores them."""
+    placed = [row[:] for row in board]
+    for r, c, ch in move.tiles:
+        placed[r][c] = ch
+    words = {}
+    for r, c, _ in move.tiles:
+        for dr, dc in ((0, 1), (1, 0)):
+            info = _read_word(placed, r, c, dr, dc)
+            if info is not None:
+                words[tuple(info[1])] = info
+    return list(words.values())
+
+
+def run_benchmark(n_stems: int = 20000, n_boards: int = 10, repeat: int = 3) -> dict:
+    """Best-of-*repeat* µs per move for both scorers."""
+    moves = _candidate_moves(n_stems, n_boards)
+
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for board, move in moves:
+            _calculate_move_score(board, move)
+        best = min(best, time.perf_counter() - t0)
+    move_us = best / len(moves) * 1e6
+
+    # Only the scorer's inputs are set: a full GameState loads the dictionary
+    game = GameState.__new__(GameState)
+    turns = [
+        (set(move.positions), {pos: "_" for pos in move.blanks}, _move_words(board, move))
+        for board, move in moves
+    ]
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for positions, blanks, words in turns:
+            game.current_turn_tiles = positions
+            game.blank_designations = blanks
+            for info in words:
+                game._calculate_word_score(info)
+        best = min(best, time.perf_counter() - t0)
+    word_us = best / len(moves) * 1e6
+
+    return {"moves": len(moves), "move_scorer_us": move_us, "word_scorer_us": word_us}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=20000, help="synthetic lexicon stems")
+    parser.add_argument("--boards", type=int, default=10, help="mid-game boards")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs (best is kept)")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.words, args.boards, args.repeat)
+    print(f"{r['moves']} candidate moves")
+    print(f"move scorer  {r['move_scorer_us']:7.2f} µs/move")
+    print(f"word scorer  {r['word_scorer_us']:7.2f} µs/move")
+
+
+if __name__ == "__main__":
+    main()
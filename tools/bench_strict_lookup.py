@@ -0,0 +1,121 @@
+"""Benchmark strict-dictionary word validation: spylls lookup vs the DAWG.
+
+``StrictWordList.is_valid_word`` answers from the DAWG when it is
+loaded and falls back to the spylls ``Dictionary.lookup`` otherwise.
+This times both per lookup, uncached, over the same sample of words
+(half dictionary forms, half the same forms with one letter changed).
+The two must agree on every word in the sample.
+
+Uses the production strict dictionary and DAWG (dict/) when they have
+been built. Otherwise it writes a synthetic suffix-only Hunspell
+dictionary of Estonian-like stems (see tools/bench_dawg.py) to a
+temporary directory and builds its DAWG the same way
+tools/build_dawg.py does.
+
+Usage: python -m tools.bench_strict_lookup [--stems N] [--words N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import List, Tuple
+
+from game.dawg import CompactDawg, Dawg
+from tools.bench_dawg import _ENDINGS, synthetic_words
+from tools.build_dawg import DAWG_FILE, PLAYABLE, unmunch_strict_dictionary
+from tools.patch_dictionary import DICT_DIR, STRICT_BASE
+
+
+def write_synthetic_dictionary(dict_dir: str, n_stems: int = 5000) -> None:
+    """A strict-style .dic/.aff pair: Estonian-like stems, one suffix flag of case endings."""
+    stems = sorted({word for word in synthetic_words(n_stems) if len(word) <= 6})[:n_stems]
+    suffixes = [ending for ending in _ENDINGS if ending]
+    with open(os.path.join(dict_dir, STRICT_BASE + ".aff"), "w", encoding="utf-8") as f:
+        f.write("SET UTF-8\n\n")
+        f.write(f"SFX A N {len(suffixes)}\n")
+        for ending in suffixes:
+            f.write(f"SFX A 0 {ending} .\n")
+    with open(os.path.join(dict_dir, STRICT_BASE + ".dic"), "w", encoding="utf-8") as f:
+        f.write(f"{len(stems)}\n")
+        for stem in stems:
+            f.write(f"{stem}/A\n")
+
+
+def _sample(words: List[str], n: int, seed: int = 3) -> List[str]:
+    """*n* words: half from *words*, half of those with one letter changed."""
+    rng = random.Random(seed)
+    valid = rng.sample(words, min(n // 2, len(words)))
+    mutated = []
+    for word in valid:
+        i = rng.randrange(len(word))
+        mutated.append(word[:i] + rng.choice(PLAYABLE) + word[i + 1:])
+    return valid + mutated
+
+
+def _load(dict_dir: str, n_stems: int) -> Tuple[object, CompactDawg, List[str], str]:
+    """(spylls dictionary, DAWG, its forms, source description)."""
+    from spylls.hunspell import Dictionary
+
+    base = os.path.join(dict_dir, STRICT_BASE)
+    words = unmunch_strict_dictionary(dict_dir)
+    if dict_dir == DICT_DIR and os.path.exists(DAWG_FILE):
+        dawg = CompactDawg.load(DAWG_FILE)
+        source = "production dictionary"
+    else:
+        dawg = CompactDawg.from_dawg(Dawg.build(iter(words)))
+        source = f"synthetic dictionary ({n_stems} stems)"
+    return Dictionary.from_files(base), dawg, words, source
+
+
+def run_benchmark(n_stems: int = 5000, n_words: int = 2000, repeat: int = 3) -> dict:
+    """Best-of-*repeat* µs per lookup for Hunspell and the DAWG."""
+    with tempfile.TemporaryDirectory() as tmp:
+        if os.path.exists(os.path.join(DICT_DIR, STRICT_BASE + ".dic")):
+            dict_dir = DICT_DIR
+        else:
+            write_synthetic_dictionary(tmp, n_stems)
+            dict_dir = tmp
+        hunspell, dawg, words, source = _load(dict_dir, n_stems)
+    sample = _sample(words, n_words)
+
+    mismatches = [w for w in sample if bool(hunspell.lookup(w)) != dawg.is_word(w)]
+
+    timings = {}
+    for name, lookup in (("hunspell", hunspell.lookup), ("dawg", dawg.is_word)):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for word in sample:
+                lookup(word)
+            best = min(best, time.perf_counter() - t0)
+        timings[name] = best / len(sample) * 1e6
+
+    return {
+        "source": source,
+        "words": len(sample),
+        "hunspell_us": timings["hunspell"],
+        "dawg_us": timings["dawg"],
+        "speedup": timings["hunspell"] / timings["dawg"],
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stems", type=int, default=5000, help="synthetic dictionary stems")
+    parser.add_argument("--words", type=int, default=2000, help="words looked up")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs (best is kept)")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.stems, args.words, args.repeat)
+    print(f"{r['source']}, {r['words']} lookups")
+    print(f"hunspell  {r['hunspell_us']:8.2f} µs/lookup")
+    print(f"dawg      {r['dawg_us']:8.2f} µs/lookup  ({r['speedup']:.0f}x)")
+    if r["mismatches"]:
+        print(f"{len(r['mismatches'])} disagreements, e.g. {r['mismatches'][:5]}")
+
+
+if __name__ == "__main__":
+    main()
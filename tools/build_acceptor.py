@@ -0,0 +1,189 @@
+"""Compile the permissive dictionary into a compound acceptor.
+
+``WordList.is_valid_word`` checks every human move against the patched
+``et_EE_scrabble`` dictionary. Through spylls that is a pure-Python
+affix and compound analysis per word. This compiles the dictionary into
+a :class:`game.acceptor.CompoundAcceptor` that gives the same answers:
+
+1. Expand every .dic entry by its suffix rules, the way spylls
+   de-suffixes a word: the stem alone, plus each rule of each of its
+   flags whose strip the stem ends with and whose condition it matches.
+2. Collect the compound parts. Under ``COMPOUNDFLAG`` a compound is a
+   run of flagged bare stems (affixes only attach to the last part)
+   ended by any form of a flagged root, each part at least
+   ``COMPOUNDMIN`` letters.
+3. Save the forms, heads and tails as one marked DAWG to
+   dict/acceptor_scrabble.dawg, the compound settings next to it.
+
+Only the .aff features above are compiled: suffixes without
+continuation flags, ``COMPOUNDFLAG``, ``COMPOUNDMIN``,
+``COMPOUNDWORDMAX``, ``CHECKCOMPOUNDDUP`` and space-separated entries.
+A dictionary using anything else (prefixes, compound rules, forbidden
+or affix-only words, ...) raises :class:`UnsupportedDictionary`, and
+WordList keeps validating through spylls.
+
+Usage: python -m tools.build_acceptor
+"""
+
+import logging
+import os
+import re
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from game.acceptor import ACCEPTOR_ALPHABET, HEAD, MAX_LENGTH, TAIL, CompoundAcceptor
+from game.dawg import ALPHABET, CompactDawg, Dawg
+from tools.build_cache import Artifact, BuildCache, repo_file
+from tools.patch_dictionary import DICT_DIR, PATCHED_BASE
+
+logger = logging.getLogger(__name__)
+
+ACCEPTOR_FILE = os.path.join(DICT_DIR, "acceptor_scrabble.dawg")
+
+# spylls lookup features the acceptor does not model
+_UNSUPPORTED_FLAGS = (
+    "COMPOUNDBEGIN", "COMPOUNDMIDDLE", "COMPOUNDEND", "COMPOUNDPERMITFLAG",
+    "COMPOUNDFORBIDFLAG", "ONLYINCOMPOUND", "NEEDAFFIX", "FORBIDDENWORD", "CIRCUMFIX",
+    "FORCEUCASE", "ICONV", "IGNORE",
+)
+_UNSUPPORTED_OPTIONS = (
+    "COMPOUNDRULE", "CHECKCOMPOUNDREP", "CHECKCOMPOUNDTRIPLE", "CHECKCOMPOUNDCASE",
+    "CHECKCOMPOUNDPATTERN", "SIMPLIFIEDTRIPLE",
+)
+
+_WORD_RE = re.compile(f"[{ALPHABET}]{{1,{MAX_LENGTH}}}$")
+_SPACED_RE = re.compile(f"[{ALPHABET}]+ [{ALPHABET}]+$")
+
+
+class UnsupportedDictionary(ValueError):
+    """The dictionary uses an .aff feature the acceptor does not compile."""
+
+
+def _check_supported(aff) -> None:
+    used = [name for name in _UNSUPPORTED_FLAGS + _UNSUPPORTED_OPTIONS if getattr(aff, name)]
+    if aff.PFX:
+        used.append("PFX")
+    if any(sfx.flags for suffixes in aff.SFX.values() for sfx in suffixes):
+        used.append("SFX continuation flags")
+    letters = set(ALPHABET)
+    if any(set(pattern.pattern) & letters for pattern in aff.BREAK):
+        used.append("BREAK")
+    if used:
+        raise UnsupportedDictionary(f"unsupported .aff features: {', '.join(used)}")
+
+
+def _expand(d) -> Iterator[Tuple[str, bool]]:
+    """(form, whether its root has the compound flag) for every form of every entry."""
+    # Group each flag's rules by condition: each regex is tested once per stem
+    cond_groups: Dict[str, List[Tuple[re.Pattern, List[Tuple[str, str]]]]] = {}
+    for flag, suffixes in d.aff.SFX.items():
+        by_cond: Dict[str, Tuple[re.Pattern, List[Tuple[str, str]]]] = {}
+        for sfx in suffixes:
+            by_cond.setdefault(sfx.condition, (sfx.cond_regexp, []))[1].append(
+                (sfx.strip, sfx.add)
+            )
+        cond_groups[flag] = list(by_cond.values())
+
+    compound_flag = d.aff.COMPOUNDFLAG
+    for entry in d.dic.words:
+        stem = entry.stem
+        compounds = compound_flag is not None and compound_flag in entry.flags
+        yield stem, compounds
+        for flag in entry.flags:
+            for rx, pairs in cond_groups.get(flag, ()):
+                if rx.search(stem) is None:
+                    continue
+                for strip, add in pairs:
+                    # spylls strips the whole stem too (a rule may replace it)
+                    if stem.endswith(strip):
+                        yield stem[:len(stem) - len(strip)] + add, compounds
+
+
+def compile_acceptor(dict_base: str) -> CompoundAcceptor:
+    """Compile the Hunspell dictionary at *dict_base* (.dic/.aff) into an acceptor."""
+    from spylls.hunspell import Dictionary
+
+    d = Dictionary.from_files(dict_base)
+    aff = d.aff
+    _check_supported(aff)
+
+    fullmatch = _WORD_RE.fullmatch
+    forms: Set[str] = set()
+    tails: Set[str] = set()
+    spaced: Set[str] = set()
+    for form, compounds in _expand(d):
+        if fullmatch(form):
+            (tails if compounds else forms).add(form)
+        elif " " in form and _SPACED_RE.match(form):
+            spaced.add(form)
+    heads = set()
+    if aff.COMPOUNDFLAG is not None:
+        heads = {entry.stem for entry in d.dic.words
+                 if aff.COMPOUNDFLAG in entry.flags and fullmatch(entry.stem)}
+    forms -= tails
+
+    # A tail is also a plain form: it is stored once, marked
+    words = sorted(
+        [*forms, *(form + TAIL for form in tails), *(stem + HEAD for stem in heads)]
+    )
+    del forms, tails, heads
+    dawg = CompactDawg.from_dawg(Dawg.build(iter(words)), ACCEPTOR_ALPHABET)
+    return CompoundAcceptor(
+        dawg,
+        compound_min=aff.COMPOUNDMIN,
+        compound_word_max=aff.COMPOUNDWORDMAX,
+        check_compound_dup=aff.CHECKCOMPOUNDDUP,
+        spaced=frozenset(spaced),
+    )
+
+
+def build_acceptor(dict_dir: str = DICT_DIR) -> str:
+    """Compile + save the permissive dictionary's acceptor. Returns the output path."""
+    t0 = time.monotonic()
+    acceptor = compile_acceptor(os.path.join(dict_dir, PATCHED_BASE))
+    out = os.path.join(dict_dir, os.path.basename(ACCEPTOR_FILE))
+    acceptor.save(out)
+    BuildCache(dict_dir).record(acceptor_artifact(dict_dir))
+    logger.info(
+        "Acceptor built: %d nodes, %.1f MB, %.0fs",
+        len(acceptor.dawg), os.path.getsize(out) / 1e6, time.monotonic() - t0,
+    )
+    return out
+
+
+def acceptor_artifact(dict_dir: str = DICT_DIR) -> Artifact:
+    """The acceptor and its settings, keyed by the permissive dictionary."""
+    out = os.path.join(dict_dir, os.path.basename(ACCEPTOR_FILE))
+    return Artifact(
+        "acceptor",
+        inputs=[
+            os.path.join(dict_dir, PATCHED_BASE + ".dic"),
+            os.path.join(dict_dir, PATCHED_BASE + ".aff"),
+            os.path.abspath(__file__),
+            repo_file("game", "acceptor.py"),
+            repo_file("game", "dawg.py"),
+        ],
+        outputs=[out, os.path.splitext(out)[0] + ".json"],
+    )
+
+
+def acceptor_stale(dict_dir: str = DICT_DIR) -> bool:
+    """Whether the acceptor must be compiled for the current dictionary.
+
+    False if dict/ holds the build of its contents, or the build cache
+    had one to restore (see tools/build_cache.py).
+    """
+    return not BuildCache(dict_dir).fresh(acceptor_artifact(dict_dir))
+
+
+def load_acceptor(dict_dir: str = DICT_DIR) -> Optional[CompoundAcceptor]:
+    """The saved acceptor, or None if it has not been built."""
+    out = os.path.join(dict_dir, os.path.basename(ACCEPTOR_FILE))
+    if not os.path.exists(out):
+        return None
+    return CompoundAcceptor.load(out)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    build_acceptor()
@@ -0,0 +1,204 @@
+"""Content-addressed cache of the dictionary build artifacts.
+
+The patched dictionaries, the DAWG (and GADDAG) and the compiled
+acceptor are derived files in dict/. Deciding whether to rebuild them
+from file mtimes misfires both ways: a ``git checkout`` or a Docker
+layer copy touches unchanged inputs and forces a ~30 s rebuild, and an
+input edited and then reverted is never recognized as a known build.
+
+Here an artifact is keyed by the SHA-256 of its inputs' contents — the
+source files it is built from, plus the builder's own code, so changing
+the builder invalidates it too. ``dict/cache/manifest.json`` records,
+per artifact, the key its files in dict/ were built from and the
+content hash of each file, and keeps a copy of the last few builds
+under ``dict/cache/<artifact>/<key>/``:
+
+- :meth:`BuildCache.is_current`: dict/ holds the build for the current
+  key, unmodified;
+- :meth:`BuildCache.restore`: an earlier build for the current key is
+  copied back into place instead of being rebuilt;
+- :meth:`BuildCache.record`: called by a builder after writing its
+  outputs, keeps a copy and makes it current.
+
+Builders expose ``*_stale()`` checks on top of :meth:`BuildCache.fresh`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "cache"
+MANIFEST_NAME = "manifest.json"
+# Manifest layout version: a manifest of another version is ignored
+MANIFEST_VERSION = 1
+# Builds kept per artifact (the current one and the most recently used others)
+DEFAULT_KEEP = 3
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def repo_file(*parts: str) -> str:
+    """Path of a file in the repository (builder sources are artifact inputs)."""
+    return os.path.join(_REPO_ROOT, *parts)
+
+
+def file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file's contents, or None if it does not exist."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
+@dataclass
+class Artifact:
+    """A set of files in dict/ built from a set of input files."""
+
+    name: str
+    # Files whose contents determine the build; a missing input counts as empty-but-distinct
+    inputs: Sequence[str]
+    # Files the builder writes, all in the cache's dict_dir
+    outputs: Sequence[str]
+
+    def key(self) -> str:
+        h = hashlib.sha256(self.name.encode())
+        for path in self.inputs:
+            h.update(b"\0" + os.path.basename(path).encode() + b"\0")
+            h.update((file_digest(path) or "missing").encode())
+        return h.hexdigest()
+
+
+class BuildCache:
+    """The manifest and stored builds under ``<dict_dir>/cache``."""
+
+    def __init__(self, dict_dir: str, keep: int = DEFAULT_KEEP):
+        self.dict_dir = dict_dir
+        self.root = os.path.join(dict_dir, CACHE_DIRNAME)
+        self.manifest_path = os.path.join(self.root, MANIFEST_NAME)
+        self.keep = keep
+
+    # -- manifest -----------------------------------------------------------
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            manifest = {"version": MANIFEST_VERSION, "artifacts": {}}
+        return manifest
+
+    def _save(self, manifest: Dict) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".manifest-", dir=self.root)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def _store_dir(self, artifact: Artifact, key: str) -> str:
+        return os.path.join(self.root, artifact.name, key[:32])
+
+    # -- queries ------------------------------------------------------------
+
+    def is_current(self, artifact: Artifact, key: Optional[str] = None) -> bool:
+        """Whether dict/ holds the build of *artifact*'s inputs as they are now."""
+        key = key or artifact.key()
+        entry = self._load()["artifacts"].get(artifact.name, {})
+        build = entry.get("builds", {}).get(key)
+        if entry.get("current") != key or build is None:
+            return False
+        names = {os.path.basename(path) for path in artifact.outputs}
+        if set(build["files"]) != names:
+            return False
+        return all(
+            file_digest(os.path.join(self.dict_dir, name)) == digest
+            for name, digest in build["files"].items()
+        )
+
+    def restore(self, artifact: Artifact, key: Optional[str] = None) -> bool:
+        """Copy a stored build of the current inputs back into dict/; False if there is none."""
+        key = key or artifact.key()
+        manifest = self._load()
+        entry = manifest["artifacts"].get(artifact.name, {})
+        build = entry.get("builds", {}).get(key)
+        names = {os.path.basename(path) for path in artifact.outputs}
+        if build is None or not names <= set(build["files"]):
+            return False
+        store = self._store_dir(artifact, key)
+        if any(file_digest(os.path.join(store, name)) != digest
+               for name, digest in build["files"].items()):
+            return False  # the stored copy is damaged: rebuild
+        for name in build["files"]:
+            self._copy(os.path.join(store, name), os.path.join(self.dict_dir, name))
+        entry["current"] = key
+        build["used"] = time.time()
+        self._save(manifest)
+        logger.info("Restored %s from the build cache (%s)", artifact.name, key[:12])
+        return True
+
+    def fresh(self, artifact: Artifact) -> bool:
+        """Whether dict/ holds the current build of *artifact*, restoring a stored one if needed."""
+        key = artifact.key()
+        return self.is_current(artifact, key) or self.restore(artifact, key)
+
+    # -- recording ----------------------------------------------------------
+
+    def record(self, artifact: Artifact) -> str:
+        """Store the outputs just built from the current inputs and make them current.
+
+        Returns the key. Only the :attr:`keep` most recently used builds
+        of the artifact are kept.
+        """
+        key = artifact.key()
+        manifest = self._load()
+        entry = manifest["artifacts"].setdefault(artifact.name, {"builds": {}})
+        store = self._store_dir(artifact, key)
+        shutil.rmtree(store, ignore_errors=True)
+        os.makedirs(store)
+        files = {}
+        for path in artifact.outputs:
+            name = os.path.basename(path)
+            self._copy(path, os.path.join(store, name))
+            files[name] = file_digest(path)
+        entry["current"] = key
+        entry["builds"][key] = {"files": files, "used": time.time()}
+        self._prune(artifact, entry)
+        self._save(manifest)
+        return key
+
+    def _prune(self, artifact: Artifact, entry: Dict) -> None:
+        builds = entry["builds"]
+        by_use = sorted(builds, key=lambda k: builds[k]["used"], reverse=True)
+        for key in by_use[self.keep:]:
+            shutil.rmtree(self._store_dir(artifact, key), ignore_errors=True)
+            del builds[key]
+
+    @staticmethod
+    def _copy(src: str, dst: str) -> None:
+        """Copy *src* over *dst* atomically: readers never see a partial file."""
+        fd, tmp = tempfile.mkstemp(prefix=".copy-", dir=os.path.dirname(dst))
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dst)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def builds(self, artifact_name: str) -> List[str]:
+        """Keys of the stored builds of an artifact, most recently used first."""
+        builds = self._load()["artifacts"].get(artifact_name, {}).get("builds", {})
+        return sorted(builds, key=lambda k: builds[k]["used"], reverse=True)
@@ -1,40 +1,78 @@
 """Build the AI's DAWG from the strict Scrabble dictionary (issue #40).
 
-Two steps, both fast enough to run automatically when the dictionary
-changes (~30 s total, done once and cached in dict/):
+The first two steps are fast enough to run automatically when the
+dictionary changes (~30 s total on one core, done once and cached in
+dict/):
 
 1. Unmunch: expand every .dic stem by its suffix rules into the full
    set of playable surface forms. The strict .aff is suffix-only (no
    prefixes, no continuation flags, no compounding), so single-level
-   suffix application is the complete expansion — ~10.7M words.
-2. Build a DAWG (game/dawg.py) from the sorted words and marshal it
-   to dict/dawg_strict.marshal (~1 MB — Estonian inflection paradigms
-   share suffixes almost perfectly).
+   suffix application is the complete expansion — ~10.7M words. The
+   stems are sharded by range across a process pool (``--workers``,
+   default one per CPU); each shard yields a sorted, deduplicated run
+   and the runs are merged into one sorted stream. With
+   ``--max-memory`` the runs spill to files, bounding the word sets
+   held at once, and a k-way merge streams them into step 2.
+2. Build a DAWG (game/dawg.py) from the sorted words and save it in
+   the compact binary format to dict/dawg_strict.dawg (~1 MB —
+   Estonian inflection paradigms share suffixes almost perfectly).
+   The server mmaps that file read-only, so all worker processes
+   share one page-cache copy.
+3. Optionally (``--gaddag``) build a GADDAG (game/gaddag.py) from the
+   same words into dict/gaddag_strict.dawg. The AI prefers it when
+   present; it is several times the DAWG's size and takes minutes to
+   build, so it is opt-in — but once built, it is kept in step with the
+   DAWG on every rebuild.
+
+Blocklist and extra-word edits do not need steps 1-3 again:
+dict/dawg_strict.json records what the DAWG was built from, and
+:func:`update_dawg` patches the words those edits add or remove into
+the saved DAWG and GADDAG (``Dawg.update``). Only the edited words are
+unmunched, but each graph is still decoded, re-registered and written
+out whole: under a second for the DAWG, several times that for a
+GADDAG, against minutes for a full build. Only changed builder code,
+a changed .aff, an upstream .dic change or a removed extra word
+rebuilds everything; ``--full`` forces that.
 
 Filters mirror WordList.strict.is_valid_word: playable alphabet only,
 length 2–15, no blocked words, no vowelless words.
 
-Usage: python -m tools.build_dawg
+Usage: python -m tools.build_dawg [--gaddag] [--workers N] [--max-memory MB] [--full]
 """
 
+import argparse
+import contextlib
+import hashlib
+import heapq
+import json
 import logging
+import multiprocessing
 import os
 import re
+import tempfile
 import time
-from typing import Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
-from game.dawg import Dawg
+from game.dawg import CompactDawg, Dawg
+from game.gaddag import GADDAG_ALPHABET, build_gaddag, gaddag_strings
+from tools.build_cache import Artifact, BuildCache, file_digest, repo_file
 from tools.patch_dictionary import DICT_DIR, STRICT_BASE
 
 logger = logging.getLogger(__name__)
 
 _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 BLOCKED_FILE = os.path.join(_REPO_ROOT, "data", "blocked_words.txt")
-DAWG_FILE = os.path.join(DICT_DIR, "dawg_strict.marshal")
+DAWG_FILE = os.path.join(DICT_DIR, "dawg_strict.dawg")
+GADDAG_FILE = os.path.join(DICT_DIR, "gaddag_strict.dawg")
+# What the DAWG was built from, for incremental updates (update_dawg)
+DAWG_META_FILE = os.path.join(DICT_DIR, "dawg_strict.json")
 
 PLAYABLE = "abdefghijklmnoprstuvzõäöüšž"
 VOWELS = set("aeiouõäöü")
 _WORD_RE = re.compile(f"[{PLAYABLE}]{{2,15}}$")
+# Unmunch shards per worker process
+_SHARDS_PER_WORKER = 4
 
 
 def _load_blocked() -> Set[str]:
@@ -50,41 +88,74 @@ def _load_blocked() -> Set[str]:
     return blocked
 
 
-def unmunch_strict_dictionary(dict_dir: str = DICT_DIR) -> Set[str]:
-    """Expand the strict dictionary's stems × suffix rules into all forms."""
-    from spylls.hunspell import Dictionary
-
-    d = Dictionary.from_files(os.path.join(dict_dir, STRICT_BASE))
-
-    # Group each flag's suffix rules by condition so each distinct
-    # condition regex is tested once per stem, not once per subrule.
+def _suffix_groups(aff) -> Dict[str, List[Tuple[Optional[str], List[Tuple[str, str]]]]]:
+    """Each flag's suffix rules grouped by condition ("." as None), picklable for workers."""
     cond_groups = {}
-    for flag, suffixes in d.aff.SFX.items():
-        by_cond = {}
+    for flag, suffixes in aff.SFX.items():
+        by_cond: Dict[str, List[Tuple[str, str]]] = {}
         for sfx in suffixes:
             by_cond.setdefault(sfx.condition, []).append((sfx.strip, sfx.add))
-        groups = []
-        for cond, pairs in by_cond.items():
-            rx = None if cond == "." else re.compile(cond.replace("-", "\\-") + "$")
-            groups.append((rx, pairs))
-        cond_groups[flag] = groups
+        cond_groups[flag] = [
+            (None if cond == "." else cond, pairs) for cond, pairs in by_cond.items()
+        ]
+    return cond_groups
+
+
+# A run of sorted, unique forms: a list, or the path of a file with one per line
+Run = Union[List[str], str]
+
+# Bytes a form costs while a shard collects and sorts it (str, set slot, list slot)
+_BYTES_PER_FORM = 200
+# Most run files merged at once; more are merged in passes first
+_MERGE_FAN_IN = 64
+
+# Per-process unmunch state, set once by _init_shards
+_shard_groups: Dict[str, List[Tuple[Optional[re.Pattern], List[Tuple[str, str]]]]] = {}
+_shard_blocked: FrozenSet[str] = frozenset()
+_shard_spill_dir: Optional[str] = None
+_shard_spill_at = 0
+
 
+def _init_shards(cond_groups, blocked: FrozenSet[str], spill_dir: Optional[str] = None,
+                 spill_at: int = 0) -> None:
+    global _shard_groups, _shard_blocked, _shard_spill_dir, _shard_spill_at
+    _shard_groups = {
+        flag: [
+            (None if cond is None else re.compile(cond.replace("-", "\\-") + "$"), pairs)
+            for cond, pairs in groups
+        ]
+        for flag, groups in cond_groups.items()
+    }
+    _shard_blocked = blocked
+    _shard_spill_dir = spill_dir
+    _shard_spill_at = spill_at
+
+
+def _unmunch_shard(
+    entries: Sequence[Tuple[str, Tuple[str, ...]]],
+) -> Tuple[List[Run], Set[str]]:
+    """Sorted, deduplicated playable forms of (stem, flags) *entries*, as runs.
+
+    One in-memory run, unless the shard spills: then a run file every
+    ``spill_at`` forms. Also returns the forms left out as blocked.
+    """
     playable_set = set(PLAYABLE)
-    blocked = _load_blocked()
     words: Set[str] = set()
+    runs: List[Run] = []
+    blocked_forms: Set[str] = set()
     fullmatch = _WORD_RE.fullmatch
+    spill_at = _shard_spill_at
 
-    for entry in d.dic.words:
-        stem = entry.stem
+    for stem, flags in entries:
         # The stem itself is a valid standalone word (the strict aff has
         # no NEEDAFFIX flag).
         if fullmatch(stem):
             words.add(stem)
-        if not entry.flags:
+        if not flags:
             continue
         stem_clean = set(stem) <= playable_set
-        for flag in entry.flags:
-            groups = cond_groups.get(flag)
+        for flag in flags:
+            groups = _shard_groups.get(flag)
             if groups is None:
                 continue  # inert flag (e.g. the old compound flag Z)
             for rx, pairs in groups:
@@ -102,41 +173,381 @@ def unmunch_strict_dictionary(dict_dir: str = DICT_DIR) -> Set[str]:
                             words.add(form)
                     elif fullmatch(form):
                         words.add(form)
+        if spill_at and len(words) >= spill_at:
+            runs.append(_end_run(words, blocked_forms))
+            words = set()
+
+    if words or not runs:
+        runs.append(_end_run(words, blocked_forms))
+    return runs, blocked_forms
+
+
+def _end_run(words: Set[str], blocked_forms: Set[str]) -> Run:
+    words = {w for w in words if not VOWELS.isdisjoint(w)}
+    blocked_forms |= words & _shard_blocked
+    run = sorted(words - _shard_blocked)
+    if _shard_spill_dir is None:
+        return run
+    return _write_run(run, _shard_spill_dir)
+
+
+def _write_run(words: Iterable[str], spill_dir: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=spill_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.writelines(word + "\n" for word in words)
+    return path
 
-    return {w for w in words if w not in blocked and set(w) & VOWELS}
 
+def _read_run(run: Run) -> Iterator[str]:
+    if isinstance(run, list):
+        yield from run
+        return
+    with open(run, encoding="utf-8") as f:
+        for line in f:
+            yield line[:-1]
+
+
+def merge_runs(runs: Iterable[Iterable[str]]) -> Iterator[str]:
+    """Merge sorted runs of words into one sorted stream without duplicates."""
+    last = None
+    for word in heapq.merge(*runs):
+        if word != last:
+            yield word
+            last = word
+
+
+def _merge_passes(runs: List[Run], spill_dir: str) -> List[Run]:
+    """Merge run files in groups until at most _MERGE_FAN_IN are left open at once."""
+    while len(runs) > _MERGE_FAN_IN:
+        merged: List[Run] = []
+        for i in range(0, len(runs), _MERGE_FAN_IN):
+            group = runs[i:i + _MERGE_FAN_IN]
+            merged.append(_write_run(merge_runs(_read_run(run) for run in group), spill_dir))
+            for run in group:
+                if isinstance(run, str):
+                    os.remove(run)
+        runs = merged
+    return runs
+
+
+def default_workers() -> int:
+    """Unmunch processes: one per CPU."""
+    return os.cpu_count() or 1
+
+
+def unmunch_runs(dict_dir: str = DICT_DIR, workers: Optional[int] = None,
+                 timings: Optional[Dict[str, float]] = None, spill_dir: Optional[str] = None,
+                 max_memory: Optional[int] = None,
+                 blocked_forms: Optional[Set[str]] = None) -> List[Run]:
+    """Expand the strict dictionary's stems × suffix rules into sorted runs of forms.
+
+    The .dic entries are cut into contiguous shards that *workers*
+    processes (default: one per CPU) expand into sorted, deduplicated
+    runs; one worker expands in this process. With a *spill_dir*, runs
+    are files there, and *max_memory* bytes (shared by the workers) caps
+    the forms a shard holds before it writes a run. Seconds spent parsing
+    and expanding are added to *timings*, and the forms left out because
+    they are blocked to *blocked_forms*, if given.
+    """
+    from spylls.hunspell import Dictionary
 
-def build_dawg(dict_dir: str = DICT_DIR) -> str:
-    """Unmunch + build + save the DAWG. Returns the output path."""
     t0 = time.monotonic()
-    words = unmunch_strict_dictionary(dict_dir)
+    d = Dictionary.from_files(os.path.join(dict_dir, STRICT_BASE))
+    entries = [(entry.stem, tuple(entry.flags)) for entry in d.dic.words]
+    cond_groups = _suffix_groups(d.aff)
+    del d
+    blocked = frozenset(_load_blocked())
+    workers = max(1, default_workers() if workers is None else workers)
+    spill_at = 0
+    if spill_dir is not None and max_memory:
+        spill_at = max(1, max_memory // (workers * _BYTES_PER_FORM))
     t1 = time.monotonic()
-    dawg = Dawg.build(iter(sorted(words)))
-    out = os.path.join(dict_dir, "dawg_strict.marshal")
-    dawg.save(out)
-    logger.info(
-        "DAWG built: %d words -> %d nodes, %.1f MB, unmunch %.0fs + build %.0fs",
-        len(words), len(dawg), os.path.getsize(out) / 1e6,
-        t1 - t0, time.monotonic() - t1,
-    )
+
+    if workers == 1:
+        _init_shards(cond_groups, blocked, spill_dir, spill_at)
+        results = [_unmunch_shard(entries)]
+    else:
+        # A few shards per worker, so one slow shard does not hold up the rest
+        size = -(-len(entries) // (workers * _SHARDS_PER_WORKER)) or 1
+        shards = [entries[i:i + size] for i in range(0, len(entries), size)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # spawn, not fork: WordList builds from a server with threads running
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_shards,
+            initargs=(cond_groups, blocked, spill_dir, spill_at),
+        ) as pool:
+            results = list(pool.map(_unmunch_shard, shards))
+    runs = [run for shard_runs, _ in results for run in shard_runs]
+    if blocked_forms is not None:
+        for _, shard_blocked in results:
+            blocked_forms |= shard_blocked
+    if timings is not None:
+        timings.update(parse=t1 - t0, expand=time.monotonic() - t1)
+    return runs
+
+
+def unmunch_strict_dictionary(dict_dir: str = DICT_DIR, workers: Optional[int] = None,
+                              timings: Optional[Dict[str, float]] = None) -> List[str]:
+    """All strict-dictionary forms, sorted: :func:`unmunch_runs` merged in memory."""
+    runs = unmunch_runs(dict_dir, workers, timings)
+    t0 = time.monotonic()
+    words = list(merge_runs(_read_run(run) for run in runs))
+    if timings is not None:
+        timings["merge"] = time.monotonic() - t0
+    return words
+
+
+def build_dawg(dict_dir: str = DICT_DIR, gaddag: Optional[bool] = None,
+               workers: Optional[int] = None, timings: Optional[Dict[str, float]] = None,
+               max_memory: Optional[int] = None, incremental: bool = True) -> str:
+    """Unmunch + build + save the DAWG. Returns the output path.
+
+    With *incremental*, blocklist and extra-word edits are patched into
+    the existing DAWG instead (:func:`update_dawg`) when that is possible.
+    *gaddag* also builds the GADDAG; the default None rebuilds it only
+    if one was built before, so it never goes stale next to the DAWG.
+    *workers* is passed to :func:`unmunch_runs`. With *max_memory*
+    (bytes) the runs spill to a temporary directory in *dict_dir* and
+    stream through a k-way merge into the DAWG, which comes out the same,
+    byte for byte. Seconds per phase are logged and added to *timings*
+    if given: merge is the pre-merging of spilled runs, since the final
+    merge streams into the build.
+    """
+    gaddag_out = os.path.join(dict_dir, os.path.basename(GADDAG_FILE))
+    if gaddag is None:
+        gaddag = os.path.exists(gaddag_out)
+    if incremental and (os.path.exists(gaddag_out) or not gaddag) and update_dawg(dict_dir):
+        return os.path.join(dict_dir, os.path.basename(DAWG_FILE))
+    phases: Dict[str, float] = {}
+    blocked_forms: Set[str] = set()
+    spill = (tempfile.TemporaryDirectory(prefix=".unmunch-", dir=dict_dir)
+             if max_memory else contextlib.nullcontext())
+    with spill as spill_dir:
+        runs = unmunch_runs(dict_dir, workers, phases, spill_dir, max_memory, blocked_forms)
+        t0 = time.monotonic()
+        if spill_dir is not None:
+            runs = _merge_passes(runs, spill_dir)
+        t1 = time.monotonic()
+        n_words = 0
+
+        def words() -> Iterator[str]:
+            nonlocal n_words
+            for word in merge_runs(_read_run(run) for run in runs):
+                n_words += 1
+                yield word
+
+        dawg = Dawg.build(words())
+        t2 = time.monotonic()
+        out = os.path.join(dict_dir, os.path.basename(DAWG_FILE))
+        CompactDawg.from_dawg(dawg).save(out)
+        phases.update(merge=t1 - t0, build=t2 - t1, save=time.monotonic() - t2)
+        logger.info(
+            "DAWG built: %d words -> %d nodes, %.1f MB (%s)",
+            n_words, len(dawg), os.path.getsize(out) / 1e6, _format_phases(phases),
+        )
+        if gaddag:
+            # The GADDAG sorts every rotation of every word: it needs them all in memory
+            del dawg
+            t3 = time.monotonic()
+            gdawg = build_gaddag(list(merge_runs(_read_run(run) for run in runs)))
+            CompactDawg.from_dawg(gdawg, GADDAG_ALPHABET).save(gaddag_out)
+            phases["gaddag"] = time.monotonic() - t3
+            logger.info(
+                "GADDAG built: %d nodes, %.1f MB, %.0fs",
+                len(gdawg), os.path.getsize(gaddag_out) / 1e6, phases["gaddag"],
+            )
+    entries = _dic_entries(os.path.join(dict_dir, STRICT_BASE + ".dic"))
+    _save_meta(dict_dir, {
+        "builder": _builder_digests(),
+        "aff": file_digest(os.path.join(dict_dir, STRICT_BASE + ".aff")),
+        "dic_base_entries": len(entries),
+        "dic_base": _entries_digest(entries),
+        "extra_entries": [],
+        "blocked": sorted(_load_blocked()),
+        "blocked_forms": sorted(blocked_forms),
+    })
+    BuildCache(dict_dir).record(dawg_artifact(dict_dir))
+    if timings is not None:
+        timings.update(phases)
     return out
 
 
+def _format_phases(phases: Dict[str, float]) -> str:
+    return ", ".join(f"{name} {seconds:.1f}s" for name, seconds in phases.items())
+
+
+# -- incremental updates ------------------------------------------------------
+
+def _dic_entries(path: str) -> List[bytes]:
+    """The entry lines of a .dic file (raw bytes: the encoding is the .aff's)."""
+    with open(path, "rb") as f:
+        lines = f.read().split(b"\n")
+    return [line for line in lines[1:] if line.strip()]
+
+
+def _entries_digest(entries: Sequence[bytes]) -> str:
+    return hashlib.sha256(b"\n".join(entries)).hexdigest()
+
+
+def _builder_sources() -> List[str]:
+    """The code the DAWG is built with (also inputs of :func:`dawg_artifact`)."""
+    return [os.path.abspath(__file__), repo_file("game", "dawg.py"),
+            repo_file("game", "gaddag.py")]
+
+
+def _builder_digests() -> Dict[str, Optional[str]]:
+    return {os.path.basename(path): file_digest(path) for path in _builder_sources()}
+
+
+def _load_meta(dict_dir: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(dict_dir, os.path.basename(DAWG_META_FILE)),
+                  encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_meta(dict_dir: str, meta: Dict) -> None:
+    with open(os.path.join(dict_dir, os.path.basename(DAWG_META_FILE)), "w",
+              encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+
+
+def _expand_entries(dict_dir: str, entries: Sequence[bytes]) -> Set[str]:
+    """Playable forms (vowelless ones included) of strict .dic entry lines."""
+    from spylls.hunspell import readers
+    from spylls.hunspell.readers.file_reader import FileReader
+
+    if not entries:
+        return set()
+    aff, context = readers.read_aff(FileReader(os.path.join(dict_dir, STRICT_BASE + ".aff")))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "entries.dic")
+        with open(path, "wb") as f:
+            f.write(b"%d\n" % len(entries) + b"\n".join(entries) + b"\n")
+        dic = readers.read_dic(FileReader(path, encoding=context.encoding),
+                               aff=aff, context=context)
+    _init_shards(_suffix_groups(aff), frozenset())
+    runs, _ = _unmunch_shard([(word.stem, tuple(word.flags)) for word in dic.words])
+    return {word for run in runs for word in run}
+
+
+def update_dawg(dict_dir: str = DICT_DIR) -> bool:
+    """Patch blocklist and extra-word edits into the built DAWG (and GADDAG).
+
+    Possible when the builder code, the strict .aff and the upstream
+    part of the .dic are unchanged and extra entries were only added
+    (the patch tool appends them after the upstream entries). Only the
+    affected paths change (:meth:`game.dawg.Dawg.update`) and the result
+    is the DAWG a full build would write, but the cost grows with the
+    graphs, not the edit: each is loaded into a :class:`Dawg`, its node
+    register rebuilt and the file saved again. Returns False, changing
+    nothing, when a full :func:`build_dawg` is needed.
+    """
+    meta = _load_meta(dict_dir)
+    out = os.path.join(dict_dir, os.path.basename(DAWG_FILE))
+    gaddag_out = os.path.join(dict_dir, os.path.basename(GADDAG_FILE))
+    if meta is None or not os.path.exists(out):
+        return False
+    if meta.get("builder") != _builder_digests():
+        return False  # the filters or the graph layout may have changed: rebuild
+    if file_digest(os.path.join(dict_dir, STRICT_BASE + ".aff")) != meta["aff"]:
+        return False
+    entries = _dic_entries(os.path.join(dict_dir, STRICT_BASE + ".dic"))
+    base = meta["dic_base_entries"]
+    if len(entries) < base or _entries_digest(entries[:base]) != meta["dic_base"]:
+        return False
+    # Entry lines are kept as latin-1 text: any bytes round-trip
+    extra = [line.decode("latin-1") for line in entries[base:]]
+    old_extra = set(meta["extra_entries"])
+    if not old_extra <= set(extra):
+        return False  # a removed entry's forms may come from others: rebuild
+
+    t0 = time.monotonic()
+    try:
+        dawg = CompactDawg.load(out).to_dawg()
+        gaddag = CompactDawg.load(gaddag_out) if os.path.exists(gaddag_out) else None
+    except (OSError, ValueError):
+        return False
+    blocked = _load_blocked()
+    old_blocked = set(meta["blocked"])
+    blocked_forms = set(meta["blocked_forms"])
+
+    new_forms = _expand_entries(
+        dict_dir, [line.encode("latin-1") for line in extra if line not in old_extra]
+    )
+    new_forms = {w for w in new_forms if not VOWELS.isdisjoint(w)}
+    blocked_forms |= new_forms & blocked
+    add = {w for w in new_forms - blocked if not dawg.is_word(w)}
+    remove = {w for w in blocked - old_blocked if dawg.is_word(w)}
+    blocked_forms |= remove
+    unblocked = old_blocked - blocked
+    add |= unblocked & blocked_forms
+    blocked_forms -= unblocked
+
+    dawg.update(add=add, remove=remove)
+    CompactDawg.from_dawg(dawg).save(out)
+    if gaddag is not None:
+        gdawg = gaddag.to_dawg()
+        gdawg.update(
+            add=[path for word in add for path in gaddag_strings(word)],
+            remove=[path for word in remove for path in gaddag_strings(word)],
+        )
+        CompactDawg.from_dawg(gdawg, GADDAG_ALPHABET).save(gaddag_out)
+    meta.update(extra_entries=extra, blocked=sorted(blocked),
+                blocked_forms=sorted(blocked_forms))
+    _save_meta(dict_dir, meta)
+    BuildCache(dict_dir).record(dawg_artifact(dict_dir))
+    logger.info("DAWG updated in place: %d words added, %d removed, %.3fs",
+                len(add), len(remove), time.monotonic() - t0)
+    return True
+
+
+def dawg_artifact(dict_dir: str = DICT_DIR) -> Artifact:
+    """The DAWG (and the GADDAG once one was built), keyed by the strict dictionary."""
+    outputs = [os.path.join(dict_dir, os.path.basename(DAWG_FILE)),
+               os.path.join(dict_dir, os.path.basename(DAWG_META_FILE))]
+    gaddag_out = os.path.join(dict_dir, os.path.basename(GADDAG_FILE))
+    if os.path.exists(gaddag_out):
+        outputs.append(gaddag_out)
+    return Artifact(
+        "dawg",
+        inputs=[
+            os.path.join(dict_dir, STRICT_BASE + ".dic"),
+            os.path.join(dict_dir, STRICT_BASE + ".aff"),
+            BLOCKED_FILE,
+            *_builder_sources(),
+        ],
+        outputs=outputs,
+    )
+
+
 def dawg_stale(dict_dir: str = DICT_DIR) -> bool:
-    """Whether the DAWG is missing or older than its inputs."""
-    out = os.path.join(dict_dir, "dawg_strict.marshal")
-    if not os.path.exists(out):
-        return True
-    built = os.path.getmtime(out)
-    sources = [
-        os.path.join(dict_dir, STRICT_BASE + ".dic"),
-        os.path.join(dict_dir, STRICT_BASE + ".aff"),
-        BLOCKED_FILE,
-        os.path.abspath(__file__),
-    ]
-    return any(os.path.exists(s) and os.path.getmtime(s) > built for s in sources)
+    """Whether the DAWG (or the GADDAG next to it) must be built for the current inputs.
+
+    False if dict/ holds the build of their contents, or the build cache
+    had one to restore (see tools/build_cache.py).
+    """
+    return not BuildCache(dict_dir).fresh(dawg_artifact(dict_dir))
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
-    build_dawg()
+    parser = argparse.ArgumentParser(description="Build the AI move-generation DAWG.")
+    parser.add_argument("--gaddag", action="store_true",
+                        help="also build the (larger, faster) GADDAG")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="unmunch processes (default: one per CPU)")
+    parser.add_argument("--max-memory", type=int, default=None, metavar="MB",
+                        help="spill sorted runs to disk to keep the word sets under MB")
+    parser.add_argument("--full", action="store_true",
+                        help="rebuild even if the edits can be patched in")
+    args = parser.parse_args()
+    build_dawg(
+        gaddag=True if args.gaddag else None,
+        workers=args.workers,
+        max_memory=args.max_memory * 2**20 if args.max_memory else None,
+        incremental=not args.full,
+    )
@@ -24,6 +24,8 @@ import os
 import shutil
 from typing import Dict, List, Optional
 
+from tools.build_cache import Artifact, BuildCache
+
 logger = logging.getLogger(__name__)
 
 _VOWELS = set("aeiouõäöüAEIOUÕÄÖÜ")
@@ -182,29 +184,40 @@ def patch_dictionary(
         "appended); strict no-compound variant written to %s",
         out_dic, stripped, removed, added, strict_dic,
     )
+    BuildCache(dict_dir).record(patched_dictionary_artifact(dict_dir, extra_words_file))
     return os.path.join(dict_dir, PATCHED_BASE)
 
 
+def patched_dictionary_artifact(
+    dict_dir: str = DICT_DIR, extra_words_file: str = EXTRA_WORDS_FILE
+) -> Artifact:
+    """The patched and strict dictionaries, keyed by the upstream files and the patch data."""
+    return Artifact(
+        "patched_dictionary",
+        inputs=[
+            os.path.join(dict_dir, SOURCE_BASE + ".dic"),
+            os.path.join(dict_dir, SOURCE_BASE + ".aff"),
+            extra_words_file,
+            BLOCKED_STEMS_FILE,
+            os.path.abspath(__file__),
+        ],
+        outputs=[
+            os.path.join(dict_dir, base + ext)
+            for base in (PATCHED_BASE, STRICT_BASE)
+            for ext in (".dic", ".aff")
+        ],
+    )
+
+
 def patched_dictionary_stale(
     dict_dir: str = DICT_DIR, extra_words_file: str = EXTRA_WORDS_FILE
 ) -> bool:
-    """Whether the patched dictionary is missing or older than its inputs."""
-    outputs = [
-        os.path.join(dict_dir, base + ext)
-        for base in (PATCHED_BASE, STRICT_BASE)
-        for ext in (".dic", ".aff")
-    ]
-    if not all(os.path.exists(p) for p in outputs):
-        return True
-    built = min(os.path.getmtime(p) for p in outputs)
-    sources = [
-        os.path.join(dict_dir, SOURCE_BASE + ".dic"),
-        os.path.join(dict_dir, SOURCE_BASE + ".aff"),
-        extra_words_file,
-        BLOCKED_STEMS_FILE,
-        os.path.abspath(__file__),
-    ]
-    return any(os.path.exists(s) and os.path.getmtime(s) > built for s in sources)
+    """Whether the patched dictionary must be built for the current inputs.
+
+    False if dict/ holds the build of their contents, or the build cache
+    had one to restore (see tools/build_cache.py).
+    """
+    return not BuildCache(dict_dir).fresh(patched_dictionary_artifact(dict_dir, extra_words_file))
 
 
 if __name__ == "__main__":
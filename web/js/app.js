@@ -3,7 +3,7 @@
  * Handles view routing (lobby <-> game) and orchestrates all modules.
  */
 
-import ScrabbleWebSocket from "./websocket.js?v=20260705";
+import ScrabbleWebSocket from "./websocket.js?v=20261019";
 import { initBoard, updateBoard, showBlankPicker } from "./board.js?v=20260705";
 import {
   initRack,
@@ -1,5 +1,11 @@
 /**
  * WebSocket client for Estonian Scrabble multiplayer.
+ *
+ * Game state arrives as a full "game_state" snapshot (on join, reconnect
+ * or resync) followed by "game_state_delta" messages, each diffed against
+ * the snapshot of its base_version. The client applies the deltas and hands
+ * handlers full "game_state" objects; a delta for another version than the
+ * one held is dropped and a full snapshot requested.
  */
 
 /** @typedef {(msg: object) => void} MessageHandler */
@@ -13,6 +19,10 @@ class ScrabbleWebSocket {
   #url;
   /** @type {boolean} */
   #intentionalClose = false;
+  /** @type {object|null} Last game state, the base of the next delta */
+  #state = null;
+  /** @type {boolean} Whether a resync was sent and its snapshot has not arrived */
+  #resyncPending = false;
 
   /**
    * @param {string} [url] - WebSocket URL. Defaults to ws(s)://currentHost/ws.
@@ -46,6 +56,8 @@ class ScrabbleWebSocket {
   connect() {
     return new Promise((resolve, reject) => {
       this.#intentionalClose = false;
+      this.#state = null;
+      this.#resyncPending = false;
       this.#ws = new WebSocket(this.#url);
 
       this.#ws.onopen = () => resolve();
@@ -62,12 +74,21 @@ class ScrabbleWebSocket {
       };
 
       this.#ws.onmessage = (event) => {
+        let data;
         try {
-          const data = JSON.parse(event.data);
-          this.#dispatch(data);
+          data = JSON.parse(event.data);
         } catch (e) {
           console.error("Failed to parse message:", e);
+          return;
         }
+        if (data.type === "game_state") {
+          this.#state = data;
+          this.#resyncPending = false;
+        } else if (data.type === "game_state_delta") {
+          data = this.#applyDelta(data);
+          if (!data) return;
+        }
+        this.#dispatch(data);
       };
     });
   }
@@ -90,6 +111,45 @@ class ScrabbleWebSocket {
     }
   }
 
+  /**
+   * The full game state after a delta, or null if it does not apply to the
+   * state held (a full snapshot is requested instead, once: deltas queued
+   * behind the request are dropped until the snapshot arrives).
+   * @param {object} delta
+   * @returns {object|null}
+   */
+  #applyDelta(delta) {
+    const base = this.#state;
+    if (!base || base.state_version !== delta.base_version) {
+      this.#state = null;
+      if (!this.#resyncPending) {
+        this.#resyncPending = true;
+        this.send({ action: "resync" });
+      }
+      return null;
+    }
+    const state = { ...base, ...(delta.changes || {}) };
+    if (delta.cells) {
+      state.board = base.board.map((row) => row.slice());
+      for (const [row, col, letter] of delta.cells) {
+        state.board[row][col] = letter;
+      }
+    }
+    if (delta.scores) {
+      state.players = state.players.map((player) => ({ ...player }));
+      for (const [index, score] of delta.scores) {
+        state.players[index].score = score;
+      }
+    }
+    if (delta.move_history_append) {
+      state.move_history = state.move_history.concat(delta.move_history_append);
+    }
+    state.type = "game_state";
+    state.state_version = delta.version;
+    this.#state = state;
+    return state;
+  }
+
   /** @param {object} msg */
   #dispatch(msg) {
     for (const handler of this.#handlers) {
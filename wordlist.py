@@ -1,10 +1,14 @@
 import logging
 import os
+import sys
+import threading
 import urllib.request
-from typing import Set
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set
 
 from tools.patch_dictionary import (
     DICT_DIR as _DICT_DIR,
+    PATCHED_BASE,
     patch_dictionary,
     patched_dictionary_stale,
 )
@@ -21,6 +25,137 @@ _BLOCKED_FILE = os.path.join(
 
 _VOWELS = set("aeiouõäöü")
 
+# Words per validation cache (each dictionary has one); ~150 bytes per entry
+DEFAULT_CACHE_SIZE = 20000
+
+# Process-wide shared WordList (see shared_wordlist)
+_shared: Optional["WordList"] = None
+_shared_lock = threading.Lock()
+
+
+def shared_wordlist() -> "WordList":
+    """Return the process-wide WordList, loading it on first use.
+
+    Loading parses the full Hunspell dictionary (seconds) and the AI's
+    strict dictionary and DAWG hang off the same instance, so every
+    GameState, WordValidator and AI search must share one copy: a server
+    with 200 rooms holds one dictionary, and starting a game costs a
+    lookup instead of a reload. Thread-safe — AI searches resolve it
+    from executor threads.
+    """
+    global _shared
+    wordlist = _shared
+    if wordlist is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = WordList()
+            wordlist = _shared
+    return wordlist
+
+
+def loaded_wordlist() -> Optional["WordList"]:
+    """The process-wide WordList if it has been loaded, without loading it."""
+    return _shared
+
+
+def reload_shared_wordlist() -> "WordList":
+    """Rebuild the dictionaries from dict/ and data/ and swap them into the shared WordList.
+
+    Slow (seconds: patching, the DAWG update, parsing); run it off the
+    event loop. The new dictionaries, strict dictionary and DAWG are all
+    loaded before the swap, so lookups never wait for them, and the
+    shared instance keeps its identity: every GameState holds it. Raises
+    RuntimeError, keeping the current dictionaries, if the new ones fail
+    to load where the current ones did.
+    """
+    with _shared_lock:  # waits for a first load in progress
+        wordlist = _shared
+    if wordlist is None:
+        return shared_wordlist()  # nothing loaded yet: nothing to swap
+    fresh = WordList()
+    strict = fresh.strict
+    strict.preload()  # mapped now rather than on the first AI turn after the swap
+    current = wordlist._strict
+    if fresh._dict is None and wordlist._dict is not None:
+        raise RuntimeError("Reloaded dictionary failed to load")
+    if strict.dawg is None and current is not None and current._dawg is not None:
+        raise RuntimeError("Reloaded DAWG failed to load")
+    wordlist.swap_in(fresh)
+    return wordlist
+
+
+class ValidationCache:
+    """Bounded LRU of lowercased word -> validity, safe to share between threads.
+
+    A spylls lookup runs the full affix and compound analysis in pure
+    Python, and the same words are checked over and over: a player
+    dragging tiles re-validates the same few words, and every room asks
+    about the same common ones. One cache per dictionary sits in front of
+    its lookups, shared by every room. :meth:`clear` must be called
+    whenever the dictionary or the blocklist changes; a lookup that was
+    in flight across a clear does not store its (stale) answer.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bool]" = OrderedDict()
+        self._key_bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def lookup(self, word: str, check: Callable[[str], bool]) -> bool:
+        """The cached validity of *word*, computed with *check* on a miss."""
+        with self._lock:
+            valid = self._entries.get(word)
+            if valid is not None:
+                self._entries.move_to_end(word)
+                self.hits += 1
+                return valid
+            self.misses += 1
+            generation = self._generation
+        # The slow part runs unlocked; concurrent misses may both compute
+        valid = check(word)
+        with self._lock:
+            if generation == self._generation and word not in self._entries:
+                self._entries[word] = valid
+                self._key_bytes += sys.getsizeof(word)
+                while len(self._entries) > self.maxsize:
+                    old, _ = self._entries.popitem(last=False)
+                    self._key_bytes -= sys.getsizeof(old)
+                    self.evictions += 1
+        return valid
+
+    def clear(self) -> None:
+        """Forget every answer (the dictionary or blocklist changed)."""
+        with self._lock:
+            self._entries.clear()
+            self._key_bytes = 0
+            self._generation += 1
+            self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, counters and approximate memory footprint, for ``/stats``."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                # The table plus the key strings (the values are the bool singletons)
+                "memory_bytes": sys.getsizeof(self._entries) + self._key_bytes,
+            }
+
 
 class WordList:
     """Estonian word validator using Hunspell dictionary with full morphological support.
@@ -39,8 +174,11 @@ class WordList:
         self._setup_logging()
         self._ensure_dictionary()
         self._load_dictionary()
+        self._acceptor = self._load_acceptor()
         self._blocked = self._load_blocked_words()
+        self.cache = ValidationCache()
         self._strict = None
+        self._strict_lock = threading.Lock()
 
     def _setup_logging(self):
         """Set up logging configuration."""
@@ -75,23 +213,60 @@ class WordList:
         except Exception as e:
             # The AI falls back to brute-force generation without a DAWG
             self.logger.error(f"Failed to build DAWG: {e}")
+        try:
+            from tools.build_acceptor import (
+                UnsupportedDictionary,
+                acceptor_stale,
+                build_acceptor,
+            )
+
+            if acceptor_stale():
+                self.logger.info("Compiling dictionary acceptor (cached)...")
+                build_acceptor()
+        except UnsupportedDictionary as e:
+            self.logger.info(f"Dictionary not compiled, validating through Hunspell: {e}")
+        except Exception as e:
+            # Words are validated through spylls without the acceptor
+            self.logger.error(f"Failed to compile dictionary acceptor: {e}")
 
     def _load_dictionary(self):
         """Load the patched Hunspell dictionary via spylls."""
         try:
             from spylls.hunspell import Dictionary
 
-            dict_base = os.path.join(_DICT_DIR, "et_EE_scrabble")
+            dict_base = os.path.join(_DICT_DIR, PATCHED_BASE)
             if not os.path.exists(dict_base + ".dic"):
                 # Patching failed — fall back to the unpatched dictionary
                 dict_base = os.path.join(_DICT_DIR, "et_EE")
                 self.logger.warning("Patched dictionary missing, using upstream et_EE")
             self._dict = Dictionary.from_files(dict_base)
+            self._dict_base = dict_base
             self.logger.info(f"Loaded Estonian Hunspell dictionary ({os.path.basename(dict_base)})")
         except Exception as e:
             self.logger.error(f"Failed to load Hunspell dictionary: {e}")
             self._dict = None
 
+    def _load_acceptor(self):
+        """The compiled permissive dictionary (tools/build_acceptor.py), or None.
+
+        Only used over the patched dictionary it was compiled from, and
+        only while it is up to date with it.
+        """
+        if self._dict is None or os.path.basename(self._dict_base) != PATCHED_BASE:
+            return None
+        try:
+            from tools.build_acceptor import acceptor_stale, load_acceptor
+
+            if acceptor_stale():
+                return None
+            acceptor = load_acceptor()
+            if acceptor is not None:
+                self.logger.info(f"Loaded dictionary acceptor ({len(acceptor.dawg)} nodes)")
+            return acceptor
+        except Exception as e:
+            self.logger.error(f"Failed to load dictionary acceptor: {e}")
+            return None
+
     def _load_blocked_words(self) -> Set[str]:
         """Load the Scrabble blocklist (words Hunspell wrongly accepts)."""
         blocked: Set[str] = set()
@@ -105,17 +280,51 @@ class WordList:
             self.logger.warning(f"Could not read blocklist {_BLOCKED_FILE}: {e}")
         return blocked
 
+    def swap_in(self, other: "WordList") -> None:
+        """Take over *other*'s dictionaries and drop the cached answers.
+
+        The strict dictionary (with its DAWG) is replaced by reference:
+        an AI search already running keeps the one it started with.
+        """
+        with self._strict_lock:
+            self._dict = other._dict
+            self._dict_base = getattr(other, "_dict_base", None)
+            self._acceptor = other._acceptor
+            self._blocked = other._blocked
+            self._strict = other._strict
+        self.cache.clear()
+        self.logger.info("Swapped in reloaded dictionaries")
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Validation cache stats per dictionary (strict only once loaded)."""
+        stats = {"permissive": self.cache.stats()}
+        if self._strict is not None:
+            stats["strict"] = self._strict.cache.stats()
+        return stats
+
     def is_valid_word(self, word: str) -> bool:
-        """Check if a word is valid Estonian using Hunspell morphological rules."""
+        """Check if a word is valid Estonian using Hunspell morphological rules.
+
+        Answered from the compiled acceptor (tools/build_acceptor.py) when
+        the dictionary has one, through spylls otherwise.
+        """
         if self._dict is None:
             return False
-        word = word.lower()
+        return self.cache.lookup(word.lower(), self._check_word)
+
+    def _check_word(self, word: str) -> bool:
+        """Uncached :meth:`is_valid_word` of a lowercased word."""
         if word in self._blocked:
             return False
         # No real Estonian word is vowelless; Hunspell would accept
         # abbreviations like 'tk' or 'lk' here.
         if not set(word) & _VOWELS:
             return False
+        acceptor = self._acceptor
+        if acceptor is not None and acceptor.covers(word):
+            # The same answer as the lookup below, from one automaton
+            # instead of a spylls affix and compound analysis
+            return acceptor.accepts(word)
         return self._dict.lookup(word)
 
     @property
@@ -129,7 +338,9 @@ class WordList:
         positives are fatal.
         """
         if self._strict is None:
-            self._strict = StrictWordList(self._blocked, self.logger)
+            with self._strict_lock:
+                if self._strict is None:
+                    self._strict = StrictWordList(self._blocked, self.logger)
         return self._strict
 
 
@@ -144,8 +355,12 @@ class StrictWordList:
     def __init__(self, blocked: Set[str], logger: logging.Logger):
         self._blocked = blocked
         self.logger = logger
+        self.cache = ValidationCache()
         self._dawg = None
         self._dawg_loaded = False
+        self._gaddag = None
+        self._gaddag_loaded = False
+        self._dawg_lock = threading.Lock()
         try:
             from spylls.hunspell import Dictionary
 
@@ -161,29 +376,91 @@ class StrictWordList:
     def dawg(self):
         """DAWG over all strict-dictionary forms, for AI move generation.
 
-        Lazy-loaded (~1 MB marshal). None if unavailable — the AI then
-        falls back to brute-force generation.
+        Lazy-loaded by mmapping the ~1 MB compact binary file — no
+        unmarshalling, and worker processes share the page-cache copy.
+        None if unavailable — the AI then falls back to brute-force
+        generation.
         """
         if not self._dawg_loaded:
-            self._dawg_loaded = True
-            try:
-                from game.dawg import Dawg
-                from tools.build_dawg import DAWG_FILE
-
-                self._dawg = Dawg.load(DAWG_FILE)
-                self.logger.info(f"Loaded move-generation DAWG ({len(self._dawg)} nodes)")
-            except Exception as e:
-                self.logger.error(f"Failed to load DAWG: {e}")
-                self._dawg = None
+            with self._dawg_lock:
+                if not self._dawg_loaded:
+                    self._dawg = self._load_dawg()
+                    self._dawg_loaded = True
         return self._dawg
 
+    def _load_dawg(self):
+        """Load the DAWG artifact, or None if it is unavailable."""
+        try:
+            from game.dawg import CompactDawg
+            from tools.build_dawg import DAWG_FILE
+
+            dawg = CompactDawg.load(DAWG_FILE)
+            self.logger.info(f"Loaded move-generation DAWG ({len(dawg)} nodes)")
+            return dawg
+        except Exception as e:
+            self.logger.error(f"Failed to load DAWG: {e}")
+            return None
+
+    @property
+    def gaddag(self):
+        """Optional GADDAG over the same forms (``build_dawg --gaddag``).
+
+        The AI prefers it over the DAWG when it has been built; None
+        otherwise.
+        """
+        if not self._gaddag_loaded:
+            with self._dawg_lock:
+                if not self._gaddag_loaded:
+                    self._gaddag = self._load_gaddag()
+                    self._gaddag_loaded = True
+        return self._gaddag
+
+    def preload(self) -> None:
+        """Load the DAWG and the GADDAG now instead of on first use."""
+        with self._dawg_lock:
+            if not self._dawg_loaded:
+                self._dawg = self._load_dawg()
+                self._dawg_loaded = True
+            if not self._gaddag_loaded:
+                self._gaddag = self._load_gaddag()
+                self._gaddag_loaded = True
+
+    def _load_gaddag(self):
+        """Load the GADDAG artifact, or None if it was not built."""
+        try:
+            from game.dawg import CompactDawg
+            from tools.build_dawg import GADDAG_FILE
+
+            if not os.path.exists(GADDAG_FILE):
+                return None
+            gaddag = CompactDawg.load(GADDAG_FILE)
+            self.logger.info(f"Loaded move-generation GADDAG ({len(gaddag)} nodes)")
+            return gaddag
+        except Exception as e:
+            self.logger.error(f"Failed to load GADDAG: {e}")
+            return None
+
     def is_valid_word(self, word: str) -> bool:
-        """Check a word against the strict (no-compound) dictionary."""
-        if self._dict is None:
+        """Check a word against the strict (no-compound) dictionary.
+
+        Answered from the DAWG, which holds every strict form, when it is
+        available — a walk of at most 15 edges instead of a spylls affix
+        analysis. Hunspell is the fallback when the DAWG failed to load.
+        """
+        if self._dict is None and self.dawg is None:
             return False
-        word = word.lower()
+        return self.cache.lookup(word.lower(), self._check_word)
+
+    def _check_word(self, word: str) -> bool:
+        """Uncached :meth:`is_valid_word` of a lowercased word."""
         if word in self._blocked:
             return False
         if not set(word) & _VOWELS:
             return False
+        dawg = self.dawg
+        if dawg is not None:
+            # Same forms as the lookup below: the DAWG is the unmunched
+            # strict dictionary (tools/build_dawg.py), minus unplayable
+            # words no rack can spell
+            return dawg.is_word(word)
         return self._dict.lookup(word)